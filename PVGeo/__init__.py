@@ -1,13 +1,13 @@
 # flake8: noqa: F401
-try:
-    # Safely test if VTK is available. This is needed for Windows installation
-    def tryVTK():
-        import vtk
+def _has_vtk():
+    # Safely test if VTK is available without importing it. This is needed for
+    # Windows installation and keeps ``import PVGeo`` fast
+    from importlib.util import find_spec
 
-        return
+    return find_spec('vtk') is not None
 
-    tryVTK()  # Safe import in this manner so docs soes not iterate over VTK
-except ImportError:
+
+if not _has_vtk():
     import sys
     import warnings
 
@@ -20,28 +20,65 @@ except ImportError:
         'VTK Python package is unavailable! '
         'PVGeo is running in safe mode for installation.'
     )
-else:
-    # Import Base Classes
-    # TODO: from . import tunneling
-    # Import Suites
-    from . import filters, grids, gslib, model_build, readers, ubc
-    from .base import *
-
-    try:
-        __import__('omf')
-        __import__('omfvista')
-    except ImportError:
-        pass
-    else:
-        from . import gmggroup
-
-    # Import Helpers
-    from . import _helpers
-    from .interface import *
-# VTK-dependent imports complete
 
+from ._lazy import attach as _attach
 from .cmaps import *
 
+# The suites, base classes, and interface are imported on first access so that
+# ``import PVGeo`` does not pull in VTK, PyVista, pandas, discretize, etc.
+# NOTE: keep these names in sync with the ``__all__`` of ``base`` and ``interface``
+__getattr__, __dir__ = _attach(
+    __name__,
+    submodules=[
+        '_helpers',
+        'base',
+        'filters',
+        'gmggroup',
+        'grids',
+        'gslib',
+        'interface',
+        'memory',
+        'model_build',
+        'readers',
+        'ubc',
+    ],
+    attributes={
+        # Base Classes
+        'AlgorithmBase': 'base',
+        'ReaderBaseBase': 'base',
+        'ReaderBase': 'base',
+        'FilterBase': 'base',
+        'FilterPreserveTypeBase': 'base',
+        'TwoFileReaderBase': 'base',
+        'WriterBase': 'base',
+        'InterfacedBaseReader': 'base',
+        # Interface
+        'get_vtk_type': 'interface',
+        'convert_string_array': 'interface',
+        'convert_array': 'interface',
+        'data_frame_to_table': 'interface',
+        'table_to_data_frame': 'interface',
+        'place_array_in_table': 'interface',
+        'get_dtypes': 'interface',
+        'points_to_poly_data': 'interface',
+        'add_arrays_from_data_frame': 'interface',
+        'convert_cell_conn': 'interface',
+        'build_cell_array': 'interface',
+        'get_array': 'interface',
+        'get_data_dict': 'interface',
+        'DataArrayViews': 'interface',
+    },
+    # Requires ``omf`` and ``omfvista``
+    optional=['gmggroup'],
+)
+
+# Names exported by ``from PVGeo import *`` (this loads the suites)
+__all__ = [
+    name
+    for name in __dir__()
+    if not name.startswith('_') and name not in ('cmaps', 'gmggroup')
+]
+
 # Project MetaData
 __author__ = 'Bane Sullivan'
 __license__ = 'BSD-3-Clause'
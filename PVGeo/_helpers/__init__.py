@@ -1,7 +1,13 @@
 # flake8: noqa: F401
 from .arrays import *
+from .caching import *
+from .composite import *
 from .errors import *
+from .executors import *
+from .extents import *
+from .profiling import *
 from .readers import *
+from .serialization import *
 from .timeseries import *
 from .xml import *
 
@@ -10,10 +10,11 @@ __all__ = [
     'get_all_array_names',
 ]
 
-import vtk
-from vtk.numpy_interface import dataset_adapter as dsa
 
 from . import errors as _helpers
+from .. import _vtk
+from .._vtk import dsa
+from .composite import get_leaf_blocks
 
 
 def get_selected_array_name(algorithm, idx):
@@ -27,7 +28,7 @@ def get_selected_array_name(algorithm, idx):
         str : the name of the input array for the given index
     """
     info = algorithm.GetInputArrayInformation(idx)
-    return info.Get(vtk.vtkDataObject.FIELD_NAME())
+    return info.Get(_vtk.vtkDataObject.FIELD_NAME())
 
 
 def get_selected_array_field(algorithm, idx):
@@ -41,7 +42,7 @@ def get_selected_array_field(algorithm, idx):
         int : the field type of the input array for the given index
     """
     info = algorithm.GetInputArrayInformation(idx)
-    return info.Get(vtk.vtkDataObject.FIELD_ASSOCIATION())
+    return info.Get(_vtk.vtkDataObject.FIELD_ASSOCIATION())
 
 
 def get_field_id_by_name(field):
@@ -124,7 +125,7 @@ def get_numpy_array(wpdi, field, name):
     """
     if isinstance(field, str):
         field = get_field_id_by_name(field)
-    if not isinstance(wpdi, vtk.numpy_interface.dataset_adapter.DataObject):
+    if not isinstance(wpdi, dsa.DataObject):
         wpdi = dsa.WrapDataObject(wpdi)
     # Point Data
     if field == 0:
@@ -287,6 +288,15 @@ def get_array(pdi, field, name):
 
 
 def search_for_array(pdi, name):
+    if isinstance(pdi, _vtk.vtkCompositeDataSet):
+        # Search the blocks of a composite dataset
+        for block in get_leaf_blocks(pdi):
+            try:
+                return search_for_array(block, name)
+            except _helpers.PVGeoError:
+                continue
+        raise _helpers.PVGeoError('Array `{}` not found in input data.'.format(name))
+
     def _search_field(field):
         data = _get_data(pdi, field)
         for i in range(data.GetNumberOfArrays()):
@@ -311,7 +321,7 @@ def search_for_array(pdi, name):
 def get_all_array_names(dataset, field):
     if isinstance(field, str):
         field = get_field_id_by_name(field)
-    if not isinstance(dataset, vtk.numpy_interface.dataset_adapter.DataObject):
+    if not isinstance(dataset, dsa.DataObject):
         wpdi = dsa.WrapDataObject(dataset)
     else:
         wpdi = dataset
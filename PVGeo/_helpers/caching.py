@@ -0,0 +1,636 @@
+__all__ = [
+    'LRUCache',
+    'ParseCache',
+    'estimate_nbytes',
+    'file_fingerprint',
+    'parameter_fingerprint',
+    'get_parse_cache',
+    'cached_parse',
+    'SidecarCache',
+    'get_sidecar_cache',
+]
+
+__displayname__ = 'Caching'
+
+from collections import OrderedDict
+import glob
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+
+import numpy as np
+import pandas as pd
+
+from .. import _vtk, memory
+
+
+class LRUCache(object):
+    """A small, thread safe, least recently used cache.
+
+    Args:
+        maxsize (int): the maximum number of items to hold. Use ``None`` for an
+            unbounded cache.
+    """
+
+    def __init__(self, maxsize=None):
+        self.__maxsize = maxsize
+        self.__items = OrderedDict()
+        self.__lock = threading.RLock()
+
+    def __contains__(self, key):
+        with self.__lock:
+            return key in self.__items
+
+    def __len__(self):
+        with self.__lock:
+            return len(self.__items)
+
+    def get(self, key, default=None):
+        """Get an item and mark it as the most recently used"""
+        with self.__lock:
+            if key not in self.__items:
+                return default
+            self.__items.move_to_end(key)
+            return self.__items[key]
+
+    def put(self, key, value):
+        """Add an item, evicting the least recently used items if full"""
+        with self.__lock:
+            self.__items[key] = value
+            self.__items.move_to_end(key)
+            self._evict()
+
+    def pop(self, key, default=None):
+        """Remove an item and return it"""
+        with self.__lock:
+            return self.__items.pop(key, default)
+
+    def keys(self):
+        """Get the keys ordered from least to most recently used"""
+        with self.__lock:
+            return list(self.__items.keys())
+
+    def values(self):
+        """Get the items ordered from least to most recently used"""
+        with self.__lock:
+            return list(self.__items.values())
+
+    def clear(self):
+        """Remove all items"""
+        with self.__lock:
+            self.__items.clear()
+
+    def _evict(self):
+        while self.__maxsize is not None and len(self.__items) > self.__maxsize:
+            self.__items.popitem(last=False)
+
+    def set_max_size(self, maxsize):
+        """Set the maximum number of items to hold"""
+        with self.__lock:
+            self.__maxsize = maxsize
+            self._evict()
+
+    def get_max_size(self):
+        """Get the maximum number of items to hold"""
+        return self.__maxsize
+
+
+###############################################################################
+
+
+def _nbytes(obj):
+    """Estimate the memory held by a parsed result"""
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if hasattr(obj, 'memory_usage'):
+        # pandas DataFrame
+        return int(obj.memory_usage(index=True, deep=True).sum())
+    if isinstance(obj, (list, tuple)):
+        return sum(_nbytes(o) for o in obj)
+    if isinstance(obj, dict):
+        return sum(_nbytes(o) for o in obj.values())
+    return sys.getsizeof(obj)
+
+
+def estimate_nbytes(obj, _seen=None):
+    """Estimate the memory held by an object: NumPy arrays, pandas
+    DataFrames, VTK data objects, and containers or plain objects holding
+    them. Objects referenced more than once are only counted once.
+    """
+    if _seen is None:
+        _seen = set()
+    if obj is None or id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+    if isinstance(obj, np.ndarray):
+        if obj.base is not None and isinstance(obj.base, np.ndarray):
+            # A view: count the array that owns the memory
+            return estimate_nbytes(obj.base, _seen)
+        return obj.nbytes
+    if isinstance(obj, _vtk.vtkDataObject):
+        return obj.GetActualMemorySize() * 1024
+    if hasattr(obj, 'memory_usage'):
+        # pandas DataFrame (shallow to stay fast for text columns)
+        return int(obj.memory_usage(index=True, deep=False).sum())
+    if isinstance(obj, (list, tuple, set)):
+        return sum(estimate_nbytes(o, _seen) for o in obj)
+    if isinstance(obj, dict):
+        return sum(estimate_nbytes(o, _seen) for o in obj.values())
+    if hasattr(obj, '__dict__') and not callable(obj):
+        # e.g. a ``GridInfo`` holding arrays
+        return sum(
+            estimate_nbytes(o, _seen)
+            for o in vars(obj).values()
+            if isinstance(o, (np.ndarray, _vtk.vtkDataObject, list, tuple, dict))
+        )
+    return sys.getsizeof(obj)
+
+
+def _copy(obj):
+    """Copy a parsed result so that callers cannot alter the cached one"""
+    if isinstance(obj, np.ndarray) or hasattr(obj, 'memory_usage'):
+        return obj.copy()
+    if isinstance(obj, list):
+        return [_copy(o) for o in obj]
+    if isinstance(obj, tuple):
+        return tuple(_copy(o) for o in obj)
+    if isinstance(obj, dict):
+        return {k: _copy(o) for k, o in obj.items()}
+    return obj
+
+
+def file_fingerprint(filename, checksum=False):
+    """Get a tuple that identifies the current contents of a file: its absolute
+    path, size, and modification time. Returns ``None`` if the file cannot be
+    found.
+
+    Args:
+        filename (str): the file
+        checksum (bool): also hash the contents of the file. This catches
+            changes that keep the size and modification time of the file.
+    """
+    try:
+        st = os.stat(filename)
+    except (IOError, OSError, TypeError, ValueError):
+        return None
+    fingerprint = (os.path.abspath(filename), st.st_size, st.st_mtime_ns)
+    if checksum:
+        digest = hashlib.blake2b()
+        try:
+            with open(filename, 'rb') as f:
+                for chunk in iter(lambda: f.read(1024**2), b''):
+                    digest.update(chunk)
+        except (IOError, OSError):
+            return None
+        fingerprint += (digest.hexdigest(),)
+    return fingerprint
+
+
+# Arrays larger than this are identified by the object rather than hashed
+_HASH_BYTES = 1024**2
+
+
+class _Identity(object):
+    """Equal only to a wrapper of the very same object. The object is held so
+    that its ``id`` cannot be reused while this exists."""
+
+    __slots__ = ('obj',)
+
+    def __init__(self, obj):
+        self.obj = obj
+
+    def __eq__(self, other):
+        return isinstance(other, _Identity) and other.obj is self.obj
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return id(self.obj)
+
+
+def _freeze(value):
+    """Make a hashable copy of a parameter value. VTK objects are identified
+    by their address and modification time. Raises ``TypeError`` for values
+    that are not plain Python/NumPy data or VTK objects."""
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.dtype):
+        return ('dtype', value.str)
+    if isinstance(value, np.ndarray):
+        if value.nbytes > _HASH_BYTES:
+            return ('ndarray', value.shape, value.dtype.str, _Identity(value))
+        digest = hashlib.blake2b(np.ascontiguousarray(value).view(np.uint8)).hexdigest()
+        return ('ndarray', value.shape, value.dtype.str, digest)
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__,) + tuple(_freeze(v) for v in value)
+    if isinstance(value, dict):
+        return ('dict',) + tuple(sorted((repr(k), _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (set, frozenset)):
+        return ('set', frozenset(_freeze(v) for v in value))
+    if isinstance(value, _vtk.vtkObject):
+        return ('vtkObject', value.__this__, value.GetMTime())
+    if callable(value) and hasattr(value, '__qualname__'):
+        return ('callable', getattr(value, '__module__', ''), value.__qualname__)
+    raise TypeError('Cannot fingerprint %s' % type(value))
+
+
+def parameter_fingerprint(obj, exclude=(), ignore=()):
+    """Get a hashable fingerprint of the parameters of an object: every
+    attribute holding plain Python or NumPy data (numbers, strings, arrays,
+    lists, sets, functions, ...) or VTK objects. Small arrays are hashed while
+    large arrays are identified by the array object so replace (rather than
+    modify in place) a large array parameter.
+
+    Args:
+        obj: the object (typically an algorithm)
+        exclude (tuple(str)): prefixes of attribute names to ignore
+        ignore (set(str)): attribute names to ignore
+
+    Raises:
+        TypeError: if an attribute holds any other object (its changes could
+            not be seen in the fingerprint)
+    """
+    items = []
+    for name, value in sorted(vars(obj).items()):
+        if name.startswith(exclude) or name in ignore:
+            continue
+        try:
+            items.append((name, _freeze(value)))
+        except TypeError as err:
+            raise TypeError('Attribute ``%s``: %s' % (name, err))
+    return tuple(items)
+
+
+class ParseCache(object):
+    """A thread safe cache of parsed file contents (NumPy arrays and pandas
+    DataFrames) that evicts the least recently used results when the total
+    size of the cached results exceeds a byte budget. Results are copied on
+    the way in and out so that no caller can modify a cached result.
+
+    The process wide cache has a modest budget of 64 MiB by default as it
+    holds a copy of every cached result (it is also released like any other
+    cache when the ``PVGeo.memory`` budget is exceeded). Change its budget
+    with ``set_max_bytes`` or with the ``PVGEO_PARSE_CACHE`` environment
+    variable (in bytes, ``0`` to disable it).
+
+    Args:
+        max_bytes (int): the byte budget. Use ``0`` to disable the cache.
+    """
+
+    def __init__(self, max_bytes=256 * 1024**2):
+        self.__max_bytes = max_bytes
+        self.__items = OrderedDict()
+        self.__nbytes = 0
+        self.__hits = 0
+        self.__misses = 0
+        self.__lock = threading.RLock()
+
+    def __contains__(self, key):
+        with self.__lock:
+            return key in self.__items
+
+    def __len__(self):
+        with self.__lock:
+            return len(self.__items)
+
+    def get(self, key, default=None):
+        """Get a copy of a cached result"""
+        with self.__lock:
+            if key not in self.__items:
+                return default
+            self.__items.move_to_end(key)
+            return _copy(self.__items[key][0])
+
+    def put(self, key, value):
+        """Cache a result if it fits in the byte budget"""
+        nbytes = _nbytes(value)
+        with self.__lock:
+            self.pop(key)
+            if nbytes > self.__max_bytes:
+                return
+            self.__items[key] = (_copy(value), nbytes)
+            self.__nbytes += nbytes
+            self._evict()
+
+    def pop(self, key):
+        """Remove a cached result"""
+        with self.__lock:
+            item = self.__items.pop(key, None)
+            if item is not None:
+                self.__nbytes -= item[1]
+
+    def clear(self):
+        """Remove all cached results and reset the hit/miss counters"""
+        with self.__lock:
+            self.__items.clear()
+            self.__nbytes = 0
+            self.__hits = 0
+            self.__misses = 0
+
+    def _evict(self):
+        while self.__items and self.__nbytes > self.__max_bytes:
+            _, (_, nbytes) = self.__items.popitem(last=False)
+            self.__nbytes -= nbytes
+
+    def parse(self, parser, filename, *params, **kwargs):
+        """Call ``parser(filename)`` unless the result for the current contents
+        of the file is already cached.
+
+        Args:
+            parser (callable): the function that reads the file
+            filename (str): the file to read
+            *params: any parameters that change the parsed result (delimiter,
+                rows to skip, data type, etc.)
+            namespace (str): identifies the parser in the cache key. Defaults
+                to the qualified name of ``parser`` so that every reader using
+                the same parser shares results.
+            sidecar (bool): also look for (and save) the result in the
+                ``SidecarCache`` on disk when it is not in memory
+
+        Return:
+            the parsed result
+        """
+        namespace = _get_namespace(parser, kwargs.get('namespace', None))
+        if kwargs.get('sidecar', False):
+            parse = lambda f: _SIDECAR_CACHE.parse(parser, f, *params, namespace=namespace)
+        else:
+            parse = parser
+        fingerprint = file_fingerprint(filename)
+        if fingerprint is None or self.__max_bytes <= 0:
+            return parse(filename)
+        key = fingerprint + (namespace, params)
+        with self.__lock:
+            if key in self.__items:
+                self.__hits += 1
+                return self.get(key)
+            self.__misses += 1
+        result = parse(filename)
+        self.put(key, result)
+        return result
+
+    def get_hits(self):
+        """Get the number of parses served from the cache"""
+        return self.__hits
+
+    def get_misses(self):
+        """Get the number of parses that read the file"""
+        return self.__misses
+
+    def get_nbytes(self):
+        """Get the size of all the cached results in bytes"""
+        return self.__nbytes
+
+    def get_memory_usage(self):
+        """Get the size of all the cached results in bytes (for the
+        ``PVGeo.memory`` registry)"""
+        return self.__nbytes
+
+    def release_memory(self):
+        """Remove all cached results but keep the hit/miss counters (for the
+        ``PVGeo.memory`` registry)"""
+        with self.__lock:
+            self.__items.clear()
+            self.__nbytes = 0
+        return True
+
+    def set_max_bytes(self, max_bytes):
+        """Set the byte budget. Use ``0`` to disable the cache."""
+        with self.__lock:
+            self.__max_bytes = max_bytes
+            self._evict()
+
+    def get_max_bytes(self):
+        """Get the byte budget"""
+        return self.__max_bytes
+
+
+def _get_namespace(parser, namespace=None):
+    """Get the name that identifies a parser in cache keys"""
+    if namespace is None:
+        namespace = '%s.%s' % (
+            getattr(parser, '__module__', ''),
+            getattr(parser, '__qualname__', repr(parser)),
+        )
+    return namespace
+
+
+def _parse_budget_from_environment():
+    budget = os.environ.get('PVGEO_PARSE_CACHE', '')
+    if not budget:
+        return 64 * 1024**2
+    return int(float(budget))
+
+
+_PARSE_CACHE = ParseCache(max_bytes=_parse_budget_from_environment())
+memory.register(_PARSE_CACHE)
+
+
+def get_parse_cache():
+    """Get the process wide ``ParseCache`` shared by all readers"""
+    return _PARSE_CACHE
+
+
+def cached_parse(parser, filename, *params, **kwargs):
+    """Parse a file through the process wide ``ParseCache``. See
+    ``ParseCache.parse``.
+    """
+    return _PARSE_CACHE.parse(parser, filename, *params, **kwargs)
+
+
+###############################################################################
+
+
+class SidecarCache(object):
+    """A cache of parsed file contents (NumPy arrays and pandas DataFrames) on
+    disk. The columns of a result are saved as ``.npy`` files in a sidecar
+    directory named for the source file, the parser, and its parameters.
+    Later parses of the unchanged file memory map the columns (copy on write)
+    instead of parsing the file again. A sidecar is only used while the size
+    and modification time of the source file match the ones it was saved
+    with.
+
+    The process wide cache is disabled by default. Set the
+    ``PVGEO_SIDECAR_CACHE`` environment variable to ``1`` to save sidecars
+    next to the source files or to a directory to save them there.
+
+    Args:
+        enabled (bool): save and load sidecars
+        directory (str): where to save sidecars. Use ``None`` to save them
+            next to the source files.
+    """
+
+    _suffix = '.pvgeo'
+
+    def __init__(self, enabled=False, directory=None):
+        self.__enabled = enabled
+        self.__directory = directory
+        self.__hits = 0
+        self.__misses = 0
+
+    def _get_path(self, filename, namespace, params):
+        """Get the path of the sidecar of a file for a parser and parameters"""
+        fingerprint = file_fingerprint(filename)
+        if fingerprint is None:
+            return None
+        try:
+            key = repr((fingerprint, namespace, _freeze(params)))
+        except TypeError:
+            return None
+        source = fingerprint[0]
+        directory, prefix = self.__directory, ''
+        if directory is None:
+            # Hidden next to the source file
+            directory, prefix = os.path.dirname(source), '.'
+        # Named for the source and parser, the version of the file, and the
+        # parameters so that the sidecars of older versions can be found
+        name = '%s%s.%s.%s.%s%s' % (
+            prefix,
+            os.path.basename(source),
+            hashlib.blake2b(repr((source, namespace)).encode(), digest_size=4).hexdigest(),
+            hashlib.blake2b(repr(fingerprint).encode(), digest_size=4).hexdigest(),
+            hashlib.blake2b(key.encode(), digest_size=8).hexdigest(),
+            self._suffix,
+        )
+        return os.path.join(directory, name)
+
+    def load(self, path):
+        """Load a sidecar. Returns ``None`` if it cannot be loaded."""
+        try:
+            with open(os.path.join(path, 'meta.json')) as f:
+                meta = json.load(f)
+            columns = []
+            for i, kind in enumerate(meta['kinds']):
+                arr = np.load(os.path.join(path, '%d.npy' % i), mmap_mode='c')
+                if kind == 'O':
+                    arr = arr.astype(object)
+                columns.append(arr)
+        except (IOError, OSError, ValueError, KeyError):
+            return None
+        if meta['type'] == 'ndarray':
+            return columns[0]
+        return pd.DataFrame(dict(zip(meta['names'], columns)), copy=False)
+
+    def save(self, path, result):
+        """Save a result as a sidecar if it can be saved. The sidecars of
+        older versions of the file for the same parser are removed."""
+        if isinstance(result, np.ndarray) and result.dtype.kind in 'biuf':
+            meta = dict(type='ndarray', names=[None])
+            columns = [result]
+        elif isinstance(result, pd.DataFrame) and result.columns.is_unique:
+            meta = dict(type='DataFrame', names=[_freeze(k) for k in result.keys()])
+            columns = [result[k].values for k in result.keys()]
+        else:
+            return False
+        kinds = []
+        for i, arr in enumerate(columns):
+            if arr.dtype.kind == 'O':
+                if pd.api.types.infer_dtype(arr, skipna=False) != 'string':
+                    return False
+                columns[i] = arr.astype(str)
+            elif arr.dtype.kind not in 'biuf':
+                return False
+            kinds.append(arr.dtype.kind)
+        meta['kinds'] = kinds
+        parent = os.path.dirname(path)
+        try:
+            os.makedirs(parent, exist_ok=True)
+            tmp = tempfile.mkdtemp(prefix='.tmp', dir=parent)
+        except (IOError, OSError):
+            return False
+        try:
+            for i, arr in enumerate(columns):
+                np.save(os.path.join(tmp, '%d.npy' % i), arr, allow_pickle=False)
+            with open(os.path.join(tmp, 'meta.json'), 'w') as f:
+                json.dump(meta, f)
+            os.rename(tmp, path)
+        except (IOError, OSError, TypeError, ValueError):
+            shutil.rmtree(tmp, ignore_errors=True)
+            return False
+        # Remove the sidecars of older versions of the file. The sidecars of
+        # this version for other parameters are kept.
+        head, version, _ = path[: -len(self._suffix)].rsplit('.', 2)
+        for old in glob.glob(glob.escape(head) + '.*.*' + self._suffix):
+            parts = old[: -len(self._suffix)].rsplit('.', 2)
+            if parts[0] == head and parts[1] != version:
+                shutil.rmtree(old, ignore_errors=True)
+        return True
+
+    def parse(self, parser, filename, *params, **kwargs):
+        """Call ``parser(filename)`` unless there is a sidecar of the current
+        contents of the file for the parser and parameters. The result is
+        saved as a sidecar.
+
+        Args:
+            parser (callable): the function that reads the file
+            filename (str): the file to read
+            *params: any parameters that change the parsed result
+            namespace (str): identifies the parser. Defaults to the qualified
+                name of ``parser``.
+
+        Return:
+            the parsed result
+        """
+        if not self.__enabled:
+            return parser(filename)
+        namespace = _get_namespace(parser, kwargs.get('namespace', None))
+        path = self._get_path(filename, namespace, params)
+        if path is None:
+            return parser(filename)
+        if os.path.isdir(path):
+            result = self.load(path)
+            if result is not None:
+                self.__hits += 1
+                return result
+        self.__misses += 1
+        result = parser(filename)
+        self.save(path, result)
+        return result
+
+    def set_enabled(self, flag):
+        """Set whether to save and load sidecars"""
+        self.__enabled = flag
+
+    def get_enabled(self):
+        """Get whether sidecars are saved and loaded"""
+        return self.__enabled
+
+    def set_directory(self, directory):
+        """Set where to save sidecars. Use ``None`` to save them next to the
+        source files."""
+        self.__directory = directory
+
+    def get_directory(self):
+        """Get where sidecars are saved"""
+        return self.__directory
+
+    def get_hits(self):
+        """Get the number of parses loaded from sidecars"""
+        return self.__hits
+
+    def get_misses(self):
+        """Get the number of parses that read the file"""
+        return self.__misses
+
+
+def _sidecar_from_environment():
+    setting = os.environ.get('PVGEO_SIDECAR_CACHE', '')
+    if setting.lower() in ('', '0', 'false', 'off'):
+        return SidecarCache()
+    if setting.lower() in ('1', 'true', 'on'):
+        return SidecarCache(enabled=True)
+    return SidecarCache(enabled=True, directory=setting)
+
+
+_SIDECAR_CACHE = _sidecar_from_environment()
+
+
+def get_sidecar_cache():
+    """Get the process wide ``SidecarCache``"""
+    return _SIDECAR_CACHE
@@ -0,0 +1,48 @@
+__all__ = [
+    'get_leaf_blocks',
+    'set_leaf_blocks',
+]
+
+__displayname__ = 'Composite Datasets'
+
+
+def get_leaf_blocks(composite):
+    """Get the non-empty leaf blocks of a composite dataset in the order of a
+    depth first traversal (the order of the flat indices).
+
+    Args:
+        composite (vtkCompositeDataSet): the composite dataset
+
+    Return:
+        list(vtkDataObject) : the leaf blocks
+    """
+    blocks = []
+    it = composite.NewIterator()
+    it.InitTraversal()
+    while not it.IsDoneWithTraversal():
+        blocks.append(it.GetCurrentDataObject())
+        it.GoToNextItem()
+    return blocks
+
+
+def set_leaf_blocks(output, structure, blocks):
+    """Build a composite dataset with the same tree (and block names) as
+    another and set its leaf blocks.
+
+    Args:
+        output (vtkCompositeDataSet): the composite dataset to build
+        structure (vtkCompositeDataSet): the composite dataset to copy the
+            tree from
+        blocks (list(vtkDataObject)): the new leaf blocks in the order given
+            by ``get_leaf_blocks(structure)``
+
+    Return:
+        vtkCompositeDataSet : the output
+    """
+    output.CopyStructure(structure)
+    it = structure.NewIterator()
+    it.InitTraversal()
+    for block in blocks:
+        output.SetDataSet(it, block)
+        it.GoToNextItem()
+    return output
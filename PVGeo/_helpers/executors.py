@@ -0,0 +1,49 @@
+__all__ = [
+    'get_default_workers',
+    'map_ordered',
+]
+
+__displayname__ = 'Executors'
+
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import os
+
+
+def get_default_workers():
+    """Get the default number of worker threads: the number of CPUs"""
+    return os.cpu_count() or 1
+
+
+def map_ordered(func, items, workers=None, processes=False):
+    """Apply a function to every item on a pool of threads. The results are
+    returned in the same order as the items. If any call raises, the remaining
+    calls are cancelled and the first error (in the order of the items) is
+    raised just as it would be from a plain loop.
+
+    Args:
+        func (callable): the function to call on each item
+        items (iterable): the items to process
+        workers (int): the number of threads to use. Defaults to the number of
+            CPUs. A value of ``1`` (or a single item) runs a plain loop in the
+            calling thread.
+        processes (bool): use a pool of processes instead of threads. The
+            function, items, and results must then be picklable.
+
+    Return:
+        list : the results of ``func`` for each item
+    """
+    items = list(items)
+    if workers is None:
+        workers = get_default_workers()
+    workers = min(int(workers), len(items))
+    if workers <= 1:
+        return [func(item) for item in items]
+    if processes:
+        pool = ProcessPoolExecutor(max_workers=workers)
+    else:
+        pool = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = [pool.submit(func, item) for item in items]
+        return [future.result() for future in futures]
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
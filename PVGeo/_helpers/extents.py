@@ -0,0 +1,88 @@
+__all__ = [
+    'set_can_produce_sub_extent',
+    'get_whole_extent',
+    'get_update_extent',
+    'extent_indices',
+    'extent_slices',
+]
+
+__displayname__ = 'Extents'
+
+import numpy as np
+
+from .. import _vtk
+
+
+def set_can_produce_sub_extent(outInfo, port=0):
+    """Let the pipeline know that an algorithm with a structured output only
+    builds the requested ``UPDATE_EXTENT``. This is needed for the pipeline to
+    split the output into pieces by extent. Call this in
+    ``RequestInformation``.
+    """
+    info = outInfo.GetInformationObject(port)
+    info.Set(_vtk.vtkAlgorithm.CAN_PRODUCE_SUB_EXTENT(), 1)
+
+
+def get_whole_extent(outInfo, port=0):
+    """Get the ``WHOLE_EXTENT`` set on an output port"""
+    info = outInfo.GetInformationObject(port)
+    return tuple(info.Get(_vtk.vtkStreamingDemandDrivenPipeline.WHOLE_EXTENT()))
+
+
+def get_update_extent(outInfo, port=0):
+    """Get the extent requested from an output port. This is the
+    ``UPDATE_EXTENT`` clipped to the ``WHOLE_EXTENT`` or the whole extent if
+    no sub extent was requested.
+
+    Return:
+        tuple(int) : the requested extent
+    """
+    info = outInfo.GetInformationObject(port)
+    whole = get_whole_extent(outInfo, port=port)
+    key = _vtk.vtkStreamingDemandDrivenPipeline.UPDATE_EXTENT()
+    if not info.Has(key):
+        return whole
+    ext = list(info.Get(key))
+    for i in range(0, 6, 2):
+        ext[i] = max(ext[i], whole[i])
+        ext[i + 1] = min(ext[i + 1], whole[i + 1])
+    return tuple(ext)
+
+
+def extent_slices(whole_extent, extent, cells=False):
+    """Get the slices into the ``(z, y, x)`` axes of a C ordered array of
+    the point (or cell) values of a structured grid that select a sub extent.
+    """
+    slices = []
+    for i in (4, 2, 0):
+        start = extent[i] - whole_extent[i]
+        stop = extent[i + 1] - whole_extent[i] + 1
+        if cells:
+            # A flat axis of a structured grid still has a single cell
+            stop = max(stop - 1, start + 1)
+        slices.append(slice(start, stop))
+    return tuple(slices)
+
+
+def extent_indices(whole_extent, extent, cells=False):
+    """Get the indices of the point (or cell) values of a structured grid
+    that fall in a sub extent. Values are ordered with the X index varying
+    fastest, as VTK orders them.
+
+    Args:
+        whole_extent (tuple(int)): the extent of the whole grid
+        extent (tuple(int)): the sub extent
+        cells (bool): index the cells rather than the points
+
+    Return:
+        np.ndarray : the indices of the values in the sub extent
+    """
+    dims = [whole_extent[i + 1] - whole_extent[i] + 1 for i in (0, 2, 4)]
+    if cells:
+        dims = [max(n - 1, 1) for n in dims]
+    sk, sj, si = extent_slices(whole_extent, extent, cells=cells)
+    i = np.arange(si.start, si.stop)
+    j = np.arange(sj.start, sj.stop)
+    k = np.arange(sk.start, sk.stop)
+    idx = i[None, None, :] + dims[0] * (j[None, :, None] + dims[1] * k[:, None, None])
+    return idx.ravel()
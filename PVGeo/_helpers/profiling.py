@@ -0,0 +1,260 @@
+"""
+These are helpers for recording the wall time, CPU time, and peak memory of
+the pipeline passes executed by ``PVGeo`` algorithms. Profiling is off by
+default: enable it on a single algorithm with
+``AlgorithmBase.set_profiling(True)`` or for every algorithm in the process
+with ``enable_profiling()``.
+"""
+
+__all__ = [
+    'AlgorithmStats',
+    'ProfileRegistry',
+    'enable_profiling',
+    'disable_profiling',
+    'profiling_enabled',
+    'get_profile_registry',
+]
+
+import json
+import threading
+import time
+import tracemalloc
+
+# The process wide switches. These are checked on every pipeline pass so keep
+# them as simple module attributes.
+_PROFILE_ALL = False
+_REGISTER_ALL = False
+
+# Stack of the active measurements so that nested passes (an algorithm updated
+# inside of another algorithm's ``RequestData``) still report a correct peak
+_FRAMES = threading.local()
+
+
+def _get_frames():
+    frames = getattr(_FRAMES, 'stack', None)
+    if frames is None:
+        frames = _FRAMES.stack = []
+    return frames
+
+
+class _PassStats(object):
+    """Accumulated timings for a single pipeline pass of an algorithm"""
+
+    def __init__(self):
+        self.count = 0
+        self.wall = 0.0
+        self.cpu = 0.0
+        self.peak_memory = 0
+        self.last_wall = 0.0
+        self.last_cpu = 0.0
+        self.last_peak_memory = 0
+
+    def add(self, wall, cpu, peak):
+        self.count += 1
+        self.wall += wall
+        self.cpu += cpu
+        self.peak_memory = max(self.peak_memory, peak)
+        self.last_wall = wall
+        self.last_cpu = cpu
+        self.last_peak_memory = peak
+
+    def to_dict(self):
+        return dict(
+            count=self.count,
+            wall=self.wall,
+            cpu=self.cpu,
+            peak_memory=self.peak_memory,
+            last_wall=self.last_wall,
+            last_cpu=self.last_cpu,
+            last_peak_memory=self.last_peak_memory,
+        )
+
+
+class _Measurement(object):
+    """Context manager used by ``AlgorithmStats.measure``"""
+
+    def __init__(self, stats, name):
+        self.stats = stats
+        self.name = name
+        self.peak = 0
+
+    def __enter__(self):
+        # Only trace allocations while a pass is being measured
+        self.started = not tracemalloc.is_tracing()
+        if self.started:
+            tracemalloc.start()
+        frames = _get_frames()
+        current, peak = tracemalloc.get_traced_memory()
+        if frames:
+            # Save the outer measurement's peak before we reset it
+            frames[-1].peak = max(frames[-1].peak, peak - frames[-1].base)
+        tracemalloc.reset_peak()
+        self.base = current
+        frames.append(self)
+        self.cpu = time.process_time()
+        self.wall = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        wall = time.perf_counter() - self.wall
+        cpu = time.process_time() - self.cpu
+        peak = tracemalloc.get_traced_memory()[1]
+        self.peak = max(self.peak, peak - self.base)
+        frames = _get_frames()
+        frames.pop()
+        if frames:
+            frames[-1].peak = max(frames[-1].peak, peak - frames[-1].base)
+        if self.started:
+            tracemalloc.stop()
+        self.stats._add(self.name, wall, cpu, self.peak)
+        return False
+
+
+class AlgorithmStats(object):
+    """Holds the profiling statistics of a single algorithm instance. Each
+    pipeline pass (``RequestDataObject``, ``RequestInformation``,
+    ``RequestUpdateExtent``, and ``RequestData``) is tracked separately.
+
+    Note:
+        Peak memory is measured with ``tracemalloc`` and only accounts for
+        allocations made through Python's allocators (this includes NumPy
+        and pandas arrays but not memory allocated inside of VTK).
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.__passes = dict()
+        self.__lock = threading.Lock()
+
+    def measure(self, name):
+        """Returns a context manager that records a pass named ``name``"""
+        return _Measurement(self, name)
+
+    def _add(self, name, wall, cpu, peak):
+        with self.__lock:
+            if name not in self.__passes:
+                self.__passes[name] = _PassStats()
+            self.__passes[name].add(wall, cpu, peak)
+
+    def get_pass_names(self):
+        """Get the names of the passes recorded so far"""
+        return list(self.__passes.keys())
+
+    def get_wall_time(self, name=None):
+        """Total wall time in seconds for a given pass or all passes"""
+        return self.__total('wall', name)
+
+    def get_cpu_time(self, name=None):
+        """Total CPU time in seconds for a given pass or all passes"""
+        return self.__total('cpu', name)
+
+    def get_peak_memory(self, name=None):
+        """Peak traced memory in bytes for a given pass or all passes"""
+        if name is not None:
+            return self.__passes[name].peak_memory if name in self.__passes else 0
+        return max([p.peak_memory for p in self.__passes.values()] + [0])
+
+    def get_count(self, name):
+        """The number of times a given pass was executed"""
+        return self.__passes[name].count if name in self.__passes else 0
+
+    def __total(self, attr, name):
+        if name is not None:
+            return getattr(self.__passes[name], attr) if name in self.__passes else 0.0
+        return sum(getattr(p, attr) for p in self.__passes.values())
+
+    def reset(self):
+        """Clear all recorded statistics"""
+        with self.__lock:
+            self.__passes = dict()
+
+    def to_dict(self):
+        """Return the statistics as a dictionary that can be serialized"""
+        return dict(
+            name=self.name,
+            passes={k: v.to_dict() for k, v in self.__passes.items()},
+        )
+
+    def __repr__(self):
+        lines = ['%s:' % self.name]
+        for key, val in self.__passes.items():
+            lines.append(
+                '    %s: count=%d wall=%.6fs cpu=%.6fs peak=%d bytes'
+                % (key, val.count, val.wall, val.cpu, val.peak_memory)
+            )
+        return '\n'.join(lines)
+
+
+class ProfileRegistry(object):
+    """A process wide collection of ``AlgorithmStats`` that can be dumped to
+    JSON. Algorithms only report here if they were registered, either through
+    ``AlgorithmBase.set_profiling(True, register=True)`` or
+    ``enable_profiling(register=True)``.
+    """
+
+    def __init__(self):
+        self.__stats = []
+        self.__lock = threading.Lock()
+
+    def add(self, stats):
+        """Register an ``AlgorithmStats`` object"""
+        with self.__lock:
+            if not any(s is stats for s in self.__stats):
+                self.__stats.append(stats)
+
+    def get_stats(self):
+        """Get the list of registered ``AlgorithmStats``"""
+        return list(self.__stats)
+
+    def clear(self):
+        """Remove all registered statistics"""
+        with self.__lock:
+            self.__stats = []
+
+    def to_dict(self):
+        """Return all registered statistics as a list of dictionaries"""
+        return [s.to_dict() for s in self.__stats]
+
+    def to_json(self, filename=None, **kwargs):
+        """Dump the registered statistics to a JSON string or to a file if
+        ``filename`` is given.
+        """
+        kwargs.setdefault('indent', 2)
+        if filename is not None:
+            with open(filename, 'w') as f:
+                json.dump(self.to_dict(), f, **kwargs)
+            return filename
+        return json.dumps(self.to_dict(), **kwargs)
+
+
+_REGISTRY = ProfileRegistry()
+
+
+def get_profile_registry():
+    """Get the process wide ``ProfileRegistry``"""
+    return _REGISTRY
+
+
+def enable_profiling(register=True):
+    """Profile every ``PVGeo`` algorithm in this process.
+
+    Args:
+        register (bool): report the statistics of every algorithm to the
+            process wide registry
+    """
+    global _PROFILE_ALL, _REGISTER_ALL
+    _PROFILE_ALL = True
+    _REGISTER_ALL = register
+
+
+def disable_profiling():
+    """Turn off process wide profiling. Algorithms that were explicitly set to
+    profile with ``AlgorithmBase.set_profiling`` are not affected."""
+    global _PROFILE_ALL, _REGISTER_ALL
+    _PROFILE_ALL = False
+    _REGISTER_ALL = False
+
+
+def profiling_enabled():
+    """Ask if process wide profiling is on"""
+    return _PROFILE_ALL
@@ -6,9 +6,21 @@ These are helpers specifically for the file readers for private use only.
 __all__ = [
     'clean_data_name',
     'create_modified_callback',
+    'read_lines',
+    'FileLines',
+    'count_lines',
+    'split_file',
+    'open_range',
 ]
 
+import copy
+import io
 import os
+import re
+
+import numpy as np
+
+from .caching import cached_parse
 
 
 def clean_data_name(data_name, filename):
@@ -30,3 +42,227 @@ def create_modified_callback(anobject):
             o.Modified()
 
     return _mark_modified
+
+
+def read_lines(filename, comments='!'):
+    """Read the lines of a text file as a NumPy string array without the
+    comments. The lines are shared by all readers through the parse cache.
+    """
+
+    def parse(filename):
+        return np.genfromtxt(filename, dtype=str, delimiter='\n', comments=comments)
+
+    return cached_parse(parse, filename, comments, namespace='read_lines')
+
+
+class FileLines(object):
+    """The lines of a text file without the comments or blank lines (just
+    like ``read_lines``) that are only read as they are accessed. A file's
+    header can be parsed from its first lines and the rest of the file handed
+    straight to a parser starting at ``get_offset()``: slicing off the header
+    lines (``lines[n::]``) does not read the file.
+
+    Args:
+        filename (str): the file
+        comments (str): the comment identifier
+    """
+
+    # Lines to read ahead of the one accessed
+    _read_ahead = 64
+
+    def __init__(self, filename, comments='!'):
+        self.__filename = filename
+        self.__comments = comments
+        self.__start = 0
+        # Shared by every slice of the lines
+        self.__state = {'lines': [], 'offsets': [], 'pos': 0, 'eof': False}
+        # Raise for a missing file now rather than on first access
+        self.__read(1)
+
+    def __read(self, count=None):
+        """Read until there are ``count`` lines (or all lines if ``None``)"""
+        state = self.__state
+        if state['eof'] or (count is not None and len(state['lines']) >= count):
+            return
+        if count is not None:
+            count += self._read_ahead
+        lines, offsets = state['lines'], state['offsets']
+        pos = state['pos']
+        with open(self.__filename, 'rb') as f:
+            f.seek(pos)
+            for raw in f:
+                offset, pos = pos, pos + len(raw)
+                line = raw.decode('utf-8', errors='replace')
+                if self.__comments:
+                    line = line.split(self.__comments)[0]
+                line = line.strip(' \r\n')
+                if line:
+                    lines.append(line)
+                    offsets.append(offset)
+                    if count is not None and len(lines) >= count:
+                        break
+            else:
+                state['eof'] = True
+        state['pos'] = pos
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop = key.start or 0, key.stop
+            if start >= 0 and key.step in (None, 1):
+                if stop is None:
+                    view = copy.copy(self)
+                    view.__start = self.__start + start
+                    return view
+                if stop >= 0:
+                    # Only read as far as the slice goes (e.g. a header)
+                    self.__read(self.__start + stop)
+                    lines = self.__state['lines']
+                    return np.array(
+                        lines[self.__start + start : self.__start + stop], dtype=str
+                    )
+            return self.to_array()[key]
+        if key < 0:
+            key += len(self)
+        self.__read(self.__start + key + 1)
+        lines = self.__state['lines']
+        if key < 0 or self.__start + key >= len(lines):
+            raise IndexError('line index out of range')
+        return lines[self.__start + key]
+
+    def __len__(self):
+        self.__read()
+        return max(len(self.__state['lines']) - self.__start, 0)
+
+    def __iter__(self):
+        self.__read()
+        return iter(self.__state['lines'][self.__start : :])
+
+    def to_array(self):
+        """Read all of the lines as a NumPy string array"""
+        self.__read()
+        return np.array(self.__state['lines'][self.__start : :], dtype=str)
+
+    def get_file_name(self):
+        """Get the name of the file"""
+        return self.__filename
+
+    def get_offset(self):
+        """Get the byte offset in the file of the first line"""
+        self.__read(self.__start + 1)
+        offsets = self.__state['offsets']
+        if self.__start < len(offsets):
+            return offsets[self.__start]
+        return self.__state['pos']
+
+
+def count_lines(filename, offset=0, blocksize=16 * 1024**2):
+    """Count the lines of a file from a byte offset on without decoding the
+    file. A last line without a trailing newline is counted.
+    """
+    count, last = 0, b'\n'
+    with open(filename, 'rb') as f:
+        f.seek(offset)
+        for block in iter(lambda: f.read(blocksize), b''):
+            count += block.count(b'\n')
+            last = block[-1:]
+    if last != b'\n':
+        count += 1
+    return count
+
+
+def split_file(filename, start=0, segments=1, min_size=1):
+    """Split the bytes of a file from an offset to its end into ranges of about
+    the same size that each start at the beginning of a line.
+
+    Args:
+        filename (str): the file
+        start (int): the byte offset to start from (e.g. after a header)
+        segments (int): the most ranges to make
+        min_size (int): the fewest bytes in a range
+
+    Return:
+        list(tuple(int)) : the ``(start, stop)`` byte offsets of each range
+    """
+    size = os.path.getsize(filename)
+    n = int(max(1, min(segments, (size - start) // max(min_size, 1))))
+    bounds = [start]
+    with open(filename, 'rb') as f:
+        for i in range(1, n):
+            f.seek(start + (size - start) * i // n)
+            # Move to the start of the next line
+            f.readline()
+            pos = f.tell()
+            if bounds[-1] < pos < size:
+                bounds.append(pos)
+    bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+class _FileRange(io.RawIOBase):
+    """A readable view of a range of the bytes of a file. If ``strip``, the
+    leading and trailing blanks of every line are removed as it is read."""
+
+    # The blanks at the start and end of each line
+    _blanks = re.compile(rb'(?m)^[ \t]+|[ \t]+(?=\r?$)')
+
+    def __init__(self, filename, start, stop=None, strip=False):
+        io.RawIOBase.__init__(self)
+        self.__file = open(filename, 'rb')
+        self.__file.seek(start)
+        self.__pos = start
+        self.__stop = stop
+        self.__strip = strip
+        # Stripped bytes not yet read and the unfinished last line read
+        self.__pending = memoryview(b'')
+        self.__partial = b''
+
+    def readable(self):
+        return True
+
+    def __readinto(self, b):
+        size = len(b)
+        if self.__stop is not None:
+            size = min(size, self.__stop - self.__pos)
+        if size <= 0:
+            return 0
+        size = self.__file.readinto(memoryview(b)[:size])
+        self.__pos += size
+        return size
+
+    def readinto(self, b):
+        if not self.__strip:
+            return self.__readinto(b)
+        while not len(self.__pending):
+            data = bytearray(max(len(b), 64 * 1024))
+            size = self.__readinto(data)
+            if size == 0 and not self.__partial:
+                return 0
+            data = self.__partial + bytes(data[:size])
+            # Only strip whole lines: the rest waits for the next read
+            cut = data.rfind(b'\n') + 1 if size else len(data)
+            data, self.__partial = data[:cut], data[cut:]
+            self.__pending = memoryview(self._blanks.sub(b'', data))
+        size = min(len(b), len(self.__pending))
+        b[:size] = self.__pending[:size]
+        self.__pending = self.__pending[size:]
+        return size
+
+    def close(self):
+        self.__file.close()
+        io.RawIOBase.close(self)
+
+
+def open_range(filename, start=0, stop=None, strip=False):
+    """Open a range of the bytes of a file (see ``split_file``) as a binary
+    file that ends at ``stop`` (the end of the file if ``None``). Use this to
+    parse part of a file.
+
+    Args:
+        filename (str): the file
+        start (int): the byte offset to start from
+        stop (int): the byte offset to stop at
+        strip (bool): remove the leading and trailing blanks of every line,
+            just as the lines of ``read_lines`` are stripped. Parsers like
+            pandas' otherwise read indented rows into the wrong columns.
+    """
+    return io.BufferedReader(_FileRange(filename, start, stop, strip=strip))
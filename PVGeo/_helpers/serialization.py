@@ -0,0 +1,38 @@
+__all__ = [
+    'serialize_data_object',
+    'deserialize_data_object',
+]
+
+__displayname__ = 'Serialization'
+
+import numpy as np
+
+from .. import _vtk
+from .._vtk import nps
+from .errors import PVGeoError
+
+
+def serialize_data_object(data_object):
+    """Pack a VTK data object into bytes with VTK's own binary marshaling.
+    This is much faster and more compact than writing the object to an XML
+    string and is used to pass data objects between processes.
+
+    Return:
+        tuple(str, bytes) : the class name and the contents of the object
+    """
+    buffer = _vtk.vtkCharArray()
+    if not _vtk.vtkCommunicator.MarshalDataObject(data_object, buffer):
+        raise PVGeoError('Unable to serialize `%s`.' % data_object.GetClassName())
+    return data_object.GetClassName(), nps.vtk_to_numpy(buffer).tobytes()
+
+
+def deserialize_data_object(payload):
+    """Unpack a data object packed by ``serialize_data_object``"""
+    class_name, contents = payload
+    data_object = _vtk.vtkDataObjectTypes.NewDataObject(class_name)
+    buffer = nps.numpy_to_vtk(
+        np.frombuffer(contents, dtype=np.int8), array_type=_vtk.vtkCharArray().GetDataType()
+    )
+    if not _vtk.vtkCommunicator.UnMarshalDataObject(buffer, data_object):
+        raise PVGeoError('Unable to deserialize `%s`.' % class_name)
+    return data_object
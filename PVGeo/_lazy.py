@@ -0,0 +1,61 @@
+"""
+A tiny helper for lazily loading the suites of ``PVGeo`` and their heavy
+dependencies. This module must stay free of any third party imports as it is
+used by ``PVGeo/__init__.py`` before anything else is loaded.
+"""
+
+__all__ = [
+    'attach',
+]
+
+__displayname__ = 'Lazy Loading'
+
+
+def attach(package_name, submodules=(), attributes=None, optional=()):
+    """Make the submodules and attributes of a package load on first access.
+
+    Args:
+        package_name (str): the ``__name__`` of the package
+        submodules (list(str)): the submodules to import on first access
+        attributes (dict): maps the name of an attribute to the submodule it is
+            defined in
+        optional (list(str)): submodules that depend on an optional package.
+            If these fail to import, an ``AttributeError`` is raised instead so
+            that ``hasattr`` checks work as expected.
+
+    Return:
+        tuple(callable, callable): the ``__getattr__`` and ``__dir__`` functions
+        to set on the package module
+    """
+    import importlib
+    import sys
+
+    submodules = set(submodules)
+    attributes = dict(attributes or {})
+    optional = set(optional)
+
+    def _import(name):
+        try:
+            return importlib.import_module('%s.%s' % (package_name, name))
+        except ImportError as err:
+            if name in optional:
+                raise AttributeError(
+                    'module %r has no attribute %r (%s)' % (package_name, name, err)
+                ) from err
+            raise
+
+    def __getattr__(name):
+        if name in submodules:
+            return _import(name)
+        if name in attributes:
+            value = getattr(_import(attributes[name]), name)
+            # Cache on the package so this hook is not called again
+            setattr(sys.modules[package_name], name, value)
+            return value
+        raise AttributeError('module %r has no attribute %r' % (package_name, name))
+
+    def __dir__():
+        names = set(vars(sys.modules[package_name]).keys())
+        return sorted(names | submodules | set(attributes.keys()))
+
+    return __getattr__, __dir__
@@ -0,0 +1,127 @@
+"""
+The VTK classes used by ``PVGeo``. These are imported from the granular
+``vtkmodules`` packages so that only the VTK libraries ``PVGeo`` needs are
+loaded instead of every wrapped VTK module that ``import vtk`` pulls in. The
+monolithic ``vtk`` package is used as a fallback for older VTK releases.
+
+Use this module as::
+
+    from .. import _vtk
+
+    pdo = _vtk.vtkPolyData()
+"""
+# flake8: noqa: F401
+
+# Nothing here to document: these are all VTK's classes
+__all__ = []
+
+__displayname__ = 'VTK Imports'
+
+try:
+    from vtkmodules.numpy_interface import dataset_adapter as dsa
+    from vtkmodules.util import numpy_support as nps
+    from vtkmodules.util.vtkAlgorithm import VTKPythonAlgorithmBase
+    from vtkmodules.vtkCommonCore import (
+        VTK_DOUBLE,
+        VTK_FLOAT,
+        VTK_ID_TYPE,
+        VTK_INT,
+        vtkAbstractArray,
+        vtkCharArray,
+        vtkDataArraySelection,
+        vtkDoubleArray,
+        vtkInformation,
+        vtkInformationVector,
+        vtkObject,
+        vtkPoints,
+        vtkTypeInt32Array,
+        vtkTypeInt64Array,
+    )
+    from vtkmodules.vtkCommonDataModel import (
+        VTK_LINE,
+        VTK_POLY_LINE,
+        VTK_POLY_VERTEX,
+        VTK_VERTEX,
+        VTK_VOXEL,
+        vtkCellArray,
+        vtkCompositeDataSet,
+        vtkDataObject,
+        vtkDataObjectTypes,
+        vtkImageData,
+        vtkMultiBlockDataSet,
+        vtkPlane,
+        vtkPolyData,
+        vtkPolyLine,
+        vtkRectilinearGrid,
+        vtkTable,
+        vtkUnstructuredGrid,
+    )
+    from vtkmodules.vtkCommonExecutionModel import (
+        vtkAlgorithm,
+        vtkDemandDrivenPipeline,
+        vtkStreamingDemandDrivenPipeline,
+    )
+    from vtkmodules.vtkCommonTransforms import vtkTransform
+    from vtkmodules.vtkFiltersCore import (
+        vtkCellDataToPointData,
+        vtkCutter,
+        vtkThreshold,
+        vtkTubeFilter,
+    )
+    from vtkmodules.vtkFiltersGeneral import vtkTransformFilter
+    from vtkmodules.vtkFiltersHybrid import vtkEarthSource
+    from vtkmodules.vtkParallelCore import vtkCommunicator
+
+    try:
+        from vtkmodules.vtkFiltersCore import vtkCellCenters
+    except ImportError:  # VTK < 9.1
+        from vtkmodules.vtkFiltersGeneral import vtkCellCenters
+except ImportError:  # VTK < 8.2 does not have ``vtkmodules``
+    from vtk import (
+        VTK_DOUBLE,
+        VTK_FLOAT,
+        VTK_ID_TYPE,
+        VTK_INT,
+        VTK_LINE,
+        VTK_POLY_LINE,
+        VTK_POLY_VERTEX,
+        VTK_VERTEX,
+        VTK_VOXEL,
+        vtkAbstractArray,
+        vtkAlgorithm,
+        vtkCellArray,
+        vtkCellCenters,
+        vtkCellDataToPointData,
+        vtkCharArray,
+        vtkCommunicator,
+        vtkCompositeDataSet,
+        vtkCutter,
+        vtkDataArraySelection,
+        vtkDataObject,
+        vtkDataObjectTypes,
+        vtkDemandDrivenPipeline,
+        vtkDoubleArray,
+        vtkEarthSource,
+        vtkImageData,
+        vtkInformation,
+        vtkInformationVector,
+        vtkMultiBlockDataSet,
+        vtkObject,
+        vtkPlane,
+        vtkPoints,
+        vtkPolyData,
+        vtkPolyLine,
+        vtkRectilinearGrid,
+        vtkStreamingDemandDrivenPipeline,
+        vtkTable,
+        vtkThreshold,
+        vtkTransform,
+        vtkTransformFilter,
+        vtkTubeFilter,
+        vtkTypeInt32Array,
+        vtkTypeInt64Array,
+        vtkUnstructuredGrid,
+    )
+    from vtk.numpy_interface import dataset_adapter as dsa
+    from vtk.util import numpy_support as nps
+    from vtk.util.vtkAlgorithm import VTKPythonAlgorithmBase
@@ -12,20 +12,60 @@ __all__ = [
 
 __displayname__ = 'Base Classes'
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import threading
 import warnings
 
 import pyvista as pv
 
-# Outside Imports:
-import vtk  # NOTE: This is the first import executed in the package! Keep here!!
-import vtk.util.vtkAlgorithm as valg  # import VTKPythonAlgorithmBase
+from . import _helpers, _vtk, memory
+
+###############################################################################
+
+
+class _PackedDataObject(object):
+    """Internal helper to send a VTK data object to or from another process"""
+
+    def __init__(self, data_object):
+        self.payload = _helpers.serialize_data_object(data_object)
+
+    def unpack(self):
+        return pv.wrap(_helpers.deserialize_data_object(self.payload))
+
+
+def _apply_packed(cls, kwargs, args):
+    """Internal helper to run an algorithm's ``apply`` in a worker process"""
+    args = [a.unpack() if isinstance(a, _PackedDataObject) else a for a in args]
+    alg = cls(**kwargs)
+    output = alg.apply(*args)
+    if alg.error_occurred():
+        raise _helpers.PVGeoError(alg.get_error_message())
+    return _PackedDataObject(output)
+
+
+def _apply_many(cls, inputs, workers, kwargs):
+    """Internal helper to run an algorithm's ``apply`` on many inputs in a
+    pool of processes"""
+    items = []
+    for item in inputs:
+        args = item if isinstance(item, tuple) else (item,)
+        items.append(
+            tuple(
+                _PackedDataObject(a) if isinstance(a, _vtk.vtkDataObject) else a
+                for a in args
+            )
+        )
+    func = functools.partial(_apply_packed, cls, kwargs)
+    results = _helpers.map_ordered(func, items, workers=workers, processes=True)
+    return [res.unpack() for res in results]
 
-from . import _helpers
 
 ###############################################################################
 
 
-class AlgorithmBase(valg.VTKPythonAlgorithmBase):
+class AlgorithmBase(_vtk.VTKPythonAlgorithmBase):
     """This is a base class to add coconvenience methods to the
     ``VTKPythonAlgorithmBase`` for all algorithms implemented in ``PVGeo``.
     We implement our algorithms in this manner to harness all of the backend
@@ -49,6 +89,12 @@ class AlgorithmBase(valg.VTKPythonAlgorithmBase):
 
     __displayname__ = 'Algorithm Base'
     __category__ = 'base'
+    # The attributes holding execution state (parsed data, flags and values
+    # set while executing, ...) rather than parameters. These are left out of
+    # the memoization key. List only the attributes a class itself defines.
+    # Outputs are not memoized while any other attribute holds an object that
+    # cannot be fingerprinted (see ``_helpers.parameter_fingerprint``).
+    _memo_state = ()
 
     def __init__(
         self,
@@ -58,7 +104,7 @@ class AlgorithmBase(valg.VTKPythonAlgorithmBase):
         outputType='vtkTable',
         **kwargs
     ):
-        valg.VTKPythonAlgorithmBase.__init__(
+        _vtk.VTKPythonAlgorithmBase.__init__(
             self,
             nInputPorts=nInputPorts,
             inputType=inputType,
@@ -68,6 +114,212 @@ class AlgorithmBase(valg.VTKPythonAlgorithmBase):
         # Add error handler to make errors easier to deal with
         self.__error_observer = _helpers.ErrorObserver()
         self.__error_observer.make_observer(self)
+        # Profiling of the pipeline passes (off by default)
+        self.__profile = kwargs.get('profile', False)
+        self.__stats = None
+        # Memoization of the outputs (off by default)
+        self.__memoize = kwargs.get('memoize', False)
+        self.__memo = _helpers.LRUCache(kwargs.get('memo_size', 4))
+        # Report the memory held by this algorithm to ``PVGeo.memory``. The
+        # lock is held while executing so that the caches are not released
+        self.__memory_lock = threading.RLock()
+        memory.register(self)
+
+    def ProcessRequest(self, request, inInfo, outInfo):
+        """Overridden to optionally record the wall time, CPU time, and peak
+        memory of each pipeline pass and to optionally reuse memoized outputs.
+        When both are off, this simply dispatches the request.
+        """
+        if not (self.__profile or _helpers.profiling._PROFILE_ALL):
+            return self.__dispatch_request(request, inInfo, outInfo)
+        if request.Has(_vtk.vtkDemandDrivenPipeline.REQUEST_DATA_OBJECT()):
+            name = 'RequestDataObject'
+        elif request.Has(_vtk.vtkDemandDrivenPipeline.REQUEST_INFORMATION()):
+            name = 'RequestInformation'
+        elif request.Has(_vtk.vtkStreamingDemandDrivenPipeline.REQUEST_UPDATE_EXTENT()):
+            name = 'RequestUpdateExtent'
+        elif request.Has(_vtk.vtkDemandDrivenPipeline.REQUEST_DATA()):
+            name = 'RequestData'
+        else:
+            return 1
+        stats = self.get_profile_stats()
+        if _helpers.profiling._REGISTER_ALL:
+            _helpers.get_profile_registry().add(stats)
+        with stats.measure(name):
+            return self.__dispatch_request(request, inInfo, outInfo)
+
+    def __dispatch_request(self, request, inInfo, outInfo):
+        """Internal helper to handle a request and report the memory held
+        afterwards."""
+        with self.__memory_lock:
+            ret = self.__memoized_request(request, inInfo, outInfo)
+        if request.Has(_vtk.vtkDemandDrivenPipeline.REQUEST_DATA()):
+            memory.touch(self)
+        return ret
+
+    def __memoized_request(self, request, inInfo, outInfo):
+        """Internal helper to handle a request, reusing a memoized output for
+        data requests when memoization is on."""
+        if self.__memoize and request.Has(_vtk.vtkDemandDrivenPipeline.REQUEST_DATA()):
+            try:
+                key = self.__memo_key(inInfo, outInfo)
+            except TypeError:
+                # A parameter that cannot be fingerprinted: do not risk
+                # serving a stale output
+                return self._process_request(request, inInfo, outInfo)
+            outputs = [
+                outInfo.GetInformationObject(i).Get(_vtk.vtkDataObject.DATA_OBJECT())
+                for i in range(outInfo.GetNumberOfInformationObjects())
+            ]
+            cached = self.__memo.get(key)
+            if cached is not None:
+                for output, result in zip(outputs, cached):
+                    output.DeepCopy(result)
+                return 1
+            ret = self._process_request(request, inInfo, outInfo)
+            if ret:
+                results = []
+                for output in outputs:
+                    result = output.NewInstance()
+                    result.DeepCopy(output)
+                    results.append(result)
+                self.__memo.put(key, results)
+            return ret
+        return self._process_request(request, inInfo, outInfo)
+
+    def _process_request(self, request, inInfo, outInfo):
+        """Handle a pipeline request by calling the ``Request*`` methods.
+        Override to change how requests are handled (filters use this to run
+        on each block of a composite input)."""
+        return _vtk.VTKPythonAlgorithmBase.ProcessRequest(self, request, inInfo, outInfo)
+
+    def __memo_key(self, inInfo, outInfo):
+        """Internal helper to identify a data request by the input data
+        objects, their modification times, the requested time, extent and
+        piece, and the parameters of this algorithm."""
+        inputs = []
+        for vec in inInfo:
+            for i in range(vec.GetNumberOfInformationObjects()):
+                obj = vec.GetInformationObject(i).Get(_vtk.vtkDataObject.DATA_OBJECT())
+                # NOTE: the address of the VTK object as the Python wrapper
+                #       (and so its ``id``) may be made anew for every request
+                inputs.append((obj.__this__, obj.GetMTime()) if obj is not None else None)
+        sddp = _vtk.vtkStreamingDemandDrivenPipeline
+        request_keys = (
+            sddp.UPDATE_TIME_STEP(),
+            sddp.UPDATE_EXTENT(),
+            sddp.UPDATE_PIECE_NUMBER(),
+            sddp.UPDATE_NUMBER_OF_PIECES(),
+        )
+        requested = []
+        for i in range(outInfo.GetNumberOfInformationObjects()):
+            info = outInfo.GetInformationObject(i)
+            requested.append(
+                tuple(info.Get(key) if info.Has(key) else None for key in request_keys)
+            )
+        return (tuple(inputs), tuple(requested), self._memo_fingerprint())
+
+    def _get_memo_state(self):
+        """Get the names of the attributes holding execution state rather
+        than parameters: the ``_memo_state`` of every class of this object."""
+        names = set()
+        for cls in type(self).__mro__:
+            names.update(vars(cls).get('_memo_state', ()))
+        return names
+
+    def _memo_fingerprint(self):
+        """Get a fingerprint of everything besides the inputs that decides
+        the outputs of this algorithm. Override to add more to it (readers add
+        the fingerprints of their files)."""
+        return _helpers.parameter_fingerprint(
+            self, exclude=('_AlgorithmBase__',), ignore=self._get_memo_state()
+        )
+
+    def set_profiling(self, flag, register=False):
+        """Turn on/off the recording of timing and memory statistics for each
+        pipeline pass of this algorithm.
+
+        Args:
+            flag (bool): a boolean to profile or not
+            register (bool): also report this algorithm's statistics to the
+                process wide registry (see ``_helpers.get_profile_registry``)
+        """
+        self.__profile = flag
+        if flag and register:
+            _helpers.get_profile_registry().add(self.get_profile_stats())
+
+    def get_profiling(self):
+        """Ask if this algorithm records profiling statistics"""
+        return self.__profile
+
+    def get_profile_stats(self):
+        """Get the ``AlgorithmStats`` holding the profiling statistics of this
+        algorithm
+        """
+        if self.__stats is None:
+            self.__stats = _helpers.AlgorithmStats(
+                '%s (%d)' % (self.__class__.__name__, id(self))
+            )
+        return self.__stats
+
+    def set_memoize(self, flag):
+        """Turn on/off the memoization of outputs. When on, the outputs of the
+        last few data requests are held and reused when the inputs (by their
+        modification times) and the parameters of this algorithm (its
+        attributes holding plain Python or NumPy values or VTK objects) are
+        the same. Outputs are not memoized while this algorithm holds any other
+        objects as their changes cannot be seen.
+        """
+        self.__memoize = flag
+        if not flag:
+            self.__memo.clear()
+
+    def get_memoize(self):
+        """Ask if this algorithm memoizes its outputs"""
+        return self.__memoize
+
+    def set_memo_size(self, size):
+        """Set the number of outputs held when memoizing"""
+        self.__memo.set_max_size(size)
+
+    def get_memo_size(self):
+        """Get the number of outputs held when memoizing"""
+        return self.__memo.get_max_size()
+
+    def clear_memo(self):
+        """Drop all memoized outputs"""
+        self.__memo.clear()
+
+    def _get_memory_items(self):
+        """Get the objects cached by this algorithm. Override to add the
+        data held by an algorithm (parsed files, meshes, etc.)."""
+        return self.__memo.values()
+
+    def _release_memory(self):
+        """Drop the objects cached by this algorithm. Override to drop the
+        data held by an algorithm in a way that it is rebuilt on demand."""
+        self.__memo.clear()
+
+    def get_memory_usage(self):
+        """Get an estimate of the bytes held by the caches of this algorithm
+        (see ``PVGeo.memory``)"""
+        return _helpers.estimate_nbytes(self._get_memory_items())
+
+    def release_memory(self):
+        """Drop the caches of this algorithm. Anything needed again is read
+        or computed on the next update. Nothing is released while the
+        algorithm is executing.
+
+        Return:
+            bool : whether the caches were released
+        """
+        if not self.__memory_lock.acquire(blocking=False):
+            return False
+        try:
+            self._release_memory()
+        finally:
+            self.__memory_lock.release()
+        return True
 
     def GetOutput(self, port=0):
         """A convenience method to get the output data object of this ``PVGeo``
@@ -98,6 +350,45 @@ class AlgorithmBase(valg.VTKPythonAlgorithmBase):
         self.Update()
         return pv.wrap(self.GetOutput())
 
+    async def apply_async(self, *args, executor=None):
+        """A coroutine that runs ``apply`` in an executor so that the event
+        loop is not blocked. Cancelling the task aborts the execution at the
+        next file, time step, or block (see ``_check_abort``) and waits for
+        the algorithm to stop before the cancellation is raised.
+
+        Args:
+            *args: the arguments for ``apply``
+            executor (concurrent.futures.Executor): the executor to run on.
+                Defaults to the event loop's default executor.
+
+        Example:
+            >>> outputs = await asyncio.gather(
+            ...     reader_a.apply_async(), reader_b.apply_async()
+            ... )
+        """
+        loop = asyncio.get_running_loop()
+        self.SetAbortExecute(0)
+        future = loop.run_in_executor(executor, functools.partial(self.apply, *args))
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            self.SetAbortExecute(1)
+            try:
+                await future
+            finally:
+                self.SetAbortExecute(0)
+                # The output of an aborted execution must not be reused
+                _vtk.VTKPythonAlgorithmBase.Modified(self)
+            raise
+
+    def _check_abort(self):
+        """Raise a ``PVGeoError`` if the execution of this algorithm has been
+        aborted. Long running algorithms call this between files, time steps,
+        or blocks.
+        """
+        if self.GetAbortExecute():
+            raise _helpers.PVGeoError('%s was aborted.' % self.__class__.__name__)
+
     def update(self):
         """Alias for self.Update()"""
         return self.Update()
@@ -114,6 +405,7 @@ class ReaderBaseBase(AlgorithmBase):
 
     __displayname__ = 'Reader Base Base'
     __category__ = 'base'
+    _memo_state = ('_ReaderBaseBase__need_to_read', '_ReaderBaseBase__parsed')
 
     def __init__(self, nOutputPorts=1, outputType='vtkTable', **kwargs):
         AlgorithmBase.__init__(
@@ -128,6 +420,10 @@ class ReaderBaseBase(AlgorithmBase):
         self.__filenames = kwargs.get('filenames', [])
         # To know whether or not the read needs to perform
         self.__need_to_read = True
+        # The results of the last read for each file and the fingerprints of
+        # those files so that unchanged files are not parsed again
+        self.__parsed = dict()
+        self.__checksum = kwargs.get('checksum', False)
 
     def need_to_read(self, flag=None):
         """Ask self if the reader needs to read the files again.
@@ -146,12 +442,71 @@ class ReaderBaseBase(AlgorithmBase):
         """Call modified if the files needs to be read again again"""
         if read_again:
             self.__need_to_read = read_again
+            # The read parameters may have changed: parse every file again
+            self.__parsed = dict()
         AlgorithmBase.Modified(self)
 
     def modified(self, read_again=True):
         return self.Modified(read_again=read_again)
 
+    def refresh(self):
+        """Read the files again on the next update but only parse the files
+        that were added or changed on disk since the last read.
+        """
+        self.__need_to_read = True
+        AlgorithmBase.Modified(self)
+
+    def _memo_fingerprint(self):
+        """Memoized outputs also depend on the files on disk"""
+        files = tuple(_helpers.file_fingerprint(f) for f in self.__filenames)
+        return (AlgorithmBase._memo_fingerprint(self), files)
+
+    def _get_memory_items(self):
+        """The parsed results of the files are held"""
+        parsed = [res for _, res in self.__parsed.values()]
+        return AlgorithmBase._get_memory_items(self) + parsed
+
+    def _release_memory(self):
+        """Drop the parsed results and read the files again on demand"""
+        AlgorithmBase._release_memory(self)
+        self.__parsed = dict()
+        self.__need_to_read = True
+
     #### Methods for performing the read ####
+
+    def _read_changed_files(self, read, filenames):
+        """Read a list of files but only parse the ones that were added or
+        changed on disk since they were last read by this reader. The results
+        of the unchanged files are reused.
+
+        Args:
+            read (callable): parses a list of file names and returns a list
+                with one result per file
+            filenames (list(str)): all the files to read
+
+        Return:
+            list : the results for every file in ``filenames``
+        """
+        fingerprints = [
+            _helpers.file_fingerprint(f, checksum=self.__checksum) for f in filenames
+        ]
+        changed = [
+            i
+            for i, (f, fp) in enumerate(zip(filenames, fingerprints))
+            if fp is None or f not in self.__parsed or self.__parsed[f][0] != fp
+        ]
+        results = [self.__parsed[f][1] if f in self.__parsed else None for f in filenames]
+        if changed:
+            for i, res in zip(changed, read([filenames[i] for i in changed])):
+                results[i] = res
+        # Only keep the files that are still being read
+        self.__parsed = dict(
+            (f, (fp, res))
+            for f, fp, res in zip(filenames, fingerprints, results)
+            if fp is not None
+        )
+        return results
+
     # These are meant to be overwritten by child classes
 
     def _get_file_contents(self, idx=None):
@@ -188,7 +543,8 @@ class ReaderBaseBase(AlgorithmBase):
                 self.AddFileName(f)
         elif filename not in self.__filenames:
             self.__filenames.append(filename)
-        self.Modified()
+        # Files that were already read are not parsed again unless changed
+        self.refresh()
 
     def add_file_name(self, filename):
         """Use to set the file names for the reader. Handles singlt string or
@@ -209,22 +565,59 @@ class ReaderBaseBase(AlgorithmBase):
             return self.__filenames
         return self.__filenames[idx]
 
+    def set_checksum(self, flag):
+        """Set whether to hash the contents of the files to detect changes
+        when refreshing. By default, only the size and modification time of
+        the files are compared.
+        """
+        if self.__checksum != flag:
+            self.__checksum = flag
+            self.refresh()
+
+    def get_checksum(self):
+        """Get whether the contents of the files are hashed to detect
+        changes"""
+        return self.__checksum
+
     def apply(self, filename):
         """Given a file name (or list of file names), perform the read"""
         self.AddFileName(filename)
         self.Update()
         return pv.wrap(self.GetOutput())
 
+    @classmethod
+    def apply_many(cls, inputs, workers=None, **kwargs):
+        """Read many files (or series of files) in a pool of processes.
+
+        Args:
+            inputs (list): the file names to read. Each item is passed to
+                ``apply``, so an item can be a list of file names for a series.
+            workers (int): the number of processes. Defaults to the number of
+                CPUs.
+            **kwargs: the keyword arguments for constructing the reader
+
+        Return:
+            list : the outputs in the same order as the inputs
+        """
+        return _apply_many(cls, inputs, workers, kwargs)
+
 
 ###############################################################################
 
 # Base filter to preserve input data type
 class FilterBase(AlgorithmBase):
     """A base class for implementing filters which holds several conveience
-    methods"""
+    methods. When the first input is a composite dataset (e.g. a
+    ``vtkMultiBlockDataSet``), the filter runs on each leaf block on a pool of
+    threads and the output is a composite dataset with the same tree and
+    block names."""
 
     __displayname__ = 'Filter Base'
     __category__ = 'base'
+    _memo_state = ('_FilterBase__composite_output',)
+    # Filters that change their attributes while executing set this to
+    # ``False`` so that the blocks of a composite input are run one by one
+    _parallel_blocks = True
 
     def __init__(
         self,
@@ -242,6 +635,165 @@ class FilterBase(AlgorithmBase):
             outputType=outputType,
             **kwargs
         )
+        # Share the input's geometry and arrays with the output
+        self.__shallow_copy = kwargs.get('shallow_copy', False)
+        # Execution on the blocks of composite inputs
+        self.__per_block = kwargs.get('per_block', True)
+        self.__workers = kwargs.get('workers', None)
+        self.__composite_output = False
+
+    def FillInputPortInformation(self, port, info):
+        """Let the first input port also take composite datasets so that
+        their blocks can be run in parallel"""
+        info.Set(self.INPUT_REQUIRED_DATA_TYPE(), self.InputType)
+        if port == 0:
+            info.Append(self.INPUT_REQUIRED_DATA_TYPE(), 'vtkCompositeDataSet')
+        return 1
+
+    def _process_request(self, request, inInfo, outInfo):
+        """Overridden to run on each leaf block of a composite input"""
+        composite = self.__get_composite_input(inInfo)
+        if request.Has(_vtk.vtkDemandDrivenPipeline.REQUEST_DATA_OBJECT()):
+            if composite is not None:
+                # The output is a composite dataset like the input
+                self.__set_output_type(composite.GetClassName())
+                self.__composite_output = True
+                return 1
+            ret = AlgorithmBase._process_request(self, request, inInfo, outInfo)
+            if self.__composite_output:
+                # Switch back to the usual output type
+                self.__set_output_type(self.OutputType)
+                self.__composite_output = False
+            return ret
+        elif composite is not None and request.Has(
+            _vtk.vtkDemandDrivenPipeline.REQUEST_DATA()
+        ):
+            return self.__request_data_per_block(request, inInfo, outInfo, composite)
+        return AlgorithmBase._process_request(self, request, inInfo, outInfo)
+
+    def __set_output_type(self, name):
+        """Internal helper to set the data type made for the output ports"""
+        for port in range(self.GetNumberOfOutputPorts()):
+            self.GetOutputPortInformation(port).Set(_vtk.vtkDataObject.DATA_TYPE_NAME(), name)
+
+    def __get_composite_input(self, inInfo):
+        """Internal helper to get the first input if it is a composite
+        dataset that this filter runs on block by block"""
+        if not self.__per_block or not len(inInfo):
+            return None
+        if inInfo[0].GetNumberOfInformationObjects() < 1:
+            return None
+        inp = inInfo[0].GetInformationObject(0).Get(_vtk.vtkDataObject.DATA_OBJECT())
+        if not isinstance(inp, _vtk.vtkCompositeDataSet):
+            return None
+        if self.InputType != 'vtkDataObject' and inp.IsA(self.InputType):
+            # This filter is made for composite datasets
+            return None
+        return inp
+
+    def __request_data_per_block(self, request, inInfo, outInfo, composite):
+        """Internal helper to run ``RequestData`` on each leaf block of a
+        composite input and assemble the composite outputs"""
+        blocks = _helpers.get_leaf_blocks(composite)
+        workers = self.__workers if self._parallel_blocks else 1
+        results = _helpers.map_ordered(
+            lambda block: self.__request_block(request, inInfo, outInfo, block),
+            blocks,
+            workers=workers,
+        )
+        for port in range(outInfo.GetNumberOfInformationObjects()):
+            output = outInfo.GetInformationObject(port).Get(_vtk.vtkDataObject.DATA_OBJECT())
+            _helpers.set_leaf_blocks(output, composite, [res[port] for res in results])
+        return 1
+
+    def __request_block(self, request, inInfo, outInfo, block):
+        """Internal helper to run ``RequestData`` on a single block. The
+        pipeline information is copied with the block in place of the
+        composite input and new data objects for the outputs."""
+        self._check_abort()
+        block_in = []
+        for port, vec in enumerate(inInfo):
+            block_vec = _vtk.vtkInformationVector()
+            for i in range(vec.GetNumberOfInformationObjects()):
+                info = _vtk.vtkInformation()
+                info.Copy(vec.GetInformationObject(i))
+                if port == 0:
+                    info.Set(_vtk.vtkDataObject.DATA_OBJECT(), block)
+                block_vec.Append(info)
+            block_in.append(block_vec)
+        block_out = _vtk.vtkInformationVector()
+        outputs = []
+        for port in range(outInfo.GetNumberOfInformationObjects()):
+            info = _vtk.vtkInformation()
+            info.Copy(outInfo.GetInformationObject(port))
+            output = self._new_block_output(block, port)
+            info.Set(_vtk.vtkDataObject.DATA_OBJECT(), output)
+            block_out.Append(info)
+            outputs.append(output)
+        if not self.RequestData(request, tuple(block_in), block_out):
+            raise _helpers.PVGeoError(
+                '%s failed on a block of the composite input.' % self.__class__.__name__
+            )
+        return outputs
+
+    def _new_block_output(self, block, port):
+        """Make the output data object for a block of a composite input"""
+        output = _vtk.vtkDataObjectTypes.NewDataObject(self.OutputType)
+        if output is None:
+            # An abstract output type: use the type of the block
+            output = block.NewInstance()
+        return output
+
+    def _copy_input(self, pdi, pdo):
+        """Copy the input data object to the output before adding new arrays.
+        In shallow copy mode, the output references the geometry and arrays of
+        the input and only the arrays added to the output are allocated. Arrays
+        added to the output are not added to the input but filters must not
+        modify the values of the input's arrays in place.
+        """
+        if self.__shallow_copy:
+            pdo.ShallowCopy(pdi)
+        else:
+            pdo.DeepCopy(pdi)
+        return pdo
+
+    def set_shallow_copy(self, flag):
+        """Set whether the output shares the geometry and existing arrays of
+        the input rather than holding a deep copy of them.
+        """
+        if self.__shallow_copy != flag:
+            self.__shallow_copy = flag
+            self.Modified()
+
+    def get_shallow_copy(self):
+        """Get whether the output shares the geometry and arrays of the input"""
+        return self.__shallow_copy
+
+    def set_per_block(self, flag):
+        """Set whether this filter runs on each leaf block of a composite
+        input. When off, a composite input is passed to ``RequestData`` as is.
+        """
+        if self.__per_block != flag:
+            self.__per_block = flag
+            self.Modified()
+
+    def get_per_block(self):
+        """Get whether this filter runs on each leaf block of a composite
+        input"""
+        return self.__per_block
+
+    def set_workers(self, workers):
+        """Set the number of threads used to run the blocks of a composite
+        input. ``None`` uses the number of CPUs.
+        """
+        if self.__workers != workers:
+            self.__workers = workers
+            self.Modified()
+
+    def get_workers(self):
+        """Get the number of threads used to run the blocks of a composite
+        input"""
+        return self.__workers
 
     def apply(self, input_data_object):
         """Run this algorithm on the given input dataset"""
@@ -249,6 +801,24 @@ class FilterBase(AlgorithmBase):
         self.Update()
         return pv.wrap(self.GetOutput())
 
+    @classmethod
+    def apply_many(cls, inputs, workers=None, **kwargs):
+        """Run this filter on many datasets in a pool of processes. The data
+        objects are passed between processes with VTK's binary marshaling.
+
+        Args:
+            inputs (list): the inputs. Each item is passed to ``apply``. Use
+                a tuple to give several arguments (e.g. the input and the
+                array names for ``ArrayMath``).
+            workers (int): the number of processes. Defaults to the number of
+                CPUs.
+            **kwargs: the keyword arguments for constructing the filter
+
+        Return:
+            list : the outputs in the same order as the inputs
+        """
+        return _apply_many(cls, inputs, workers, kwargs)
+
 
 ###############################################################################
 # Base Reader
@@ -259,6 +829,14 @@ class ReaderBase(ReaderBaseBase):
 
     __displayname__ = 'Reader Base: Time Varying'
     __category__ = 'base'
+    _memo_state = (
+        '_ReaderBase__timesteps',
+        '_ReaderBase__pending',
+        '_ReaderBase__generation',
+        '_ReaderBase__executor',
+        '_ReaderBase__lock',
+        '_ReaderBase__time_steps',
+    )
 
     def __init__(self, nOutputPorts=1, outputType='vtkTable', **kwargs):
         ReaderBaseBase.__init__(
@@ -268,6 +846,16 @@ class ReaderBase(ReaderBaseBase):
         # For the VTK/ParaView pipeline
         self.__dt = kwargs.get('dt', 1.0)
         self.__timesteps = None
+        # For reading time steps on demand rather than all up front
+        self.__lazy = kwargs.get('lazy', False)
+        self.__prefetch = kwargs.get('prefetch', False)
+        self.__time_steps = _helpers.LRUCache(kwargs.get('cache_size', 8))
+        self.__pending = dict()
+        self.__generation = 0
+        self.__lock = threading.RLock()
+        self.__executor = None
+        # Number of threads used to parse a series of files
+        self.__workers = kwargs.get('workers', None)
 
     def _update_time_steps(self):
         """For internal use only: appropriately sets the timesteps."""
@@ -277,6 +865,120 @@ class ReaderBase(ReaderBaseBase):
             )
         return 1
 
+    def _get_memory_items(self):
+        """The time steps read on demand are held"""
+        return ReaderBaseBase._get_memory_items(self) + self.__time_steps.values()
+
+    def _release_memory(self):
+        """Drop the time steps read on demand"""
+        ReaderBaseBase._release_memory(self)
+        self._clear_time_steps()
+
+    def _map_files(self, func, items):
+        """Apply ``func`` to each item (typically a file name or a file's
+        contents) on this reader's thread pool. Results keep the order of the
+        items and errors are raised just like a plain loop. The remaining
+        items are skipped if the read is aborted."""
+
+        def call(item):
+            self._check_abort()
+            return func(item)
+
+        return _helpers.map_ordered(call, items, workers=self.__workers)
+
+    #### Methods for reading time steps on demand ####
+
+    def _read_time_step(self, idx):
+        """OVERRIDE: Read and parse the data for a single time step. This is
+        used in place of ``_read_up_front`` when the reader is lazy. This runs
+        in a background thread when prefetching so it must not change the
+        reader: return anything to set on the reader along with the data and
+        set it in ``_use_time_step``."""
+        raise NotImplementedError()
+
+    def _use_time_step(self, data):
+        """Get the data of a time step from what ``_read_time_step`` returned.
+        This is called on the thread that requested the time step. Override to
+        set anything read with the data on the reader."""
+        return data
+
+    def _clear_time_steps(self):
+        """Drop all time steps read on demand and ignore any that are still
+        being prefetched."""
+        with self.__lock:
+            self.__generation += 1
+            self.__time_steps.clear()
+            self.__pending = dict()
+
+    def _get_time_step(self, idx):
+        """Get the data for a time step, reading it if it is not already held
+        by the reader. If prefetching is on, the neighboring time steps are then
+        read in the background."""
+        with self.__lock:
+            generation = self.__generation
+            data = self.__time_steps.get(idx)
+            future = self.__pending.get(idx)
+        if data is None:
+            if future is not None:
+                try:
+                    data = future.result()
+                except Exception:  # read again in the foreground to raise
+                    data = None
+            if data is None:
+                data = self._read_time_step(idx)
+            with self.__lock:
+                if generation == self.__generation:
+                    self.__time_steps.put(idx, data)
+                    self.__pending.pop(idx, None)
+        data = self._use_time_step(data)
+        if self.__prefetch:
+            self._prefetch_time_steps(idx)
+        return data
+
+    def _prefetch_time_steps(self, idx):
+        """Read the time steps next to ``idx`` in a background thread"""
+        n = len(self.get_file_names())
+        with self.__lock:
+            generation = self.__generation
+            for i in (idx + 1, idx - 1):
+                if i < 0 or i >= n or i in self.__time_steps or i in self.__pending:
+                    continue
+                if self.__executor is None:
+                    self.__executor = ThreadPoolExecutor(max_workers=1)
+                self.__pending[i] = self.__executor.submit(
+                    self.__prefetch_time_step, i, generation
+                )
+
+    def __prefetch_time_step(self, idx, generation):
+        try:
+            data = self._read_time_step(idx)
+        except Exception:
+            # Do not hold on to the failure: the time step is read again in
+            # the foreground (to raise) if it is ever requested
+            with self.__lock:
+                if generation == self.__generation:
+                    self.__pending.pop(idx, None)
+            raise
+        with self.__lock:
+            if generation == self.__generation:
+                self.__time_steps.put(idx, data)
+                self.__pending.pop(idx, None)
+        return data
+
+    def __stop_prefetching(self):
+        """Internal helper to cancel the time steps waiting to be prefetched
+        and shut down the background thread"""
+        with self.__lock:
+            executor, self.__executor = self.__executor, None
+            self.__pending = dict()
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def __del__(self):
+        # ``__init__`` may have failed before the executor was made
+        if getattr(self, '_ReaderBase__executor', None) is not None:
+            self.__stop_prefetching()
+
     #### Algorithm Methods ####
 
     def RequestInformation(self, request, inInfo, outInfo):
@@ -299,6 +1001,49 @@ class ReaderBase(ReaderBaseBase):
             self.__dt = dt
             self.Modified()
 
+    def set_lazy_read(self, flag):
+        """Set whether to read each time step on demand instead of reading
+        every file in the series up front."""
+        if self.__lazy != flag:
+            self.__lazy = flag
+            self.Modified()
+
+    def get_lazy_read(self):
+        """Get whether time steps are read on demand"""
+        return self.__lazy
+
+    def set_time_step_cache_size(self, size):
+        """Set the number of time steps to hold in memory when reading on
+        demand. The least recently used time steps are dropped first."""
+        if self.__time_steps.get_max_size() != size:
+            self.__time_steps.set_max_size(size)
+
+    def get_time_step_cache_size(self):
+        """Get the number of time steps held in memory when reading on demand"""
+        return self.__time_steps.get_max_size()
+
+    def set_prefetch(self, flag):
+        """Set whether to read the next and previous time steps in the
+        background when reading on demand."""
+        self.__prefetch = flag
+        if not flag:
+            self.__stop_prefetching()
+
+    def get_prefetch(self):
+        """Get whether neighboring time steps are read in the background"""
+        return self.__prefetch
+
+    def set_workers(self, workers):
+        """Set the number of threads used to parse the files of a series. Use
+        ``None`` for one thread per CPU or ``1`` to read the files one by one."""
+        self.__workers = workers
+
+    def get_workers(self):
+        """Get the number of threads used to parse the files of a series"""
+        if self.__workers is None:
+            return _helpers.get_default_workers()
+        return self.__workers
+
 
 ###############################################################################
 
@@ -321,6 +1066,10 @@ class FilterPreserveTypeBase(FilterBase):
         )
         self._preserve_port = 0  # This is the port to preserve data object type
 
+    def _new_block_output(self, block, port):
+        """The output of each block is the same type as the block"""
+        return block.NewInstance()
+
     # THIS IS CRUCIAL to preserve data type through filter
     def RequestDataObject(self, request, inInfo, outInfo):
         """There is no need to overwrite this. This method lets the pipeline
@@ -344,6 +1093,11 @@ class TwoFileReaderBase(AlgorithmBase):
 
     __displayname__ = 'Two File Reader Base'
     __category__ = 'base'
+    _memo_state = (
+        '_TwoFileReaderBase__timesteps',
+        '_TwoFileReaderBase__need_to_read_mesh',
+        '_TwoFileReaderBase__need_to_read_models',
+    )
 
     def __init__(self, nOutputPorts=1, outputType='vtkUnstructuredGrid', **kwargs):
         AlgorithmBase.__init__(
@@ -361,6 +1115,12 @@ class TwoFileReaderBase(AlgorithmBase):
         self.__need_to_read_mesh = True
         self.__need_to_read_models = True
 
+    def _memo_fingerprint(self):
+        """Memoized outputs also depend on the files on disk"""
+        files = [self.__mesh_filename] + list(self.__model_filenames)
+        files = tuple(_helpers.file_fingerprint(f) for f in files)
+        return (AlgorithmBase._memo_fingerprint(self), files)
+
     def __update_time_steps(self):
         """For internal use only"""
         if len(self.__model_filenames) > 0:
@@ -494,6 +1254,7 @@ class TwoFileReaderBase(AlgorithmBase):
 class WriterBase(AlgorithmBase):
     __displayname__ = 'Writer Base'
     __category__ = 'base'
+    _memo_state = ('_WriterBase__blockfilenames', '_WriterBase__composite')
 
     def __init__(self, nInputPorts=1, inputType='vtkPolyData', **kwargs):
         AlgorithmBase.__init__(
@@ -605,7 +1366,7 @@ class WriterBase(AlgorithmBase):
         composite data sets.
         """
         inp = self.GetInputData(inInfo, 0, 0)
-        if isinstance(inp, vtk.vtkMultiBlockDataSet):
+        if isinstance(inp, _vtk.vtkMultiBlockDataSet):
             self.__composite = True
         # Handle composite datasets. NOTE: This only handles vtkMultiBlockDataSet
         if self.__composite:
@@ -613,7 +1374,7 @@ class WriterBase(AlgorithmBase):
             self.set_block_filenames(num)
             for i in range(num):
                 data = inp.GetBlock(i)
-                name = inp.GetMetaData(i).Get(vtk.vtkCompositeDataSet.NAME())
+                name = inp.GetMetaData(i).Get(_vtk.vtkCompositeDataSet.NAME())
                 if data.IsTypeOf(self.InputType):
                     self.perform_write_out(data, self.get_block_filename(i), name)
                 else:
@@ -694,6 +1455,11 @@ class InterfacedBaseReader(ReaderBase):
         # Get output:
         output = self.GetOutputData(outInfo, 0)
         output.ShallowCopy(self._get_object_at_index(idx=i))
+        # Structured outputs only hold the requested extent
+        if hasattr(output, 'GetExtent'):
+            ext = _helpers.get_update_extent(outInfo)
+            if ext != tuple(output.GetExtent()):
+                output.Crop(ext)
         return 1
 
     def RequestInformation(self, request, inInfo, outInfo):
@@ -705,7 +1471,9 @@ class InterfacedBaseReader(ReaderBase):
         obj = self.__objects[0]  # Get first grid to set output extents
         # Set WHOLE_EXTENT: This is absolutely necessary
         ext = obj.GetExtent()
-        info.Set(vtk.vtkStreamingDemandDrivenPipeline.WHOLE_EXTENT(), ext, 6)
+        info.Set(_vtk.vtkStreamingDemandDrivenPipeline.WHOLE_EXTENT(), ext, 6)
+        if hasattr(obj, 'GetExtent'):
+            _helpers.set_can_produce_sub_extent(outInfo)
         return 1
 
 
@@ -9,10 +9,9 @@ __displayname__ = 'Math Operations'
 
 import numpy as np
 import pyvista as pv
-import vtk
-from vtk.numpy_interface import dataset_adapter as dsa
 
-from .. import _helpers, interface
+from .. import _helpers, _vtk, interface
+from .._vtk import dsa
 from ..base import FilterBase, FilterPreserveTypeBase
 
 ###############################################################################
@@ -45,7 +44,7 @@ class ArrayMath(FilterPreserveTypeBase):
     __category__ = 'filter'
 
     def __init__(self, **kwargs):
-        FilterPreserveTypeBase.__init__(self)
+        FilterPreserveTypeBase.__init__(self, **kwargs)
         # Parameters:
         self.__multiplier = kwargs.get('multiplier', 1.0)
         self.__new_name = kwargs.get('new_name', 'Mathed Up')
@@ -144,7 +143,7 @@ class ArrayMath(FilterPreserveTypeBase):
         # Convert to a VTK array
         c = interface.convert_array(carr, name=new_name)
         # Build output
-        pdo.DeepCopy(pdi)
+        self._copy_input(pdi, pdo)
         pdo = _helpers.add_array(pdo, field1, c)
         return pdo
 
@@ -288,7 +287,7 @@ class NormalizeArray(FilterPreserveTypeBase):
     __category__ = 'filter'
 
     def __init__(self, **kwargs):
-        FilterPreserveTypeBase.__init__(self)
+        FilterPreserveTypeBase.__init__(self, **kwargs)
         # Parameters:
         self.__multiplier = kwargs.get('multiplier', 1.0)
         self.__new_name = kwargs.get('new_name', 'Normalized')
@@ -406,7 +405,7 @@ class NormalizeArray(FilterPreserveTypeBase):
         # Convert to VTK array
         c = interface.convert_array(arr, name=new_name)
         # Build output
-        pdo.DeepCopy(pdi)
+        self._copy_input(pdi, pdo)
         pdo = _helpers.add_array(pdo, field, c)
         return pdo
 
@@ -524,17 +523,22 @@ class PercentThreshold(FilterBase):
         if percent < 1.0:
             percent *= 100
         self.__percent = percent  # NOTE: not decimal percent
-        self.__filter = vtk.vtkThreshold()
+        self.__continuous_cell_range = False
         self.__input_array = [None, None]
 
     def RequestData(self, request, inInfo, outInfo):
         """Used by pipeline for execution"""
         # Get input/output of Proxy
         pdi = self.GetInputData(inInfo, 0, 0)
-        self.__filter.SetInputDataObject(pdi)
         pdo = self.GetOutputData(outInfo, 0)
+        # A threshold filter for each execution so that the blocks of a
+        # composite input can be run in parallel
+        thresh = _vtk.vtkThreshold()
+        thresh.SetInputDataObject(pdi)
+        thresh.SetUseContinuousCellRange(self.__continuous_cell_range)
         # Get Input Array
         field, name = self.__input_array[0], self.__input_array[1]
+        thresh.SetInputArrayToProcess(0, 0, 0, field, name)
         wpdi = dsa.WrapDataObject(pdi)
         arr = _helpers.get_numpy_array(wpdi, field, name)
 
@@ -542,19 +546,19 @@ class PercentThreshold(FilterBase):
         val = dmin + (self.__percent / 100.0) * (dmax - dmin)
 
         if self.__invert:
-            if hasattr(self.__filter, 'SetLowerThreshold'):
-                self.__filter.SetLowerThreshold(val)
+            if hasattr(thresh, 'SetLowerThreshold'):
+                thresh.SetLowerThreshold(val)
             else:
-                self.__filter.ThresholdByLower(val)
+                thresh.ThresholdByLower(val)
         else:
-            if hasattr(self.__filter, 'SetUpperThreshold'):
-                self.__filter.SetUpperThreshold(val)
+            if hasattr(thresh, 'SetUpperThreshold'):
+                thresh.SetUpperThreshold(val)
             else:
-                self.__filter.ThresholdByUpper(val)
+                thresh.ThresholdByUpper(val)
 
-        self.__filter.Update()
+        thresh.Update()
 
-        filt = self.__filter.GetOutputDataObject(0)
+        filt = thresh.GetOutputDataObject(0)
 
         pdo.ShallowCopy(filt)
         return 1
@@ -573,7 +577,6 @@ class PercentThreshold(FilterBase):
         if self.__input_array[0] != field or self.__input_array[1] != name:
             self.__input_array[0] = field
             self.__input_array[1] = name
-            self.__filter.SetInputArrayToProcess(idx, port, connection, field, name)
             self.Modified()
         return 1
 
@@ -590,7 +593,9 @@ class PercentThreshold(FilterBase):
         interval [minimum cell scalar, maxmimum cell scalar] to intersect
         the threshold bound , rather than the set of discrete scalar
         values from the vertices"""
-        return self.__filter.SetUseContinuousCellRange(flag)
+        if self.__continuous_cell_range != flag:
+            self.__continuous_cell_range = flag
+            self.Modified()
 
     def set_invert(self, flag):
         """Use to invert the threshold filter"""
@@ -625,7 +630,6 @@ class ArraysToRGBA(FilterPreserveTypeBase):
         self.__g_array = [None, None]
         self.__b_array = [None, None]
         self.__a_array = [None, None]
-        self.__field = None
         self.__mask = -9999
 
     def _get_arrays(self, wpdi):
@@ -644,7 +648,6 @@ class ArraysToRGBA(FilterPreserveTypeBase):
         a_arr = _helpers.get_numpy_array(wpdi, fielda, name)
         if fieldr != fieldg != fieldb:  # != fielda
             raise _helpers.PVGeoError('Data arrays must be of the same field.')
-        self.__field = fieldr
         return r_arr, g_arr, b_arr, a_arr
 
     def _mask_arrays(self, r_arr, g_arr, b_arr, a_arr):
@@ -681,9 +684,9 @@ class ArraysToRGBA(FilterPreserveTypeBase):
         colors = interface.convert_array(col, name='Colors')
 
         # Set the output
-        pdo.DeepCopy(pdi)
-        # Add new color array
-        _helpers.add_array(pdo, self.__field, colors)
+        self._copy_input(pdi, pdo)
+        # Add new color array to the field of the color arrays
+        _helpers.add_array(pdo, self.__r_array[0], colors)
         return 1
 
     #### Setters and Getters ####
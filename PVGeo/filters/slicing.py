@@ -9,10 +9,9 @@ __displayname__ = 'Slicing'
 
 import numpy as np
 import pyvista as pv
-import vtk
-from vtk.numpy_interface import dataset_adapter as dsa
 
-from .. import _helpers
+from .. import _helpers, _vtk
+from .._vtk import dsa
 from ..base import FilterBase
 
 
@@ -49,7 +48,7 @@ class _SliceBase(FilterBase):
     def _generate_plane(origin, normal):
         """Internal helper to build a ``vtkPlane`` for the cutter"""
         # Get the slicing Plane:
-        plane = vtk.vtkPlane()  # Construct the plane object
+        plane = _vtk.vtkPlane()  # Construct the plane object
         # Set the origin... needs to be inside of the grid
         plane.SetOrigin(origin[0], origin[1], origin[2])
         # set normal of that plane so we look at XZ section
@@ -60,7 +59,7 @@ class _SliceBase(FilterBase):
     def _slice(pdi, pdo, plane):
         """Slice an input on a plane and produce the output"""
         # create slice
-        cutter = vtk.vtkCutter()  # Construct the cutter object
+        cutter = _vtk.vtkCutter()  # Construct the cutter object
         cutter.SetInputData(pdi)  # Use the grid as the data we desire to cut
         cutter.SetCutFunction(plane)  # the the cutter to use the plane we made
         cutter.Update()  # Perform the Cut
@@ -161,11 +160,11 @@ class ManySlicesAlongPoints(_SliceBase):
         output.SetNumberOfBlocks(self.get_number_of_slices())
         blk = 0
         for i, plane in enumerate(planes):
-            temp = vtk.vtkPolyData()
+            temp = _vtk.vtkPolyData()
             self._slice(data, temp, plane)
             output.SetBlock(blk, temp)
             output.GetMetaData(blk).Set(
-                vtk.vtkCompositeDataSet.NAME(), 'Slice%.2d' % blk
+                _vtk.vtkCompositeDataSet.NAME(), 'Slice%.2d' % blk
             )
             blk += 1
         return output
@@ -175,7 +174,7 @@ class ManySlicesAlongPoints(_SliceBase):
         # Get input/output of Proxy
         pts = self.GetInputData(inInfo, 0, 0)  # Port 0: points
         data = self.GetInputData(inInfo, 1, 0)  # Port 1: sliceable data
-        output = vtk.vtkMultiBlockDataSet.GetData(outInfo, 0)
+        output = _vtk.vtkMultiBlockDataSet.GetData(outInfo, 0)
         # Perform task
         planes = self._get_planes(pts)
         self._get_slice(pts, data, planes, output)
@@ -216,6 +215,8 @@ class SlideSliceAlongPoints(ManySlicesAlongPoints):
 
     __displayname__ = 'Slide Slice Along Points'
     __category__ = 'filter'
+    # Holds state from its last execution
+    _parallel_blocks = False
 
     def __init__(self, n_slices=5, nearest_nbr=True):
         ManySlicesAlongPoints.__init__(self, outputType='vtkPolyData')
@@ -224,7 +225,7 @@ class SlideSliceAlongPoints(ManySlicesAlongPoints):
 
     def _get_slice(self, pts, data, planes, output):
         """Internal helper to perform the filter"""
-        if not isinstance(planes, vtk.vtkPlane):
+        if not isinstance(planes, _vtk.vtkPlane):
             raise _helpers.PVGeoError('``_get_slice`` can only handle one plane.')
         # numPoints = pts.GetNumberOfPoints()
         # Set number of blocks based on user choice in the selection
@@ -236,7 +237,7 @@ class SlideSliceAlongPoints(ManySlicesAlongPoints):
         # Get input/output of Proxy
         pts = self.GetInputData(inInfo, 0, 0)  # Port 0: points
         data = self.GetInputData(inInfo, 1, 0)  # Port 1: sliceable data
-        output = vtk.vtkPolyData.GetData(outInfo, 0)
+        output = _vtk.vtkPolyData.GetData(outInfo, 0)
         # Perform task
         if self.__planes is None or len(self.__planes) < 1:
             self.set_number_of_slices(pts.GetNumberOfPoints())
@@ -283,6 +284,9 @@ class ManySlicesAlongAxis(_SliceBase):
 
     __displayname__ = 'Many Slices Along Axis'
     __category__ = 'filter'
+    _memo_state = ('_ManySlicesAlongAxis__rng',)
+    # Holds state from its last execution
+    _parallel_blocks = False
 
     def __init__(
         self, n_slices=5, axis=0, rng=None, pad=0.01, outputType='vtkMultiBlockDataSet'
@@ -344,7 +348,7 @@ class ManySlicesAlongAxis(_SliceBase):
         pdi = self.GetInputData(inInfo, 0, 0)
         # Get output:
         # output = self.GetOutputData(outInfo, 0)
-        output = vtk.vtkMultiBlockDataSet.GetData(outInfo, 0)
+        output = _vtk.vtkMultiBlockDataSet.GetData(outInfo, 0)
         self._set_axial_range(pdi)
         normal = self.get_normal()
         # Perform task
@@ -352,13 +356,13 @@ class ManySlicesAlongAxis(_SliceBase):
         output.SetNumberOfBlocks(self.get_number_of_slices())
         blk = 0
         for i in range(self.get_number_of_slices()):
-            temp = vtk.vtkPolyData()
+            temp = _vtk.vtkPolyData()
             origin = self._get_origin(pdi, i)
             plane = self._generate_plane(origin, normal)
             # Perform slice for that index
             self._slice(pdi, temp, plane)
             output.SetBlock(blk, temp)
-            output.GetMetaData(blk).Set(vtk.vtkCompositeDataSet.NAME(), 'Slice%.2d' % i)
+            output.GetMetaData(blk).Set(_vtk.vtkCompositeDataSet.NAME(), 'Slice%.2d' % i)
             blk += 1
 
         return 1
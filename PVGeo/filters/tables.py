@@ -10,10 +10,9 @@ __displayname__ = 'Table Operations'
 
 import numpy as np
 import pyvista as pv
-import vtk
-from vtk.numpy_interface import dataset_adapter as dsa
 
-from .. import _helpers, interface
+from .. import _helpers, _vtk, interface
+from .._vtk import dsa
 from ..base import FilterBase, FilterPreserveTypeBase
 
 ###############################################################################
@@ -30,13 +29,14 @@ class CombineTables(FilterBase):
     __displayname__ = 'Combine Tables'
     __category__ = 'filter'
 
-    def __init__(self):
+    def __init__(self, **kwargs):
         FilterBase.__init__(
             self,
             nInputPorts=2,
             inputType='vtkTable',
             nOutputPorts=1,
             outputType='vtkTable',
+            **kwargs
         )
         # Parameters... none
 
@@ -54,7 +54,7 @@ class CombineTables(FilterBase):
         pdi1 = self.GetInputData(inInfo, 1, 0)
         pdo = self.GetOutputData(outInfo, 0)
 
-        pdo.DeepCopy(pdi0)
+        self._copy_input(pdi0, pdo)
 
         # Get number of rows
         nrows = pdi0.GetNumberOfRows()
@@ -88,6 +88,8 @@ class ReshapeTable(FilterBase):
 
     __displayname__ = 'Reshape Table'
     __category__ = 'filter'
+    # Holds state from its last execution
+    _parallel_blocks = False
 
     def __init__(self, **kwargs):
         FilterBase.__init__(
@@ -110,18 +112,16 @@ class ReshapeTable(FilterBase):
         # Get number of rows
         rows = pdi.GetColumn(0).GetNumberOfTuples()
 
-        if len(self.__names) != 0:
-            num = len(self.__names)
-            if num < self.__ncols:
-                for i in range(num, self.__ncols):
-                    self.__names.append('Field %d' % i)
-            elif num > self.__ncols:
-                raise _helpers.PVGeoError(
-                    'Too many array names. `ncols` specified as %d and %d names given.'
-                    % (self.__ncols, num)
-                )
-        else:
-            self.__names = ['Field %d' % i for i in range(self.__ncols)]
+        # Name any columns without a given name
+        names = list(self.__names)
+        num = len(names)
+        if num > self.__ncols:
+            raise _helpers.PVGeoError(
+                'Too many array names. `ncols` specified as %d and %d names given.'
+                % (self.__ncols, num)
+            )
+        for i in range(num, self.__ncols):
+            names.append('Field %d' % i)
 
         # Make a 2D numpy array and fill with data from input table
         data = np.empty((rows, cols))
@@ -149,8 +149,8 @@ class ReshapeTable(FilterBase):
             # allow type to be determined by input
             # VTK arrays need a name. Set arbitrarily
             insert = interface.convert_array(
-                col, name=self.__names[i]
-            )  # array_type=vtk.VTK_FLOAT
+                col, name=names[i]
+            )  # array_type=_vtk.VTK_FLOAT
             # pdo.AddColumn(insert) # these are not getting added to the output table
             # ... work around:
             pdo.GetRowData().AddArray(insert)  # NOTE: this is in the FieldData
@@ -305,7 +305,7 @@ class SplitTableOnArray(FilterBase):
         # Get input/output of Proxy
         table = self.GetInputData(inInfo, 0, 0)
         # Get number of points
-        output = vtk.vtkMultiBlockDataSet.GetData(outInfo, 0)
+        output = _vtk.vtkMultiBlockDataSet.GetData(outInfo, 0)
         #### Perform task ####
         # Get input array
         field, name = self.__input_array[0], self.__input_array[1]
@@ -320,7 +320,7 @@ class SplitTableOnArray(FilterBase):
             temp = interface.data_frame_to_table(df[df[name] == val])
             output.SetBlock(blk, temp)
             output.GetMetaData(blk).Set(
-                vtk.vtkCompositeDataSet.NAME(), '{}{}'.format(name, val)
+                _vtk.vtkCompositeDataSet.NAME(), '{}{}'.format(name, val)
             )
             blk += 1
 
@@ -370,8 +370,8 @@ class AppendTableToCellData(FilterPreserveTypeBase):
     __displayname__ = 'Append Table to Cell Data'
     __category__ = 'filter'
 
-    def __init__(self):
-        FilterPreserveTypeBase.__init__(self, nInputPorts=2)
+    def __init__(self, **kwargs):
+        FilterPreserveTypeBase.__init__(self, nInputPorts=2, **kwargs)
         self._preserve_port = 0  # ensure port 0's type is preserved
         self.__timesteps = None
 
@@ -390,7 +390,7 @@ class AppendTableToCellData(FilterPreserveTypeBase):
         table = self.GetInputData(inInfo, 1, 0)  # add my data to the input
         pdo = self.GetOutputData(outInfo, 0)  # The output
 
-        pdo.DeepCopy(pdi0)
+        self._copy_input(pdi0, pdo)
 
         # Get number of rows
         nrows = table.GetNumberOfRows()
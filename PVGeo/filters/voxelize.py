@@ -11,11 +11,9 @@ __all__ = [
 __displayname__ = 'Voxelize'
 
 import numpy as np
-import vtk
-from vtk.numpy_interface import dataset_adapter as dsa
-from vtk.util import numpy_support as nps
 
-from .. import _helpers, interface
+from .. import _helpers, _vtk, interface
+from .._vtk import dsa
 from ..base import FilterBase
 from .xyz import RotationTool
 
@@ -38,6 +36,7 @@ class VoxelizePoints(FilterBase):
             inputType='vtkPointSet',
             nOutputPorts=1,
             outputType='vtkUnstructuredGrid',
+            **kwargs
         )
         self.__dx = kwargs.get('dx', None)
         self.__dy = kwargs.get('dy', None)
@@ -48,19 +47,23 @@ class VoxelizePoints(FilterBase):
         self.__tolerance = kwargs.get('tolerance', None)
         self.__angle = kwargs.get('angle', 0.0)
 
-    def add_field_data(self, grid):
+    def add_field_data(self, grid, angle=None, spacing=None):
         """An internal helper to add the recovered information as field data"""
+        if angle is None:
+            angle = self.__angle
+        if spacing is None:
+            spacing = (self.__dx, self.__dy, self.__dz)
         # Add angle
-        a = vtk.vtkDoubleArray()
+        a = _vtk.vtkDoubleArray()
         a.SetName('Recovered Angle (Deg.)')
         a.SetNumberOfValues(1)
-        a.SetValue(0, np.rad2deg(self.__angle))
+        a.SetValue(0, np.rad2deg(angle))
         grid.GetFieldData().AddArray(a)
         # Add cell sizes
-        s = vtk.vtkDoubleArray()
+        s = _vtk.vtkDoubleArray()
         s.SetName('Recovered Cell Sizes')
         s.SetNumberOfComponents(3)
-        s.InsertNextTuple3(self.__dx, self.__dy, self.__dz)
+        s.InsertNextTuple3(*spacing)
         grid.GetFieldData().AddArray(s)
         return grid
 
@@ -75,6 +78,16 @@ class VoxelizePoints(FilterBase):
         """This assumes that the input points make up some sort of uniformly
         spaced grid on at least an XY plane.
         """
+        xr, yr, zr, dx, dy, dz, angle = self._estimate_uniform_spacing(x, y, z)
+        self.__dx, self.__dy, self.__dz, self.__angle = dx, dy, dz, angle
+        return xr, yr, zr
+
+    def _estimate_uniform_spacing(self, x, y, z):
+        """Estimate the spacings and rotation without changing this filter.
+
+        Return:
+            tuple : the rotated coordinates, the spacings, and the angle
+        """
         # TODO: implement ability to rotate around Z axis (think PoroTomo vs UTM)
         # TODO: implement way to estimate rotation
         if not (len(x) == len(y) == len(z)):
@@ -88,30 +101,28 @@ class VoxelizePoints(FilterBase):
 
         r = RotationTool()
         xr, yr, zr, dx, dy, angle = r.estimate_and_rotate(x, y, z)
-        self.__angle = angle
         uz = np.diff(np.unique(z))
         if len(uz) > 0:
             dz = np.average(uz)
         else:
             dz = self.__safe
-        self.__dx = dx
-        self.__dy = dy
-        self.__dz = dz
-        return xr, yr, zr
+        return xr, yr, zr, dx, dy, dz, angle
 
-    def points_to_grid(self, xo, yo, zo, dx, dy, dz, grid=None):
-        """Convert XYZ points to a ``vtkUnstructuredGrid``."""
+    def points_to_grid(self, xo, yo, zo, dx, dy, dz, grid=None, angle=None):
+        """Convert XYZ points to a ``vtkUnstructuredGrid``. The spacings and
+        angle recovered when estimating the grid are added to its field data
+        and are not held by this filter (blocks may be run in parallel)."""
         if grid is None:
-            grid = vtk.vtkUnstructuredGrid()
+            grid = _vtk.vtkUnstructuredGrid()
 
         # TODO: Check dtypes on all arrays. Need to be floats
 
         if self.__estimate_grid:
-            x, y, z = self.estimate_uniform_spacing(xo, yo, zo)
+            x, y, z, dx, dy, dz, angle = self._estimate_uniform_spacing(xo, yo, zo)
         else:
             x, y, z = xo, yo, zo
-
-        dx, dy, dz = self.__dx, self.__dy, self.__dz
+            if angle is None:
+                angle = self.__angle
         if isinstance(dx, np.ndarray) and len(dx) != len(x):
             raise _helpers.PVGeoError(
                 'X-Cell spacings are not properly defined for all points.'
@@ -144,8 +155,7 @@ class VoxelizePoints(FilterBase):
             (c_n1, c_n2, c_n3, c_n4, c_n5, c_n6, c_n7, c_n8), axis=0
         )
 
-        pts = vtk.vtkPoints()
-        cells = vtk.vtkCellArray()
+        pts = _vtk.vtkPoints()
 
         if self.__unique:
             # Search for unique nodes and use the min cell size as the tolerance
@@ -162,9 +172,9 @@ class VoxelizePoints(FilterBase):
         else:
             ind_nodes = np.arange(0, len(all_nodes), dtype=int)
 
-        all_nodes[:, 0:2] = RotationTool.rotate(all_nodes[:, 0:2], -self.__angle)
+        all_nodes[:, 0:2] = RotationTool.rotate(all_nodes[:, 0:2], -angle)
         if self.__estimate_grid:
-            self.add_field_data(grid)
+            self.add_field_data(grid, angle=angle, spacing=(dx, dy, dz))
         # Add unique nodes as points in output
         pts.SetData(interface.convert_array(all_nodes))
 
@@ -172,20 +182,11 @@ class VoxelizePoints(FilterBase):
         j = np.multiply(np.tile(np.arange(0, 8, 1), n_cells), n_cells)
         arridx = np.add(j, np.repeat(np.arange(0, n_cells, 1, dtype=int), 8))
         ids = ind_nodes[arridx].reshape((n_cells, 8))
-
-        cells_mat = np.concatenate(
-            (np.ones((ids.shape[0], 1), dtype=np.int_) * ids.shape[1], ids), axis=1
-        ).ravel()
-
-        cells = vtk.vtkCellArray()
-        cells.SetNumberOfCells(n_cells)
-        cells.SetCells(
-            n_cells, nps.numpy_to_vtk(cells_mat, deep=True, array_type=vtk.VTK_ID_TYPE)
-        )
+        cells = interface.build_cell_array(ids)
 
         # Set the output
         grid.SetPoints(pts)
-        grid.SetCells(vtk.VTK_VOXEL, cells)
+        grid.SetCells(_vtk.VTK_VOXEL, cells)
         return grid
 
     @staticmethod
@@ -284,9 +285,13 @@ class VoxelizePoints(FilterBase):
         Args:
             degrees (bool): A flag on to return decimal degrees or radians.
         """
+        angle = self.__angle
+        recovered = self.__get_recovered()
+        if recovered is not None:
+            angle = np.deg2rad(recovered[0])
         if degrees:
-            return np.rad2deg(self.__angle)
-        return self.__angle
+            return np.rad2deg(angle)
+        return angle
 
     def get_recovered_angle(self, degrees=True):
         """DEPRECATED: use `get_angle`"""
@@ -299,8 +304,30 @@ class VoxelizePoints(FilterBase):
             self.Modified()
 
     def get_spacing(self):
-        """Get the cell spacings"""
+        """Get the cell spacings. These are the recovered spacings if set to
+        recover the input grid."""
+        recovered = self.__get_recovered()
+        if recovered is not None:
+            return recovered[1]
         return (self.__dx, self.__dy, self.__dz)
 
+    def __get_recovered(self):
+        """Internal helper to get the angle (in degrees) and spacings recovered
+        for the output (its last block for a composite output) if any"""
+        if not self.__estimate_grid:
+            return None
+        output = self.GetOutputDataObject(0)
+        if isinstance(output, _vtk.vtkCompositeDataSet):
+            blocks = _helpers.get_leaf_blocks(output)
+            if not blocks:
+                return None
+            output = blocks[-1]
+        fd = output.GetFieldData()
+        angle = fd.GetArray('Recovered Angle (Deg.)')
+        spacing = fd.GetArray('Recovered Cell Sizes')
+        if angle is None or spacing is None:
+            return None
+        return angle.GetValue(0), spacing.GetTuple3(0)
+
 
 ###############################################################################
@@ -18,10 +18,9 @@ from datetime import datetime
 
 import numpy as np
 import pyvista
-import vtk
-from vtk.numpy_interface import dataset_adapter as dsa
 
-from .. import _helpers, interface
+from .. import _helpers, _vtk, interface
+from .._vtk import dsa
 from ..base import FilterBase, FilterPreserveTypeBase
 
 # improt CreateTensorMesh for its cell string parsing
@@ -61,7 +60,7 @@ class AddCellConnToPoints(FilterBase):
             outputType='vtkPolyData',
         )
         # Parameters
-        self.__cell_type = kwargs.get('cell_type', vtk.VTK_POLY_LINE)
+        self.__cell_type = kwargs.get('cell_type', _vtk.VTK_POLY_LINE)
         self.__usenbr = kwargs.get('nearest_nbr', False)
         self.__close_loop = kwargs.get('close_loop', False)
         self.__keep_vertices = kwargs.get('keep_vertices', False)
@@ -113,31 +112,13 @@ class AddCellConnToPoints(FilterBase):
         else:
             poly = pyvista.PolyData()
             poly.points = np.copy(points)
-        if cell_type == vtk.VTK_LINE:
-            lines = np.c_[np.full(len(ind) - 1, 2), ind[0:-1], ind[1:]]
-            if self.__close_loop:
-                app = np.append(
-                    lines,
-                    [
-                        [2, ind[-1], ind[0]],
-                    ],
-                    axis=0,
-                )
-                lines = app
-            poly.lines = lines
-        elif cell_type == vtk.VTK_POLY_LINE:
-            cells = vtk.vtkCellArray()
-            cell = vtk.vtkPolyLine()
-            if self.__close_loop:
-                cell.GetPointIds().SetNumberOfIds(len(ind) + 1)
-            else:
-                cell.GetPointIds().SetNumberOfIds(len(ind))
-            for i in ind:
-                cell.GetPointIds().SetId(i, ind[i])
-            if self.__close_loop:
-                cell.GetPointIds().SetId(i + 1, ind[0])
-            cells.InsertNextCell(cell)
-            poly.SetLines(cells)
+        if self.__close_loop:
+            ind = np.append(ind, ind[0])
+        if cell_type == _vtk.VTK_LINE:
+            lines = np.c_[ind[0:-1], ind[1:]]
+            poly.SetLines(interface.build_cell_array(lines))
+        elif cell_type == _vtk.VTK_POLY_LINE:
+            poly.SetLines(interface.build_cell_array(ind, offsets=[0, len(ind)]))
         else:
             raise _helpers.PVGeoError('Cell type ({}) not supported'.format(cell_type))
         for key, val in pdi.point_data.items():
@@ -194,7 +175,7 @@ class PointsToTube(AddCellConnToPoints):
     def __init__(self, num_sides=20, radius=10.0, capping=False, **kwargs):
         AddCellConnToPoints.__init__(self, **kwargs)
         # Additional Parameters
-        # NOTE: CellType should remain vtk.VTK_POLY_LINE (4) connection
+        # NOTE: CellType should remain _vtk.VTK_POLY_LINE (4) connection
         self.__numSides = num_sides
         self.__radius = radius
         self.__capping = capping
@@ -202,7 +183,7 @@ class PointsToTube(AddCellConnToPoints):
     def _connect_cells(self, pdi, pdo, log_time=False):
         """This uses the parent's ``_connect_cells()`` to build a tube around"""
         AddCellConnToPoints._connect_cells(self, pdi, pdo, log_time=log_time)
-        tube = vtk.vtkTubeFilter()
+        tube = _vtk.vtkTubeFilter()
         tube.SetInputData(pdo)
         # User Defined Parameters
         tube.SetCapping(self.__capping)
@@ -688,7 +669,7 @@ class ExtractPoints(FilterBase):
             wpdi.Points
         )  # New NumPy array of points so we dont destroy input
         # Now transfer data
-        f = vtk.vtkCellDataToPointData()
+        f = _vtk.vtkCellDataToPointData()
         f.SetInputData(pdi)
         f.Update()
         d = f.GetOutput()
@@ -716,7 +697,7 @@ class ExtractCellCenters(FilterBase):
         pdi = self.GetInputData(inInfo, 0, 0)
         pdo = self.GetOutputData(outInfo, 0)
         # Find cell centers
-        filt = vtk.vtkCellCenters()
+        filt = _vtk.vtkCellCenters()
         filt.SetInputDataObject(pdi)
         filt.Update()
 
@@ -745,7 +726,7 @@ class AppendCellCenters(FilterPreserveTypeBase):
         pdi = self.GetInputData(inInfo, 0, 0)
         pdo = self.GetOutputData(outInfo, 0)
         # Find cell centers
-        filt = vtk.vtkCellCenters()
+        filt = _vtk.vtkCellCenters()
         filt.SetInputDataObject(pdi)
         filt.Update()
 
@@ -766,6 +747,8 @@ class IterateOverPoints(FilterBase):
 
     __displayname__ = 'Iterate Over Points'
     __category__ = 'filter'
+    # Holds state from its last execution
+    _parallel_blocks = False
 
     def __init__(self, dt=1.0):
         FilterBase.__init__(
@@ -895,8 +878,8 @@ class ConvertUnits(FilterPreserveTypeBase):
         # Get number of points
         pdo = self.GetOutputData(outInfo, 0)
         #### Perform task ####
-        filt = vtk.vtkTransformFilter()
-        trans = vtk.vtkTransform()
+        filt = _vtk.vtkTransformFilter()
+        trans = _vtk.vtkTransform()
         trans.Scale(self.get_conversion(), self.get_conversion(), self.get_conversion())
         filt.SetTransform(trans)
         filt.SetInputDataObject(pdi)
@@ -4,9 +4,8 @@ __all__ = [
 
 import omf
 import omfvista
-import vtk
 
-from .. import _helpers
+from .. import _helpers, _vtk
 from ..base import ReaderBaseBase
 
 
@@ -21,7 +20,7 @@ class OMFReader(ReaderBaseBase):
     def __init__(self):
         ReaderBaseBase.__init__(self, nOutputPorts=1, outputType='vtkMultiBlockDataSet')
         # Properties:
-        self._dataselection = vtk.vtkDataArraySelection()
+        self._dataselection = _vtk.vtkDataArraySelection()
         self._dataselection.AddObserver(
             "ModifiedEvent", _helpers.create_modified_callback(self)
         )
@@ -69,13 +68,25 @@ class OMFReader(ReaderBaseBase):
                 data[e.name] = self.__data[e.name]
         return data
 
+    def _get_memory_items(self):
+        """The converted elements are held"""
+        return ReaderBaseBase._get_memory_items(self) + [self.__data]
+
+    def _release_memory(self):
+        """Drop the converted elements and convert them again on demand. The
+        project itself is kept."""
+        ReaderBaseBase._release_memory(self)
+        self.__data = dict()
+        if self.__project is not None:
+            self.need_to_read(flag=False)
+
     #### pipeline methods ####
 
     def RequestData(self, request, inInfo, outInfo):
         """Used by pipeline to get data for current timestep and populate the output data object."""
         # Get output:
         # output = self.GetOutputData(outInfo, 0)
-        output = vtk.vtkMultiBlockDataSet.GetData(outInfo, 0)
+        output = _vtk.vtkMultiBlockDataSet.GetData(outInfo, 0)
         # Perform the read
         if self.need_to_read():
             self._read_up_front()
@@ -87,7 +98,7 @@ class OMFReader(ReaderBaseBase):
         keys = data.keys()
         for name in keys:
             output.SetBlock(blk, data[name])
-            output.GetMetaData(blk).Set(vtk.vtkCompositeDataSet.NAME(), name)
+            output.GetMetaData(blk).Set(_vtk.vtkCompositeDataSet.NAME(), name)
             blk += 1
         return 1
 
@@ -1,6 +1,24 @@
 # flake8: noqa: F401
-from .fileio import *
 from .subset import *
 from .transform import *
 
 __displayname__ = 'Grid Tools'
+
+# The file I/O tools depend on ``properties`` and ``espatools`` so these are
+# loaded on first access
+from .._lazy import attach as _attach
+
+__getattr__, __dir__ = _attach(
+    __name__,
+    submodules=['fileio'],
+    attributes={
+        'SurferGridReader': 'fileio',
+        'WriteImageDataToSurfer': 'fileio',
+        'EsriGridReader': 'fileio',
+        'LandsatReader': 'fileio',
+        'WriteCellCenterData': 'fileio',
+    },
+)
+
+# Names exported by ``from PVGeo.grids import *`` (this loads ``fileio``)
+__all__ = [name for name in __dir__() if not name.startswith('_')]
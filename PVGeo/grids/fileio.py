@@ -15,15 +15,13 @@ __displayname__ = 'File I/O'
 from struct import unpack
 import warnings
 
-import espatools
 import numpy as np
 import pandas as pd
 import properties
 import pyvista as pv
-import vtk
-from vtk.numpy_interface import dataset_adapter as dsa
 
-from .. import _helpers, interface
+from .. import _helpers, _vtk, interface
+from .._vtk import dsa
 from ..base import ReaderBase, ReaderBaseBase, WriterBase
 from ..readers import DelimitedTextReader
 
@@ -59,17 +57,24 @@ class GridInfo(properties.HasProperties):
         self.data = data
         return
 
-    def to_vtk(self, output=None, z=0.0, dz=1.0, data_name='Data'):
-        """Convert to a ``vtkImageData`` object"""
+    def to_vtk(self, output=None, z=0.0, dz=1.0, data_name='Data', extent=None):
+        """Convert to a ``vtkImageData`` object. Give an ``extent`` to only
+        convert that part of the grid."""
         self.mask()
         self.validate()
         if output is None:
-            output = vtk.vtkImageData()
+            output = _vtk.vtkImageData()
         # Build the data object
         output.SetOrigin(self.xll, self.yll, z)
         output.SetSpacing(self.dx, self.dy, dz)
-        output.SetDimensions(self.nx, self.ny, 1)
-        vtkarr = interface.convert_array(self.data, name=data_name)
+        whole = (0, self.nx - 1, 0, self.ny - 1, 0, 0)
+        data = self.data
+        if extent is None or tuple(extent) == whole:
+            output.SetDimensions(self.nx, self.ny, 1)
+        else:
+            output.SetExtent(extent)
+            data = data[_helpers.extent_indices(whole, extent)]
+        vtkarr = interface.convert_array(data, name=data_name)
         output.GetPointData().AddArray(vtkarr)
         return output
 
@@ -108,6 +113,7 @@ class SurferGridReader(ReaderBase):
     __category__ = 'reader'
     extensions = 'grd GRD'
     description = 'PVGeo: Surfer Grid'
+    _memo_state = ('_SurferGridReader__grids',)
 
     def __init__(self, outputType='vtkImageData', **kwargs):
         ReaderBase.__init__(self, outputType=outputType, **kwargs)
@@ -273,10 +279,11 @@ class SurferGridReader(ReaderBase):
         """This parses the first file to determine grid file type then reads
         all files set."""
         if idx is not None:
-            filenames = [self.get_file_names(idx=idx)]
-        else:
-            filenames = self.get_file_names()
-        contents = []
+            return self.__read_grid_files([self.get_file_names(idx=idx)])[0]
+        return self.__read_grid_files(self.get_file_names())
+
+    def __read_grid_files(self, filenames):
+        """Internal helper to read a list of grid files"""
         f = open(filenames[0], 'rb')
         key = unpack('4s', f.read(4))[0]
         f.close()
@@ -293,22 +300,49 @@ class SurferGridReader(ReaderBase):
                 % key
             )
 
-        for f in filenames:
+        def read(filename):
             try:
-                contents.append(reader(f))
+                return reader(filename)
             except (IOError, OSError) as fe:
                 raise _helpers.PVGeoError(str(fe))
-        if idx is not None:
-            return contents[0]
-        return contents
+
+        return self._map_files(read, filenames)
+
+    def _read_time_step(self, idx):
+        """Reads a single grid of the series when the reader is lazy"""
+        return self._read_grids(idx=idx)
 
     def _read_up_front(self):
         """Should not need to be overridden."""
-        # Perform Read
-        self.__grids = self._read_grids()
+        if self.get_lazy_read():
+            # Only read the first grid to set the output extents
+            self.__grids = None
+            self._clear_time_steps()
+            self._get_time_step(0)
+            self.need_to_read(flag=False)
+            return 1
+        # Perform Read: only files that changed since the last read are parsed
+        self.__grids = self._read_changed_files(
+            self.__read_grid_files, self.get_file_names()
+        )
         self.need_to_read(flag=False)
         return 1
 
+    def _get_memory_items(self):
+        """The grids of every file are held"""
+        return ReaderBase._get_memory_items(self) + [self.__grids]
+
+    def _release_memory(self):
+        """Drop the grids and read the files again on demand"""
+        ReaderBase._release_memory(self)
+        self.__grids = None
+
+    def _get_raw_data(self, idx=0):
+        """Get the ``GridInfo`` for the given timestep"""
+        if self.get_lazy_read():
+            return self._get_time_step(idx)
+        return self.__grids[idx]
+
     ########################
 
     def RequestData(self, request, inInfo, outInfo):
@@ -321,9 +355,10 @@ class SurferGridReader(ReaderBase):
             self._read_up_front()
         # Get requested time index
         i = _helpers.get_requested_time(self, outInfo)
-        # Build the output
-        grid = self.__grids[i]
-        grid.to_vtk(output=output, data_name=self.__data_name)
+        # Build the output for the requested extent only
+        grid = self._get_raw_data(idx=i)
+        ext = _helpers.get_update_extent(outInfo)
+        grid.to_vtk(output=output, data_name=self.__data_name, extent=ext)
         return 1
 
     def RequestInformation(self, request, inInfo, outInfo):
@@ -334,10 +369,11 @@ class SurferGridReader(ReaderBase):
         ReaderBase.RequestInformation(self, request, inInfo, outInfo)
         # Now set whole output extent
         info = outInfo.GetInformationObject(0)
-        grid = self.__grids[0]  # Get first grid to set output extents
+        grid = self._get_raw_data(idx=0)  # Get first grid to set output extents
         # Set WHOLE_EXTENT: This is absolutely necessary
         ext = (0, grid.nx - 1, 0, grid.ny - 1, 0, 1 - 1)
-        info.Set(vtk.vtkStreamingDemandDrivenPipeline.WHOLE_EXTENT(), ext, 6)
+        info.Set(_vtk.vtkStreamingDemandDrivenPipeline.WHOLE_EXTENT(), ext, 6)
+        _helpers.set_can_produce_sub_extent(outInfo)
         return 1
 
     def set_data_name(self, data_name):
@@ -460,6 +496,13 @@ class EsriGridReader(DelimitedTextReader):
     __type__ = 'reader'
     description = 'PVGeo: Esri Grid'
     extensions = 'asc dem txt'
+    _memo_state = (
+        '_EsriGridReader__nx',
+        '_EsriGridReader__ny',
+        '_EsriGridReader__xo',
+        '_EsriGridReader__yo',
+        '_EsriGridReader__cellsize',
+    )
 
     def __init__(self, outputType='vtkImageData', **kwargs):
         DelimitedTextReader.__init__(self, outputType=outputType, **kwargs)
@@ -488,22 +531,34 @@ class EsriGridReader(DelimitedTextReader):
             )
         return [self.__data_name], content[6::]
 
-    def _file_contents_to_data_frame(self, contents):
+    def _file_contents_to_data_frame(self, contents, titles=None):
         """Creates a dataframe with a single array for the file data."""
-        data = []
-        for content in contents:
+        def parse(content):
             arr = np.fromiter(
                 (float(s) for line in content for s in line.split()), dtype=float
             )
-            df = pd.DataFrame(data=arr, columns=[self.get_data_name()])
-            data.append(df)
-        return data
+            return pd.DataFrame(data=arr, columns=[self.get_data_name()])
+
+        def parse_cached(content):
+            if not isinstance(content, _helpers.FileLines):
+                return parse(content)
+            # A sidecar of the parsed values is used if one was saved
+            return _helpers.get_sidecar_cache().parse(
+                lambda _: parse(content),
+                content.get_file_name(),
+                content.get_offset(),
+                self.get_data_name(),
+                namespace='EsriGridReader',
+            )
+
+        return self._map_files(parse_cached, contents)
 
     def _get_raw_data(self, idx=0):
         """This will return the proper data for the given timestep.
         This method handles Surfer's NaN data values and checks the value range
         """
-        data = self._data[idx].values.astype(float).ravel()
+        data = DelimitedTextReader._get_raw_data(self, idx=idx)
+        data = data.values.astype(float).ravel()
         nans = np.argwhere(data == self.NODATA_VALUE)
         # if np.any(nans):
         #     data = np.ma.masked_where(nans, data)
@@ -525,13 +580,17 @@ class EsriGridReader(DelimitedTextReader):
         # Get requested time index
         i = _helpers.get_requested_time(self, outInfo)
 
-        # Build the data object
+        # Build the data object for the requested extent only
         output.SetOrigin(self.__xo, self.__yo, 0.0)
         output.SetSpacing(self.__cellsize, self.__cellsize, self.__cellsize)
-        output.SetDimensions(*self.get_shape())
+        whole = _helpers.get_whole_extent(outInfo)
+        ext = _helpers.get_update_extent(outInfo)
+        output.SetExtent(ext)
 
         # Now add data values as point data
         data = self._get_raw_data(idx=i)
+        if ext != whole:
+            data = data[_helpers.extent_indices(whole, ext)]
         vtkarr = interface.convert_array(data, name=self.__data_name)
         output.GetPointData().AddArray(vtkarr)
 
@@ -547,7 +606,8 @@ class EsriGridReader(DelimitedTextReader):
         info = outInfo.GetInformationObject(0)
         # Set WHOLE_EXTENT: This is absolutely necessary
         ext = (0, self.__nx - 1, 0, self.__ny - 1, 0, 1 - 1)
-        info.Set(vtk.vtkStreamingDemandDrivenPipeline.WHOLE_EXTENT(), ext, 6)
+        info.Set(_vtk.vtkStreamingDemandDrivenPipeline.WHOLE_EXTENT(), ext, 6)
+        _helpers.set_can_produce_sub_extent(outInfo)
         return 1
 
     def set_data_name(self, data_name):
@@ -578,15 +638,18 @@ class LandsatReader(ReaderBaseBase):
     __category__ = 'reader'
     extensions = "xml"
     description = 'PVGeo: Landsat ESPA XML Metadata'
+    _memo_state = ('_LandsatReader__raster',)
 
     def __init__(self, **kwargs):
+        import espatools
+
         ReaderBaseBase.__init__(self, outputType='vtkImageData', **kwargs)
         self.__reader = espatools.RasterSetReader(yflip=True)
         self.__raster = None
         self.__cast = True
         self.__scheme = 'infrared'
         # Properties:
-        self._dataselection = vtk.vtkDataArraySelection()
+        self._dataselection = _vtk.vtkDataArraySelection()
         self._dataselection.AddObserver(
             "ModifiedEvent", _helpers.create_modified_callback(self)
         )
@@ -649,7 +712,7 @@ class LandsatReader(ReaderBaseBase):
     def RequestData(self, request, inInfo, outInfo):
         """Used by pipeline to generate output"""
         # Get output:
-        output = vtk.vtkImageData.GetData(outInfo, 0)
+        output = _vtk.vtkImageData.GetData(outInfo, 0)
         # Perform Read if needed
         if self.__raster is None:
             self._read_up_front()
@@ -681,7 +744,7 @@ class LandsatReader(ReaderBaseBase):
         ext = (0, nx - 1, 0, ny - 1, 0, nz - 1)
         info = outInfo.GetInformationObject(0)
         # Set WHOLE_EXTENT: This is absolutely necessary
-        info.Set(vtk.vtkStreamingDemandDrivenPipeline.WHOLE_EXTENT(), ext, 6)
+        info.Set(_vtk.vtkStreamingDemandDrivenPipeline.WHOLE_EXTENT(), ext, 6)
         return 1
 
     #### Seters and Geters for the GUI ####
@@ -705,6 +768,8 @@ class LandsatReader(ReaderBaseBase):
     def set_color_scheme(self, scheme):
         """Get an RGB scheme from the raster set. If no scheme is desired, pass
         any string that is not a defined scheme as the scheme argument."""
+        import espatools
+
         if isinstance(scheme, int):
             scheme = self.get_color_scheme_names()[scheme]
         if (
@@ -720,6 +785,8 @@ class LandsatReader(ReaderBaseBase):
     @staticmethod
     def get_color_scheme_names():
         """Get a list of the available color schemes"""
+        import espatools
+
         schemes = list(espatools.RasterSet.RGB_SCHEMES.keys())
         schemes.insert(0, 'No Selection')
         return schemes
@@ -744,7 +811,7 @@ class WriteCellCenterData(WriterBase):
     def perform_write_out(self, input_data_object, filename, object_name):
         """Writes the cell centers of the input data object to a file"""
         # Find cell centers
-        filt = vtk.vtkCellCenters()
+        filt = _vtk.vtkCellCenters()
         filt.SetInputDataObject(input_data_object)
         filt.Update()
         centers = dsa.WrapDataObject(filt.GetOutput(0)).Points
@@ -6,10 +6,9 @@ __displayname__ = 'Subsetting'
 
 import numpy as np
 import pyvista as pv
-import vtk
-from vtk.numpy_interface import dataset_adapter as dsa
 
-from .. import interface
+from .. import _vtk, interface
+from .._vtk import dsa
 from ..base import FilterBase
 
 # NOTE: internal import - from scipy.spatial import cKDTree
@@ -163,7 +162,7 @@ class ExtractTopography(FilterBase):
         #  shift the topography points for the tree
         topo_points[:, 2] = topo_points[:, 2] + self._offset
 
-        filt = vtk.vtkCellCenters()
+        filt = _vtk.vtkCellCenters()
         filt.SetInputDataObject(igrid)
         filt.Update()
         data_points = dsa.WrapDataObject(filt.GetOutput(0)).Points
@@ -7,10 +7,9 @@ __all__ = [
 __displayname__ = 'Transform'
 
 import numpy as np
-import vtk
-from vtk.numpy_interface import dataset_adapter as dsa
 
-from .. import _helpers, interface
+from .. import _helpers, _vtk, interface
+from .._vtk import dsa
 from ..base import FilterBase
 
 ###############################################################################
@@ -24,6 +23,14 @@ class TableToTimeGrid(FilterBase):
 
     __displayname__ = 'Table To Time Grid'
     __category__ = 'filter'
+    _memo_state = (
+        '_TableToTimeGrid__data',
+        '_TableToTimeGrid__needToRun',
+        '_TableToTimeGrid__needToUpdateOutput',
+        '_TableToTimeGrid__timesteps',
+    )
+    # Holds state from its last execution
+    _parallel_blocks = False
 
     def __init__(
         self,
@@ -87,7 +94,7 @@ class TableToTimeGrid(FilterBase):
         """Internal helper to construct the output"""
         if self.__needToUpdateOutput:
             # Clean out the output data object
-            img.DeepCopy(vtk.vtkImageData())
+            img.DeepCopy(_vtk.vtkImageData())
             self.__needToUpdateOutput = False
         ext = self.__extent
         dims = self.__dims
@@ -145,7 +152,7 @@ class TableToTimeGrid(FilterBase):
             ext = [0, nx, 0, ny, 0, nz]
         info = outInfo.GetInformationObject(0)
         # Set WHOLE_EXTENT: This is absolutely necessary
-        info.Set(vtk.vtkStreamingDemandDrivenPipeline.WHOLE_EXTENT(), ext, 6)
+        info.Set(_vtk.vtkStreamingDemandDrivenPipeline.WHOLE_EXTENT(), ext, 6)
         # Now set the number of timesteps:
         self._update_time_steps()
         return 1
@@ -159,6 +166,16 @@ class TableToTimeGrid(FilterBase):
             self.__needToUpdateOutput = True
         FilterBase.Modified(self)
 
+    def _get_memory_items(self):
+        """The reshaped arrays of every time step are held"""
+        return FilterBase._get_memory_items(self) + [self.__data]
+
+    def _release_memory(self):
+        """Drop the reshaped arrays and build them again on demand"""
+        FilterBase._release_memory(self)
+        self.__data = None
+        self.__needToRun = True
+
     def modified(self, run_again=True):
         """Call modified if the filter needs to run again"""
         return self.Modified(run_again=run_again)
@@ -335,7 +352,7 @@ class TranslateGridOrigin(FilterBase):
     def _translate(self, pdi, pdo):
         """Internal helper to translate the inputs origin"""
         if pdo is None:
-            pdo = vtk.vtkImageData()
+            pdo = _vtk.vtkImageData()
 
         [nx, ny, nz] = pdi.GetDimensions()
         [sx, sy, sz] = pdi.GetSpacing()
@@ -20,6 +20,7 @@ class _GSLibReaderMethods(object):
     # NOTE: order of inheritance matters A LOT!
     _header = None
     extensions = 'sgems dat geoeas gslib GSLIB txt SGEMS SGeMS'
+    _memo_state = ('_header',)
 
     def _extract_header(self, content):
         self._header = content[0]
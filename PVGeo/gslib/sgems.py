@@ -9,9 +9,8 @@ import re
 
 import numpy as np
 import pandas as pd
-import vtk
 
-from .. import _helpers, interface
+from .. import _helpers, _vtk, interface
 from ..base import WriterBase
 from .gslib import GSLibReader
 
@@ -26,6 +25,7 @@ class SGeMSGridReader(GSLibReader):
     __category__ = 'reader'
     extensions = GSLibReader.extensions + 'gslibgrid mtxset'
     description = 'PVGeo: SGeMS Uniform Grid'
+    _memo_state = ('_SGeMSGridReader__extent',)
 
     def __init__(self, origin=(0.0, 0.0, 0.0), spacing=(1.0, 1.0, 1.0), **kwargs):
         GSLibReader.__init__(self, outputType='vtkImageData', **kwargs)
@@ -82,23 +82,27 @@ class SGeMSGridReader(GSLibReader):
         Constructs the ``vtkImageData``
         """
         # Get output:
-        output = vtk.vtkImageData.GetData(outInfo)
+        output = _vtk.vtkImageData.GetData(outInfo)
         # Get requested time index
         i = _helpers.get_requested_time(self, outInfo)
         if self.need_to_read():
             self._read_up_front()
-        # Generate the data object
+        # Generate the data object for the requested extent only
         n1, n2, n3 = self.__extent
         dx, dy, dz = self.__spacing
         ox, oy, oz = self.__origin
-        output.SetDimensions(n1 + 1, n2 + 1, n3 + 1)
+        whole = (0, n1, 0, n2, 0, n3)
+        ext = _helpers.get_update_extent(outInfo)
+        output.SetExtent(ext)
         output.SetSpacing(dx, dy, dz)
         output.SetOrigin(ox, oy, oz)
         # Use table generator and convert because its easy:
-        table = vtk.vtkTable()
+        table = _vtk.vtkTable()
         df = self._get_raw_data(idx=i)
+        if ext != whole:
+            df = df.iloc[_helpers.extent_indices(whole, ext, cells=True)]
         # Replace all masked values with NaN
-        df.replace(self.__mask, np.nan, inplace=True)
+        df = df.replace(self.__mask, np.nan)
         interface.data_frame_to_table(df, table)
         # now get arrays from table and add to point data of pdo
         for i in range(table.GetNumberOfColumns()):
@@ -114,7 +118,8 @@ class SGeMSGridReader(GSLibReader):
         ext = self._read_extent()
         info = outInfo.GetInformationObject(0)
         # Set WHOLE_EXTENT: This is absolutely necessary
-        info.Set(vtk.vtkStreamingDemandDrivenPipeline.WHOLE_EXTENT(), ext, 6)
+        info.Set(_vtk.vtkStreamingDemandDrivenPipeline.WHOLE_EXTENT(), ext, 6)
+        _helpers.set_can_produce_sub_extent(outInfo)
         return 1
 
     def set_spacing(self, dx, dy, dz):
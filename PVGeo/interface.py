@@ -16,22 +16,25 @@ __all__ = [
     'points_to_poly_data',
     'add_arrays_from_data_frame',
     'convert_cell_conn',
+    'build_cell_array',
     'get_array',
     'get_data_dict',
+    'DataArrayViews',
 ]
 
 
 __displayname__ = 'Interface'
 
 
+from collections.abc import Mapping
+
 import numpy as np
 import pandas as pd
 import pyvista as pv
 from pyvista.core.utilities import convert_string_array, get_vtk_type
-import vtk
-from vtk.util import numpy_support as nps
 
-from . import _helpers
+from . import _helpers, _vtk
+from ._vtk import nps
 
 
 def convert_array(arr, name='Data', deep=0, array_type=None, pdf=False):
@@ -59,24 +62,80 @@ def convert_array(arr, name='Data', deep=0, array_type=None, pdf=False):
     return pd.DataFrame(data=num_data, columns=[arr.GetName()])
 
 
-def data_frame_to_table(df, pdo=None):
-    """Converts a pandas DataFrame to a vtkTable"""
+def _column_to_vtk(values, name, deep=False):
+    """Internal helper to convert a column of a DataFrame to a VTK array.
+    Numeric columns in native byte order are shared unless ``deep``."""
+    values = np.asarray(values)
+    if values.dtype.kind in 'OSU':
+        return convert_string_array(values.astype(str), name=name)
+    if values.dtype.kind == 'b':
+        values = values.view(np.uint8)
+    elif values.dtype == np.float16:
+        values = values.astype(np.float32)
+    elif not values.dtype.isnative:
+        values = values.astype(values.dtype.newbyteorder('='))
+    return convert_array(values, name=name, deep=deep)
+
+
+def data_frame_to_table(df, pdo=None, deep=False):
+    """Converts a pandas DataFrame to a vtkTable. The numeric columns of the
+    table reference the memory of the DataFrame's columns (which is kept
+    alive by the table) rather than copying it.
+
+    Args:
+        df (pd.DataFrame): the data frame to convert
+        pdo (vtkTable): the output table to fill. A new table is made if not
+            given.
+        deep (bool): copy the values of the columns
+
+    Return:
+        vtkTable : the table
+    """
     if not isinstance(df, pd.DataFrame):
         raise _helpers.PVGeoError('Input is not a pandas DataFrame')
     if pdo is None:
-        pdo = pv.Table(df)
+        pdo = pv.Table()
     else:
-        pdo.DeepCopy(pv.Table(df))
+        pdo.Initialize()
+    for key in df.keys():
+        pdo.AddColumn(_column_to_vtk(df[key].values, str(key), deep=deep))
     return pdo
 
 
-def table_to_data_frame(table):
-    """Converts a vtkTable to a pandas DataFrame"""
-    if not isinstance(table, vtk.vtkTable):
+def _abstract_array_to_numpy(arr):
+    """Internal helper to get the values of an array that is not a
+    ``vtkDataArray`` (e.g. a ``vtkStringArray``) as an array of objects"""
+    return np.array(
+        [arr.GetVariantValue(i).ToString() for i in range(arr.GetNumberOfValues())],
+        dtype=object,
+    )
+
+
+def table_to_data_frame(table, deep=False):
+    """Converts a vtkTable to a pandas DataFrame. The numeric columns of the
+    data frame are views of the table's arrays (which are kept alive by the
+    views) rather than copies.
+
+    Args:
+        table (vtkTable): the table to convert
+        deep (bool): copy the values of the columns
+
+    Return:
+        pd.DataFrame : the data frame
+    """
+    if not isinstance(table, _vtk.vtkTable):
         raise _helpers.PVGeoError('Input is not a vtkTable')
-    if not isinstance(table, pv.Table):
-        table = pv.Table(table)
-    return table.to_pandas()
+    columns = dict()
+    for i in range(table.GetNumberOfColumns()):
+        col = table.GetColumn(i)
+        if col.IsA('vtkDataArray'):
+            values = nps.vtk_to_numpy(col)
+        else:
+            values = _abstract_array_to_numpy(col)
+        columns[table.GetColumnName(i)] = values
+    # NOTE: ``copy=False`` keeps each column in its own block rather than
+    #       consolidating (copying) the columns into 2D blocks
+    return pd.DataFrame(columns, copy=deep)
 
 
 def place_array_in_table(ndarr, titles, pdo):
@@ -131,11 +190,11 @@ def get_dtypes(dtype='', endian=None):
         endian = ''
     # Get numpy and VTK data types and return them both
     if dtype == 'd':
-        vtktype = vtk.VTK_DOUBLE
+        vtktype = _vtk.VTK_DOUBLE
     elif dtype == 'f':
-        vtktype = vtk.VTK_FLOAT
+        vtktype = _vtk.VTK_FLOAT
     elif dtype == 'i':
-        vtktype = vtk.VTK_INT
+        vtktype = _vtk.VTK_INT
     else:
         raise _helpers.PVGeoError('dtype \'%s\' unknown:' % dtype)
     # Return data types
@@ -143,47 +202,82 @@ def get_dtypes(dtype='', endian=None):
     return dtype, vtktype
 
 
-def points_to_poly_data(points, copy_z=False):
+def _coordinates(columns):
+    """Internal helper to interleave X, Y, and Z columns as a C contiguous
+    array of points. Single precision is kept, anything else becomes double.
+    """
+    dtype = np.result_type(*columns)
+    if dtype != np.float32:
+        dtype = np.float64
+    points = np.empty((len(columns[0]), 3), dtype=dtype)
+    for i, col in enumerate(columns):
+        points[:, i] = col
+    return points
+
+
+def points_to_poly_data(points, copy_z=False, cell_type=_vtk.VTK_VERTEX):
     """Create ``vtkPolyData`` from a numpy array of XYZ points. If the points
     have more than 3 dimensions, then all dimensions after the third will be
     added as attributes. Assume the first three dimensions are the XYZ
     coordinates.
 
+    The points are used without copying when given as a C contiguous
+    ``(n, 3)`` array of floats and single precision points stay single
+    precision. The columns of a data frame are added as attributes without
+    copying (see ``data_frame_to_table``).
+
     Args:
         points (np.ndarray or pandas.DataFrame): The points and pointdata
         copy_z (bool): A flag on whether to append the z values as a PointData
             array
+        cell_type (int): ``VTK_VERTEX`` for a vertex cell per point,
+            ``VTK_POLY_VERTEX`` for a single cell of all the points, or
+            ``None`` for no cells.
 
     Return:
         vtkPolyData : points with point-vertex cells
     """
-    # This prevents an error that occurs when only one point is passed
-    if points.ndim < 2:
-        points = points.reshape((1, -1))
-    keys = ['Field %d' % i for i in range(points.shape[1] - 3)]
-    # Check if input is anything other than a NumPy array and cast it
-    # e.g. you could send a Pandas dataframe
-    if not isinstance(points, np.ndarray):
-        if isinstance(points, pd.DataFrame):
-            # If a pandas data frame, lets grab the keys
-            keys = points.keys()[3::]
-        points = np.array(points)
-    # If points are not 3D
-    if points.shape[1] < 2:
-        raise RuntimeError('Points must be 3D. Try adding a third dimension of zeros.')
-
-    atts = points[:, 3::]
-    points = points[:, 0:3].astype(float)
+    if isinstance(points, pd.DataFrame):
+        if points.shape[1] < 3:
+            raise RuntimeError('Points must be 3D. Try adding a third dimension of zeros.')
+        keys = points.keys()[3::]
+        atts = [points[k].values for k in keys]
+        points = _coordinates([points[k].values for k in points.keys()[0:3]])
+    else:
+        points = np.asarray(points)
+        # This prevents an error that occurs when only one point is passed
+        if points.ndim < 2:
+            points = points.reshape((1, -1))
+        if points.shape[1] < 3:
+            raise RuntimeError('Points must be 3D. Try adding a third dimension of zeros.')
+        keys = ['Field %d' % i for i in range(points.shape[1] - 3)]
+        atts = [points[:, 3 + i] for i in range(len(keys))]
+        if points.shape[1] == 3 and points.dtype in (np.float32, np.float64):
+            points = np.ascontiguousarray(points)
+        else:
+            points = _coordinates([points[:, i] for i in range(3)])
+    n_points = len(points)
 
     # Create polydata
-    pdata = pv.PolyData(points)
+    pts = _vtk.vtkPoints()
+    pts.SetData(convert_array(points))
+    pdata = _vtk.vtkPolyData()
+    pdata.SetPoints(pts)
+    if cell_type == _vtk.VTK_VERTEX:
+        ids = np.arange(n_points + 1, dtype=nps.ID_TYPE_CODE)
+        pdata.SetVerts(build_cell_array(ids[:-1], offsets=ids))
+    elif cell_type == _vtk.VTK_POLY_VERTEX:
+        ids = np.arange(n_points, dtype=nps.ID_TYPE_CODE)
+        pdata.SetVerts(build_cell_array(ids, offsets=[0, n_points]))
+    elif cell_type is not None:
+        raise _helpers.PVGeoError('Cell type ({}) not supported'.format(cell_type))
 
     # Add attributes if given
-    for i, key in enumerate(keys):
-        pdata.point_data[key] = convert_array(atts[:, i])
+    for key, values in zip(keys, atts):
+        pdata.GetPointData().AddArray(_column_to_vtk(values, str(key)))
     if copy_z:
-        z = convert_array(points[:, 2], name='Elevation')
-        pdata.point_data['Elevation'] = z
+        z = convert_array(np.ascontiguousarray(points[:, 2]), name='Elevation')
+        pdata.GetPointData().AddArray(z)
     return pv.wrap(pdata)
 
 
@@ -197,7 +291,8 @@ def add_arrays_from_data_frame(pdo, field, df):
 
 def convert_cell_conn(cell_connectivity):
     """Converts cell connectivity arrays to a cell matrix array that makes sense
-    for VTK cell arrays.
+    for VTK cell arrays. This is the legacy ``[n, id0, id1, ...]`` layout: use
+    ``build_cell_array`` to make a ``vtkCellArray`` directly.
     """
     cellsMat = np.concatenate(
         (
@@ -207,7 +302,66 @@ def convert_cell_conn(cell_connectivity):
         ),
         axis=1,
     ).ravel()
-    return nps.numpy_to_vtk(cellsMat, deep=True, array_type=vtk.VTK_ID_TYPE)
+    return nps.numpy_to_vtk(cellsMat, deep=True, array_type=_vtk.VTK_ID_TYPE)
+
+
+def build_cell_array(connectivity, offsets=None):
+    """Build a ``vtkCellArray`` from the offsets and connectivity of its
+    cells. The arrays are handed to VTK without copying when they already
+    hold integers of the cell array's storage type (64 bit by default) and
+    the cell array keeps them alive.
+
+    Args:
+        connectivity (np.ndarray): the point IDs of the cells. A 2D array of
+            shape ``(n_cells, n_points)`` when every cell has the same number
+            of points or a flat array of every cell's point IDs in turn.
+        offsets (np.ndarray): where each cell starts in a flat
+            ``connectivity`` array followed by its length (``n_cells + 1``
+            values). This is needed for a mix of cell types.
+
+    Return:
+        vtkCellArray : the cells
+
+    Example:
+        >>> # A triangle and a quad
+        >>> cells = build_cell_array([0, 1, 2, 1, 3, 4, 2], offsets=[0, 3, 7])
+    """
+    connectivity = np.asarray(connectivity)
+    if offsets is None:
+        if connectivity.ndim != 2:
+            raise _helpers.PVGeoError(
+                'Offsets must be given for a flat connectivity array'
+            )
+        n_cells, n_points = connectivity.shape
+        offsets = np.arange(0, (n_cells + 1) * n_points, n_points)
+    cells = _vtk.vtkCellArray()
+    # ``SetData`` only keeps arrays of the cell array's own storage type: any
+    # other array is wrapped in a new one that would not hold the NumPy array
+    if cells.IsStorage64Bit():
+        dtype, array_type = np.int64, _vtk.vtkTypeInt64Array
+    else:
+        dtype, array_type = np.int32, _vtk.vtkTypeInt32Array
+    offsets = np.ascontiguousarray(offsets, dtype=dtype)
+    connectivity = np.ascontiguousarray(connectivity.ravel(), dtype=dtype)
+    if offsets.ndim != 1 or offsets.size < 1 or offsets[-1] != connectivity.size:
+        raise _helpers.PVGeoError(
+            'The last offset must be the length of the connectivity array'
+        )
+    cells.SetData(
+        _cell_storage(offsets, array_type), _cell_storage(connectivity, array_type)
+    )
+    return cells
+
+
+def _cell_storage(values, array_type):
+    """Wrap a contiguous integer array in a VTK array of the given type
+    without copying it. The VTK array holds a reference to ``values``.
+    """
+    arr = array_type()
+    arr.SetNumberOfComponents(1)
+    arr.SetVoidArray(values, values.size, 1)
+    arr._numpy_reference = values
+    return arr
 
 
 def get_array(dataset, name, vtk_object=False):
@@ -220,11 +374,58 @@ def get_array(dataset, name, vtk_object=False):
     return convert_array(arr)
 
 
+class DataArrayViews(Mapping):
+    """A read only mapping of the names of the arrays in a dataset's
+    cell/point/field/row data to NumPy views of those arrays. Arrays are only
+    wrapped when first accessed and are not copied: use ``np.array`` on a
+    value for a copy that can be changed. The mapping holds a reference to
+    the dataset so the views stay valid.
+
+    Args:
+        dataset (vtkDataObject): the dataset holding the arrays
+        field (int or str): the field type id or name
+    """
+
+    __displayname__ = 'Data Array Views'
+
+    def __init__(self, dataset, field='cell'):
+        self.__dataset = dataset
+        self.__field = field
+        self.__names = list(_helpers.get_all_array_names(dataset, field))
+        self.__views = {}
+
+    def __getitem__(self, key):
+        if key not in self.__names:
+            raise KeyError(key)
+        if key not in self.__views:
+            arr = _helpers.get_vtk_array(self.__dataset, self.__field, key)
+            if arr is None:
+                # Not a numeric array (e.g. a ``vtkStringArray``)
+                arr = _helpers.get_numpy_array(self.__dataset, self.__field, key)
+                if isinstance(arr, _vtk.vtkAbstractArray):
+                    view = _abstract_array_to_numpy(arr)
+                else:
+                    view = np.array(arr)
+            else:
+                view = nps.vtk_to_numpy(arr).view()
+            view.flags.writeable = False
+            self.__views[key] = view
+        return self.__views[key]
+
+    def __iter__(self):
+        return iter(self.__names)
+
+    def __len__(self):
+        return len(self.__names)
+
+    def __repr__(self):
+        return '%s(%s)' % (self.__class__.__name__, self.__names)
+
+
 def get_data_dict(dataset, field='cell'):
     """Given an input dataset, this will return all the arrays in that object's
-    cell/point/field/row data as named NumPy arrays in a dictionary.
+    cell/point/field/row data as named NumPy arrays in a read only mapping.
+    The arrays are views of the dataset's arrays made on first access (see
+    ``DataArrayViews``).
     """
-    data = {}
-    for key in _helpers.get_all_array_names(dataset, field):
-        data[key] = np.array(_helpers.get_numpy_array(dataset, field, key))
-    return data
+    return DataArrayViews(dataset, field)
@@ -0,0 +1,194 @@
+"""
+A process wide registry of the memory held by the caches of ``PVGeo``'s
+readers and filters. Every algorithm reports the bytes it holds (parsed
+files, time steps, memoized outputs, etc.) and, when a budget is set, the
+caches of the least recently used algorithms are released until the total is
+back under the budget. Released data is read again on demand.
+
+The budget can also be set with the ``PVGEO_MEMORY_BUDGET`` environment
+variable (in bytes).
+
+Example:
+    >>> import PVGeo
+    >>> PVGeo.memory.set_budget(2 * 1024**3)  # 2 GiB
+    >>> PVGeo.memory.report()
+    {'DelimitedTextReader (140287)': 52428800, ...}
+"""
+
+__all__ = [
+    'MemoryRegistry',
+    'get_registry',
+    'register',
+    'touch',
+    'report',
+    'get_total_usage',
+    'set_budget',
+    'get_budget',
+]
+
+__displayname__ = 'Memory'
+
+from collections import OrderedDict
+import os
+import threading
+import weakref
+
+
+class MemoryRegistry(object):
+    """A thread safe registry of objects holding cached data. Registered
+    objects must implement ``get_memory_usage()`` returning the bytes they
+    hold and ``release_memory()`` dropping everything that can be rebuilt and
+    returning whether anything was released (an object that is busy may
+    refuse). Objects are held by weak references and ordered from least to most
+    recently used.
+
+    Args:
+        budget (int): the byte budget for all registered objects. Use ``None``
+            for no budget.
+    """
+
+    def __init__(self, budget=None):
+        self.__budget = budget
+        self.__holders = OrderedDict()
+        self.__lock = threading.RLock()
+
+    def __len__(self):
+        return len(self.get_holders())
+
+    def register(self, holder):
+        """Add an object to the registry as the most recently used"""
+        key = id(holder)
+        with self.__lock:
+            self.__holders[key] = weakref.ref(holder, lambda _: self.__forget(key))
+            self.__holders.move_to_end(key)
+
+    def unregister(self, holder):
+        """Remove an object from the registry"""
+        self.__forget(id(holder))
+
+    def __forget(self, key):
+        with self.__lock:
+            self.__holders.pop(key, None)
+
+    def touch(self, holder):
+        """Mark an object as the most recently used and enforce the budget.
+        The touched object itself is never released.
+        """
+        with self.__lock:
+            key = id(holder)
+            if key not in self.__holders:
+                self.register(holder)
+            self.__holders.move_to_end(key)
+        if self.__budget is not None:
+            self.enforce(keep=holder)
+
+    def get_holders(self):
+        """Get the registered objects from least to most recently used"""
+        with self.__lock:
+            refs = list(self.__holders.values())
+        return [h for h in (ref() for ref in refs) if h is not None]
+
+    def get_usage(self):
+        """Get the bytes held by each registered object
+
+        Return:
+            list(tuple) : pairs of the objects and their bytes from least to
+            most recently used
+        """
+        return [(h, h.get_memory_usage()) for h in self.get_holders()]
+
+    def get_total_usage(self):
+        """Get the bytes held by all of the registered objects"""
+        return sum(nbytes for _, nbytes in self.get_usage())
+
+    def report(self):
+        """Get the bytes held by each registered object by name
+
+        Return:
+            dict : maps the names of the objects to their bytes
+        """
+        return OrderedDict(
+            ('%s (%d)' % (h.__class__.__name__, id(h)), nbytes)
+            for h, nbytes in self.get_usage()
+        )
+
+    def enforce(self, keep=None):
+        """Release the caches of the least recently used objects until the
+        total is under the budget.
+
+        Args:
+            keep: an object that must not be released
+
+        Return:
+            int : the number of bytes released
+        """
+        if self.__budget is None:
+            return 0
+        # NOTE: the registry is not locked while releasing so that objects
+        # can be registered while others are released
+        usage = self.get_usage()
+        total = sum(nbytes for _, nbytes in usage)
+        released = 0
+        for holder, nbytes in usage:
+            if total - released <= self.__budget:
+                break
+            if holder is keep or nbytes <= 0:
+                continue
+            if holder.release_memory():
+                released += nbytes
+        return released
+
+    def set_budget(self, budget):
+        """Set the byte budget. Use ``None`` for no budget."""
+        self.__budget = budget
+        self.enforce()
+
+    def get_budget(self):
+        """Get the byte budget"""
+        return self.__budget
+
+
+def _budget_from_environment():
+    budget = os.environ.get('PVGEO_MEMORY_BUDGET', None)
+    if not budget:
+        return None
+    return int(float(budget))
+
+
+_REGISTRY = MemoryRegistry(budget=_budget_from_environment())
+
+
+def get_registry():
+    """Get the process wide ``MemoryRegistry``"""
+    return _REGISTRY
+
+
+def register(holder):
+    """Add an object to the process wide registry"""
+    _REGISTRY.register(holder)
+
+
+def touch(holder):
+    """Mark an object as used in the process wide registry and enforce the
+    budget"""
+    _REGISTRY.touch(holder)
+
+
+def report():
+    """Get the bytes held by each registered object by name"""
+    return _REGISTRY.report()
+
+
+def get_total_usage():
+    """Get the bytes held by all of the registered objects"""
+    return _REGISTRY.get_total_usage()
+
+
+def set_budget(budget):
+    """Set the process wide byte budget. Use ``None`` for no budget."""
+    _REGISTRY.set_budget(budget)
+
+
+def get_budget():
+    """Get the process wide byte budget"""
+    return _REGISTRY.get_budget()
@@ -5,9 +5,8 @@ __all__ = [
 
 import numpy as np
 import pyvista as pv
-import vtk
 
-from .. import interface
+from .. import _vtk, interface
 from ..base import AlgorithmBase
 
 
@@ -28,7 +27,7 @@ class OutlineContinents(AlgorithmBase):
     def RequestData(self, request, inInfo, outInfo):
         """Used by pipeline to generate the output"""
         pdo = self.GetOutputData(outInfo, 0)
-        earth = vtk.vtkEarthSource()
+        earth = _vtk.vtkEarthSource()
         earth.SetRadius(self.__radius)
         earth.OutlineOn()
         earth.Update()
@@ -111,13 +110,9 @@ class GlobeSource(AlgorithmBase):
         texcoords = interface.convert_array(tex, name='Texture Coordinates')
         # Now generate triangles
         cell_connectivity = Delaunay(pos).simplices.astype(int)
-        cells = vtk.vtkCellArray()
-        cells.SetNumberOfCells(cell_connectivity.shape[0])
-        cells.SetCells(
-            cell_connectivity.shape[0], interface.convert_cell_conn(cell_connectivity)
-        )
+        cells = interface.build_cell_array(cell_connectivity)
         # Generate output
-        output = vtk.vtkPolyData()
+        output = _vtk.vtkPolyData()
         output.SetPoints(points)
         output.GetPointData().SetTCoords(texcoords)
         output.SetPolys(cells)
@@ -7,9 +7,8 @@ __all__ = [
 __displayname__ = 'Grids'
 
 import numpy as np
-import vtk
 
-from .. import interface
+from .. import _vtk, interface
 from ..base import AlgorithmBase
 
 
@@ -73,7 +72,7 @@ class CreateUniformGrid(AlgorithmBase):
         ]
         info = outInfo.GetInformationObject(0)
         # Set WHOLE_EXTENT: This is absolutely necessary
-        info.Set(vtk.vtkStreamingDemandDrivenPipeline.WHOLE_EXTENT(), ext, 6)
+        info.Set(_vtk.vtkStreamingDemandDrivenPipeline.WHOLE_EXTENT(), ext, 6)
         return 1
 
     #### Setters / Getters ####
@@ -149,7 +148,7 @@ class CreateEvenRectilinearGrid(AlgorithmBase):
         ext = [0, self.__extent[0], 0, self.__extent[1], 0, self.__extent[2]]
         info = outInfo.GetInformationObject(0)
         # Set WHOLE_EXTENT: This is absolutely necessary
-        info.Set(vtk.vtkStreamingDemandDrivenPipeline.WHOLE_EXTENT(), ext, 6)
+        info.Set(_vtk.vtkStreamingDemandDrivenPipeline.WHOLE_EXTENT(), ext, 6)
         return 1
 
     #### Setters / Getters ####
@@ -289,7 +288,7 @@ class CreateTensorMesh(AlgorithmBase):
         ext = self.get_extent()
         info = outInfo.GetInformationObject(0)
         # Set WHOLE_EXTENT: This is absolutely necessary
-        info.Set(vtk.vtkStreamingDemandDrivenPipeline.WHOLE_EXTENT(), ext, 6)
+        info.Set(_vtk.vtkStreamingDemandDrivenPipeline.WHOLE_EXTENT(), ext, 6)
         return 1
 
     #### Getters / Setters ####
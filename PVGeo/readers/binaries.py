@@ -8,9 +8,8 @@ __displayname__ = 'Binary/Serialized File I/O'
 import warnings
 
 import numpy as np
-import vtk
 
-from .. import _helpers, interface
+from .. import _helpers, _vtk, interface
 from ..base import ReaderBase
 
 
@@ -29,6 +28,7 @@ class PackedBinariesReader(ReaderBase):
     __category__ = 'reader'
     extensions = 'H@ bin rsf rsf@ HH npz'
     description = 'PVGeo: Packed Binaries Reader'
+    _memo_state = ('_PackedBinariesReader__data',)
 
     def __init__(self, **kwargs):
         ReaderBase.__init__(self, nOutputPorts=1, outputType='vtkTable', **kwargs)
@@ -54,28 +54,45 @@ class PackedBinariesReader(ReaderBase):
             raise _helpers.PVGeoError(str(fe))
         return np.asarray(arr, dtype=self.__dtype)
 
+    def __read_cached(self, filename):
+        """Internal helper to read a file through the parse cache"""
+        return _helpers.cached_parse(self._read_raw_file, filename, self.__dtype.str)
+
     def _get_file_contents(self, idx=None):
         """Internal helper to get all contents for all files"""
         if idx is not None:
             filenames = [self.get_file_names(idx=idx)]
         else:
             filenames = self.get_file_names()
-        contents = []
-        for f in filenames:
-            contents.append(self._read_raw_file(f))
+        contents = self._map_files(self.__read_cached, filenames)
         if idx is not None:
             return contents[0]
         return contents
 
+    def _read_time_step(self, idx):
+        """Reads a single file of the series when the reader is lazy"""
+        return self._get_file_contents(idx=idx)
+
     def _read_up_front(self):
         """Should not need to be overridden"""
-        # Perform Read
-        self.__data = self._get_file_contents()
+        if self.get_lazy_read():
+            # Files are read as they are requested
+            self.__data = []
+            self._clear_time_steps()
+            self.need_to_read(flag=False)
+            return 1
+        # Perform Read: only files that changed since the last read are parsed
+        self.__data = self._read_changed_files(
+            lambda filenames: self._map_files(self.__read_cached, filenames),
+            self.get_file_names(),
+        )
         self.need_to_read(flag=False)
         return 1
 
     def _get_raw_data(self, idx=0):
         """This will return the proper data for the given timestep"""
+        if self.get_lazy_read():
+            return self._get_time_step(idx)
         return self.__data[idx]
 
     def convert_array(self, arr):
@@ -89,7 +106,7 @@ class PackedBinariesReader(ReaderBase):
     def RequestData(self, request, inInfo, outInfo):
         """Used by pipeline to request data for current timestep"""
         # Get output:
-        output = vtk.vtkTable.GetData(outInfo)
+        output = _vtk.vtkTable.GetData(outInfo)
         if self.need_to_read():
             self._read_up_front()
         # Get requested time index
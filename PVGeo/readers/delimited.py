@@ -7,7 +7,7 @@ import sys
 import numpy as np
 import pandas as pd
 
-from .. import _helpers, interface
+from .. import _helpers, _vtk, interface
 from ..base import ReaderBase
 
 if sys.version_info < (3,):
@@ -27,6 +27,7 @@ class DelimitedTextReader(ReaderBase):
     __category__ = 'reader'
     extensions = 'dat csv txt text ascii xyz tsv ntab'
     description = 'PVGeo: Delimited Text Files'
+    _memo_state = ('_data', '_titles', '_DelimitedTextReader__selection_observer')
 
     def __init__(self, nOutputPorts=1, outputType='vtkTable', **kwargs):
         ReaderBase.__init__(
@@ -40,9 +41,19 @@ class DelimitedTextReader(ReaderBase):
         self.__skipRows = kwargs.get('skiprows', 0)
         self.__comments = kwargs.get('comments', '!')
         self.__has_titles = kwargs.get('has_titles', True)
+        # Rows to parse at a time when streaming files into the output
+        self.__chunk_size = kwargs.get('chunksize', None)
+        # Large files are split into ranges of at least this many bytes that
+        # are parsed in parallel
+        self.__segment_size = kwargs.get('segment_size', 64 * 1024**2)
         # Data objects to hold the read data for access by the pipeline methods
         self._data = []
         self._titles = []
+        # The columns to parse: unselected columns are skipped by the parser
+        self._dataselection = _vtk.vtkDataArraySelection()
+        self.__selection_observer = self._dataselection.AddObserver(
+            'ModifiedEvent', _helpers.create_modified_callback(self)
+        )
 
     def _get_delimiter(self):
         """For itenral use only!"""
@@ -57,30 +68,30 @@ class DelimitedTextReader(ReaderBase):
     #### Methods for performing the read ####
 
     def _get_file_contents(self, idx=None):
-        """This grabs the lines of the input data file as a string array. This
-        allows us to load the file contents, parse the header then use numpy or
-        pandas to parse the data."""
+        """This grabs the lines of the input data file as a lazy sequence of
+        strings (see ``_helpers.FileLines``). This allows us to parse the
+        header from the first lines then hand the rest of the file to pandas to
+        parse the data."""
         if idx is not None:
             filenames = [self.get_file_names(idx=idx)]
         else:
             filenames = self.get_file_names()
-        contents = []
-        for f in filenames:
-            try:
-                contents.append(
-                    np.genfromtxt(
-                        f, dtype=str, delimiter='\n', comments=self.__comments
-                    )[self.__skipRows::]
-                )
-            except (IOError, OSError) as fe:
-                raise _helpers.PVGeoError(str(fe))
+        contents = self._map_files(self.__read_lines, filenames)
         if idx is not None:
             return contents[0]
         return contents
 
+    def __read_lines(self, filename):
+        """Internal helper to get the lines of a single file"""
+        try:
+            lines = _helpers.FileLines(filename, comments=self.__comments)
+        except (IOError, OSError) as fe:
+            raise _helpers.PVGeoError(str(fe))
+        return lines[self.__skipRows::]
+
     def _extract_header(self, content):
         """Override this. Removes header from single file's content."""
-        if len(np.shape(content)) > 2:
+        if not isinstance(content[0], str):
             raise _helpers.PVGeoError(
                 "`_extract_header()` can only handle a single file's content"
             )
@@ -112,44 +123,257 @@ class DelimitedTextReader(ReaderBase):
             )
         return ts[0], contents
 
-    def _file_contents_to_data_frame(self, contents):
+    def _file_contents_to_data_frame(self, contents, titles=None):
         """Should NOT need to be overridden. After ``_extract_headers`` handles
         removing the file header from the file contents, this method will parse
         the remainder of the contents into a pandas DataFrame with column names
         generated from the titles resulting from in ``_extract_headers``.
+        The ``titles`` default to those set on the reader.
         """
-        data = []
-        for content in contents:
-            if self.get_split_on_white_space():
-                df = pd.read_csv(
-                    StringIO("\n".join(content)),
-                    names=self.get_titles(),
-                    sep=r'\s+',
-                )
-            else:
-                df = pd.read_csv(
-                    StringIO("\n".join(content)),
-                    names=self.get_titles(),
-                    sep=self._get_delimiter(),
-                )
-            data.append(df)
-        return data
+        return self._map_files(
+            lambda content: self.__content_to_data_frame(content, titles=titles),
+            contents,
+        )
+
+    def __content_to_data_frame(self, content, chunksize=None, titles=None):
+        """Internal helper to parse a single file's content. If ``chunksize``
+        is given, this returns an iterator of data frames of that many rows.
+        """
+        if titles is None:
+            titles = self.get_titles()
+        if self.get_split_on_white_space():
+            sep = r'\s+'
+        else:
+            sep = self._get_delimiter()
+        comments = self.__comments or None
+        usecols = self._get_selected_titles(titles)
+        if len(usecols) == len(titles):
+            usecols = None
+        if isinstance(content, _helpers.FileLines) and (
+            comments is None or len(comments) == 1
+        ):
+            # Parse the rest of the file in place with pandas' C parser
+            filename, offset = content.get_file_name(), content.get_offset()
+            options = dict(
+                names=titles,
+                usecols=usecols,
+                sep=sep,
+                comment=comments,
+                index_col=False,
+            )
+            if chunksize is not None:
+                return self.__iter_chunks(filename, offset, chunksize, options)
+            # A sidecar of the parsed columns is used if one was saved
+            return _helpers.get_sidecar_cache().parse(
+                lambda f: self.__parse_file(f, offset, options),
+                filename,
+                offset,
+                [str(t) for t in titles],
+                usecols,
+                sep,
+                comments,
+                namespace='DelimitedTextReader',
+            )
+        df = pd.read_csv(
+            StringIO("\n".join(content)),
+            names=titles,
+            usecols=usecols,
+            sep=sep,
+        )
+        if chunksize is None:
+            return df
+        return iter([df])
+
+    def __parse_file(self, filename, offset, options):
+        """Internal helper to parse a file from an offset with pandas"""
+        ranges = []
+        if self.__segment_size:
+            ranges = _helpers.split_file(
+                filename,
+                start=offset,
+                segments=self.get_workers(),
+                min_size=self.__segment_size,
+            )
+        if len(ranges) < 2:
+            with _helpers.open_range(filename, offset, strip=True) as f:
+                return pd.read_csv(f, **options)
+
+        # Parse line aligned ranges of a large file in parallel
+        def parse(rng):
+            self._check_abort()
+            with _helpers.open_range(filename, *rng, strip=True) as f:
+                return pd.read_csv(f, **options)
+
+        frames = _helpers.map_ordered(parse, ranges, workers=len(ranges))
+        # Ranges of only blank or comment lines parse to empty frames of
+        # object columns that would make every column an object column
+        rows = [df for df in frames if len(df)]
+        return pd.concat(rows or frames[:1], ignore_index=True, copy=False)
+
+    @staticmethod
+    def __iter_chunks(filename, offset, chunksize, options):
+        """Internal helper to iterate the chunks of a file from an offset"""
+        with _helpers.open_range(filename, offset, strip=True) as f:
+            with pd.read_csv(f, chunksize=chunksize, **options) as chunks:
+                for chunk in chunks:
+                    yield chunk
+
+    def _read_time_step(self, idx):
+        """Should not need to be overridden. Reads a single file of the series
+        when the reader is lazy. The titles of the file are returned with its
+        data to be set by ``_use_time_step``."""
+        titles, contents = self._extract_headers([self._get_file_contents(idx=idx)])
+        return titles, self._file_contents_to_data_frame(contents, titles=titles)[0]
+
+    def _use_time_step(self, data):
+        """Set the titles of a file read on demand and get its data frame"""
+        titles, df = data
+        if len(self._titles) and list(titles) != list(self._titles):
+            raise _helpers.PVGeoError(
+                'Data array titles varied across file timesteps. This data is invalid as a timeseries.'
+            )
+        self._set_titles(titles)
+        return df
+
+    def _get_row_selector(self):
+        """Get a function that decimates the rows of a file as it is streamed
+        (see ``_stream_file``) or ``None`` if all rows are read."""
+        return None
 
     def _read_up_front(self):
         """Should not need to be overridden."""
-        # Perform Read
-        contents = self._get_file_contents()
-        self._titles, contents = self._extract_headers(contents)
-        self._data = self._file_contents_to_data_frame(contents)
+        if self.get_chunk_size() or self._get_row_selector() is not None:
+            # Only read the header of the first file to get the titles: the
+            # files are streamed into the output when requested
+            self._data = []
+            self._clear_time_steps()
+            content = self.__read_lines(self.get_file_names(idx=0))
+            self._set_titles(self._extract_header(content)[0])
+            self.need_to_read(flag=False)
+            return 1
+        if self.get_lazy_read():
+            # Only read the first file to get the titles
+            self._data = []
+            self._titles = []
+            self._clear_time_steps()
+            self._get_time_step(0)
+            self.need_to_read(flag=False)
+            return 1
+        # Perform Read: only files that changed since the last read are parsed
+        self._data = self._read_changed_files(self.__read_files, self.get_file_names())
         self.need_to_read(flag=False)
         return 1
 
+    def __read_files(self, filenames):
+        """Internal helper to parse a list of files into data frames"""
+        contents = self._map_files(self.__read_lines, filenames)
+        titles, contents = self._extract_headers(contents)
+        if (
+            len(filenames) < len(self.get_file_names())
+            and len(self._titles)
+            and list(titles) != list(self._titles)
+        ):
+            raise _helpers.PVGeoError(
+                'Data array titles varied across file timesteps. This data is invalid as a timeseries.'
+            )
+        self._set_titles(titles)
+        return self._file_contents_to_data_frame(contents)
+
+    def _get_memory_items(self):
+        """The data frames of every file are held"""
+        return ReaderBase._get_memory_items(self) + list(self._data)
+
+    def _release_memory(self):
+        """Drop the data frames and read the files again on demand"""
+        ReaderBase._release_memory(self)
+        self._data = []
+
     #### Methods for accessing the data read in #####
 
     def _get_raw_data(self, idx=0):
         """This will return the proper data for the given timestep as a dataframe"""
+        if self.get_chunk_size() or self._get_row_selector() is not None:
+            # Nothing is held when streaming
+            return self._use_time_step(self._read_time_step(idx))
+        if self.get_lazy_read():
+            return self._get_time_step(idx)
         return self._data[idx]
 
+    def _stream_file(self, idx, points=False, select=None, chunksize=None):
+        """Parse a file a chunk of rows at a time straight into arrays of
+        the final size so that the whole file is never held as a data frame.
+        The arrays are sized by the number of lines in the file and are handed
+        to VTK without copying by ``data_frame_to_table``.
+
+        Args:
+            idx (int): the index of the file to read
+            points (bool): write the first three columns into a single
+                ``(n, 3)`` array of points
+            select (callable): decimates the rows while parsing. This is
+                called with the data frame of each chunk and the index of its
+                first row in the file and returns a boolean mask of the rows to
+                keep.
+            chunksize (int): the rows per chunk. Defaults to the reader's
+                chunk size.
+
+        Return:
+            tuple : the points (``None`` if not ``points``) and a data frame of
+            the other columns
+        """
+        content = self.__read_lines(self.get_file_names(idx=idx))
+        titles, content = self._extract_header(content)
+        if len(self._titles) and list(titles) != list(self._titles):
+            raise _helpers.PVGeoError(
+                'Data array titles varied across file timesteps. This data is invalid as a timeseries.'
+            )
+        self._set_titles(titles)
+        if chunksize is None:
+            chunksize = self.get_chunk_size()
+        chunks = self.__content_to_data_frame(content, chunksize=chunksize)
+        if isinstance(content, _helpers.FileLines):
+            size = _helpers.count_lines(content.get_file_name(), content.get_offset())
+        else:
+            size = len(content)
+        if select is not None:
+            # Grown as needed: the number of rows kept is not known
+            size = min(size, chunksize)
+        arrays = dict()
+        if points:
+            arrays[None] = np.empty((size, 3))
+        start = row = 0
+        for chunk in chunks:
+            self._check_abort()
+            if select is not None:
+                mask = select(chunk, row)
+                row += len(chunk)
+                chunk = chunk[mask]
+            stop = start + len(chunk)
+            if stop > size:
+                size = max(stop, 2 * size)
+                for key, arr in arrays.items():
+                    arrays[key] = np.resize(arr, (size,) + arr.shape[1:])
+            for j, key in enumerate(chunk.keys()):
+                values = chunk[key].values
+                if points and j < 3:
+                    arrays[None][start:stop, j] = values
+                    continue
+                arr = arrays.get(key, None)
+                if arr is None:
+                    arr = arrays[key] = np.empty(size, dtype=values.dtype)
+                elif not np.can_cast(values.dtype, arr.dtype, casting='same_kind'):
+                    # e.g. integers followed by NaNs: promote what was read
+                    arr = arrays[key] = arr.astype(np.result_type(arr, values))
+                arr[start:stop] = values
+            start = stop
+        for key, arr in arrays.items():
+            arrays[key] = arr[:start]
+            if start < 0.8 * len(arr):
+                # Do not hold on to the space of rows that were not kept
+                arrays[key] = arrays[key].copy()
+        xyz = arrays.pop(None, None)
+        df = pd.DataFrame(arrays, copy=False)
+        return xyz, df
+
     #### Algorithm Methods ####
 
     def RequestData(self, request, inInfo, outInfo):
@@ -163,6 +387,9 @@ class DelimitedTextReader(ReaderBase):
         if self.need_to_read():
             self._read_up_front()
         # Generate the data object
+        if self.get_chunk_size():
+            interface.data_frame_to_table(self._stream_file(i)[1], output)
+            return 1
         interface.data_frame_to_table(self._get_raw_data(idx=i), output)
         return 1
 
@@ -220,6 +447,105 @@ class DelimitedTextReader(ReaderBase):
     def get_titles(self):
         return self._titles
 
+    def _set_titles(self, titles):
+        """Set the titles of the columns and list them in the data selection.
+        Columns that were already listed keep their selection."""
+        self._titles = titles
+        selection = self._dataselection
+        names = [str(t) for t in titles]
+        listed = [selection.GetArrayName(i) for i in range(selection.GetNumberOfArrays())]
+        if listed == names:
+            return
+        # Do not let listing the columns look like a change of selection
+        selection.RemoveObserver(self.__selection_observer)
+        try:
+            for name in listed:
+                if name not in names:
+                    selection.RemoveArrayByName(name)
+            for name in names:
+                if not selection.ArrayExists(name):
+                    selection.AddArray(name)
+        finally:
+            self.__selection_observer = selection.AddObserver(
+                'ModifiedEvent', _helpers.create_modified_callback(self)
+            )
+
+    def _is_selected(self, title):
+        """Columns that are not listed yet are selected when listed"""
+        name = str(title)
+        selection = self._dataselection
+        return not selection.ArrayExists(name) or selection.ArrayIsEnabled(name)
+
+    def _get_selected_titles(self, titles=None):
+        """Get the titles of the columns to parse in the order of the file.
+        The ``titles`` default to those set on the reader."""
+        if titles is None:
+            titles = self._titles
+        return [t for t in titles if self._is_selected(t)]
+
+    def _memo_fingerprint(self):
+        """Memoized outputs also depend on the selected columns. Only the
+        unselected columns are listed as the columns are only listed once the
+        header is read."""
+        selection = self._dataselection
+        unselected = tuple(
+            selection.GetArrayName(i)
+            for i in range(selection.GetNumberOfArrays())
+            if not selection.GetArraySetting(i)
+        )
+        return (ReaderBase._memo_fingerprint(self), unselected)
+
+    def GetDataSelection(self):
+        """Get the selection of the columns to read. Unselected columns are
+        never parsed. The columns are listed from the header of the first file
+        (the data is not read)."""
+        if not len(self._titles) and len(self.get_file_names()):
+            content = self.__read_lines(self.get_file_names(idx=0))
+            self._set_titles(self._extract_header(content)[0])
+        return self._dataselection
+
+    def set_selected_columns(self, names):
+        """Select only the named columns to be read. Use ``None`` to read
+        every column."""
+        selection = self.GetDataSelection()
+        if names is None:
+            selection.EnableAllArrays()
+            return
+        for i in range(selection.GetNumberOfArrays()):
+            name = selection.GetArrayName(i)
+            if name in names:
+                selection.EnableArray(name)
+            else:
+                selection.DisableArray(name)
+
+    def set_chunk_size(self, chunksize):
+        """Set the number of rows to parse at a time. When set, the files are
+        streamed into the output a chunk at a time instead of being held as
+        data frames: use this for files too large to hold twice in memory. Use
+        ``None`` to read and hold whole files.
+        """
+        if chunksize != self.__chunk_size:
+            self.__chunk_size = chunksize
+            self.Modified()
+
+    def get_chunk_size(self):
+        """Get the number of rows to parse at a time when streaming"""
+        return self.__chunk_size
+
+    def set_segment_size(self, nbytes):
+        """Set the fewest bytes of a file to parse on each thread. Files
+        larger than this are split into line aligned ranges (up to one per
+        worker) that are parsed in parallel. Use ``None`` to parse every file
+        on a single thread.
+        """
+        if nbytes != self.__segment_size:
+            self.__segment_size = nbytes
+            self.Modified()
+
+    def get_segment_size(self):
+        """Get the fewest bytes of a file to parse on each thread"""
+        return self.__segment_size
+
 
 ###############################################################################
 
@@ -237,6 +563,11 @@ class DelimitedPointsReaderBase(DelimitedTextReader):
     def __init__(self, **kwargs):
         DelimitedTextReader.__init__(self, outputType='vtkPolyData', **kwargs)
         self.__copy_z = kwargs.get('copy_z', False)
+        # Decimation applied while parsing
+        self.__every_nth = kwargs.get('every_nth', 1)
+        self.__sample_fraction = kwargs.get('sample_fraction', None)
+        self.__seed = kwargs.get('seed', None)
+        self.__spatial_stride = kwargs.get('spatial_stride', None)
 
     def set_copy_z(self, flag):
         """Set whether or not to copy the Z-component of the points to the
@@ -251,6 +582,103 @@ class DelimitedPointsReaderBase(DelimitedTextReader):
         """
         return self.__copy_z
 
+    def set_every_nth(self, every):
+        """Set to only keep every Nth point of the file"""
+        every = int(every)
+        if every < 1:
+            raise _helpers.PVGeoError('`every_nth` must be a positive integer.')
+        if self.__every_nth != every:
+            self.__every_nth = every
+            self.Modified()
+
+    def get_every_nth(self):
+        """Get the interval of the points that are kept"""
+        return self.__every_nth
+
+    def set_sample_fraction(self, fraction):
+        """Set the fraction of the points to keep at random. Use ``None`` to
+        keep all of the points."""
+        if fraction is not None and not 0.0 <= fraction <= 1.0:
+            raise _helpers.PVGeoError('`sample_fraction` must be between 0 and 1.')
+        if self.__sample_fraction != fraction:
+            self.__sample_fraction = fraction
+            self.Modified()
+
+    def get_sample_fraction(self):
+        """Get the fraction of the points kept at random"""
+        return self.__sample_fraction
+
+    def set_seed(self, seed):
+        """Set the seed of the random sampling so that the same points are
+        kept on every read"""
+        if self.__seed != seed:
+            self.__seed = seed
+            self.Modified()
+
+    def get_seed(self):
+        """Get the seed of the random sampling"""
+        return self.__seed
+
+    def set_spatial_stride(self, stride):
+        """Set the size of the cubic cells of a grid over the points where only
+        the first point in each cell is kept. Use ``None`` to keep all of the
+        points."""
+        if stride is not None and stride <= 0:
+            raise _helpers.PVGeoError('`spatial_stride` must be positive.')
+        if self.__spatial_stride != stride:
+            self.__spatial_stride = stride
+            self.Modified()
+
+    def get_spatial_stride(self):
+        """Get the size of the cells of the spatial decimation"""
+        return self.__spatial_stride
+
+    def _get_row_selector(self):
+        """Get a function that decimates the rows of a chunk as it is parsed
+        (see ``_stream_file``) or ``None`` if all of the points are kept. The
+        state of the selector (random generator and visited cells) spans a
+        single file so get a new one for every read.
+        """
+        every = self.__every_nth
+        fraction = self.__sample_fraction
+        stride = self.__spatial_stride
+        if every == 1 and fraction is None and stride is None:
+            return None
+        rng = np.random.default_rng(self.__seed)
+        seen = set()
+
+        def select(chunk, row):
+            n = len(chunk)
+            mask = np.ones(n, dtype=bool)
+            if every > 1:
+                mask &= (row + np.arange(n)) % every == 0
+            if fraction is not None:
+                # Always draw for every row so the sample only depends on the seed
+                mask &= rng.random(n) < fraction
+            if stride is not None:
+                xyz = chunk.iloc[:, 0:3].values
+                cells = np.floor(xyz[mask] / stride).astype(np.int64)
+                cells, first = np.unique(cells, axis=0, return_index=True)
+                keep = np.zeros(len(xyz[mask]), dtype=bool)
+                for cell, j in zip(map(tuple, cells), first):
+                    if cell not in seen:
+                        seen.add(cell)
+                        keep[j] = True
+                mask[mask] = keep
+            return mask
+
+        return select
+
+    def _get_selected_titles(self, titles=None):
+        """The XYZ coordinates (the first three columns) are always read"""
+        if titles is None:
+            titles = self._titles
+        return [
+            t
+            for i, t in enumerate(titles)
+            if i < 3 or self._is_selected(t)
+        ]
+
     #### Algorithm Methods ####
 
     def RequestData(self, request, inInfo, outInfo):
@@ -264,8 +692,22 @@ class DelimitedPointsReaderBase(DelimitedTextReader):
         if self.need_to_read():
             self._read_up_front()
         # Generate the PolyData output
-        data = self._get_raw_data(idx=i)
-        output.DeepCopy(interface.points_to_poly_data(data, copy_z=self.get_copy_z()))
+        select = self._get_row_selector()
+        if self.get_chunk_size() or select is not None:
+            points, df = self._stream_file(
+                i,
+                points=True,
+                select=select,
+                chunksize=self.get_chunk_size() or 1000000,
+            )
+            poly = interface.points_to_poly_data(points, copy_z=self.get_copy_z())
+            table = interface.data_frame_to_table(df)
+            for j in range(table.GetNumberOfColumns()):
+                poly.GetPointData().AddArray(table.GetColumn(j))
+        else:
+            data = self._get_raw_data(idx=i)
+            poly = interface.points_to_poly_data(data, copy_z=self.get_copy_z())
+        output.ShallowCopy(poly)
         return 1
 
 
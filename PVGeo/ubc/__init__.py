@@ -4,15 +4,42 @@ from .tensor import *
 from .two_file_base import *
 from .write import *
 
-try:
-    from .disc_meshes import *
-    from .octree import *
-except ImportError:
-    pass
-
 __displayname__ = 'UBC Mesh Tools'
 
-# NOTE: The following are a list of classes that require discretize:
+# NOTE: The following are a list of classes that require discretize. These
+#       are loaded on first access so that discretize is only imported when
+#       needed:
 #       - DiscretizeMeshReader
 #       - OcTreeReader
 #       - OcTreeAppender
+from .._lazy import attach as _attach
+
+_OPTIONAL = {
+    'disc_meshes',
+    'octree',
+    'DiscretizeMeshReader',
+    'OcTreeReader',
+    'OcTreeAppender',
+}
+
+__getattr__, __dir__ = _attach(
+    __name__,
+    submodules=['disc_meshes', 'octree'],
+    attributes={
+        'DiscretizeMeshReader': 'disc_meshes',
+        'OcTreeReader': 'octree',
+        'OcTreeAppender': 'octree',
+    },
+    optional=['disc_meshes', 'octree'],
+)
+
+# Names exported by ``from PVGeo.ubc import *``: the discretize readers are
+# only exported if discretize is installed
+from importlib.util import find_spec as _find_spec
+
+__all__ = [
+    name
+    for name in __dir__()
+    if not name.startswith('_')
+    and (_find_spec('discretize') is not None or name not in _OPTIONAL)
+]
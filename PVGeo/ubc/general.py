@@ -10,10 +10,9 @@ __displayname__ = 'General Tools'
 
 import numpy as np
 import pandas as pd
-import vtk
-from vtk.numpy_interface import dataset_adapter as dsa
 
-from .. import _helpers, interface
+from .. import _helpers, _vtk, interface
+from .._vtk import dsa
 from ..base import FilterPreserveTypeBase
 from ..readers import DelimitedPointsReaderBase
 
@@ -29,6 +28,7 @@ class TopoReader(DelimitedPointsReaderBase):
     __category__ = 'reader'
     extensions = 'topo txt dat'
     description = 'PVGeo: UBC 3D Topo Files'
+    _memo_state = ('_TopoReader__npts',)
 
     def __init__(self, copy_z=True, **kwargs):
         DelimitedPointsReaderBase.__init__(self, copy_z=copy_z, **kwargs)
@@ -61,6 +61,7 @@ class GravObsReader(DelimitedPointsReaderBase):
     __category__ = 'reader'
     extensions = 'grv txt dat'
     description = 'PVGeo: GIF Gravity Observations'
+    _memo_state = ('_GravObsReader__npts',)
 
     def __init__(self, **kwargs):
         DelimitedPointsReaderBase.__init__(self, **kwargs)
@@ -94,6 +95,7 @@ class GravGradReader(DelimitedPointsReaderBase):
     __category__ = 'reader'
     extensions = 'grv gg txt dat'
     description = 'PVGeo: GIF Gravity Gradiometry Observations'
+    _memo_state = ('_GravGradReader__npts',)
 
     def __init__(self, **kwargs):
         DelimitedPointsReaderBase.__init__(self, **kwargs)
@@ -135,6 +137,15 @@ class MagObsReader(DelimitedPointsReaderBase):
     __category__ = 'reader'
     extensions = 'mag loc txt dat pre'
     description = 'PVGeo: GIF Magnetic Observations'
+    _memo_state = (
+        '_MagObsReader__npts',
+        '_MagObsReader__incl',
+        '_MagObsReader__decl',
+        '_MagObsReader__geomag',
+        '_MagObsReader__ainc',
+        '_MagObsReader__adec',
+        '_MagObsReader__dir',
+    )
 
     def __init__(self, **kwargs):
         DelimitedPointsReaderBase.__init__(self, **kwargs)
@@ -196,7 +207,7 @@ class MagObsReader(DelimitedPointsReaderBase):
 
         # Add inducing magnetic field
         x, y, z = self.convert_vector(self.__incl, self.__decl, mag=self.__geomag)
-        ind = vtk.vtkDoubleArray()
+        ind = _vtk.vtkDoubleArray()
         ind.SetName('Inducing Magnetic Field')
         ind.SetNumberOfComponents(3)
         ind.InsertNextTuple3(x, y, z)
@@ -204,7 +215,7 @@ class MagObsReader(DelimitedPointsReaderBase):
 
         # Add Inclination and declination of the anomaly projection
         x, y, z = self.convert_vector(self.__ainc, self.__adec)
-        anom = vtk.vtkDoubleArray()
+        anom = _vtk.vtkDoubleArray()
         anom.SetName('Anomaly Projection')
         anom.SetNumberOfComponents(3)
         anom.InsertNextTuple3(x, y, z)
@@ -261,7 +272,7 @@ class GeologyMapper(FilterPreserveTypeBase):
         geol = self._read_definitions(self.__filename, self.__deli)
         data = self._map_values(geol, arr)
 
-        pdo.DeepCopy(pdi)
+        self._copy_input(pdi, pdo)
         interface.add_arrays_from_data_frame(pdo, field, data)
 
         return 1
@@ -6,10 +6,9 @@ __all__ = [
 
 __displayname__ = 'OcTree Mesh'
 
-import vtk
-from vtk.util import numpy_support as nps
 
-from .. import _helpers, interface
+from .. import _helpers, _vtk, interface
+from .._vtk import nps
 from .two_file_base import ModelAppenderBase, ubcMeshReaderBase
 
 with _helpers.HiddenPrints():
@@ -25,6 +24,7 @@ class OcTreeReader(ubcMeshReaderBase):
     __displayname__ = 'UBC OcTree Mesh Reader'
     __category__ = 'reader'
     description = 'PVGeo: UBC OcTree Mesh'
+    _memo_state = ('_OcTreeReader__mesh', '_OcTreeReader__models')
 
     def __init__(self, nOutputPorts=1, outputType='vtkUnstructuredGrid', **kwargs):
         ubcMeshReaderBase.__init__(
@@ -169,14 +169,27 @@ class OcTreeReader(ubcMeshReaderBase):
             ext = self._read_extent()
             info = outInfo.GetInformationObject(0)
             # Set WHOLE_EXTENT: This is absolutely necessary
-            info.Set(vtk.vtkStreamingDemandDrivenPipeline.WHOLE_EXTENT(), ext, 6)
+            info.Set(_vtk.vtkStreamingDemandDrivenPipeline.WHOLE_EXTENT(), ext, 6)
         return 1
 
     def clear_mesh(self):
         """Use to clean/rebuild the mesh."""
-        self.__mesh = vtk.vtkUnstructuredGrid()
+        self.__mesh = _vtk.vtkUnstructuredGrid()
         ubcMeshReaderBase.clear_models(self)
 
+    def _get_memory_items(self):
+        """The mesh and models are held"""
+        items = ubcMeshReaderBase._get_memory_items(self)
+        return items + [self.__mesh, self.__models]
+
+    def _release_memory(self):
+        """Drop the mesh and models and read them again on demand"""
+        ubcMeshReaderBase._release_memory(self)
+        self.__mesh = None
+        self.__models = []
+        self.need_to_readMesh(flag=True)
+        self.need_to_readModels(flag=True)
+
     def clear_models(self):
         """Use to clean the models and reread the data"""
         self.__models = []
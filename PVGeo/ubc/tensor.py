@@ -11,9 +11,8 @@ import sys
 
 import numpy as np
 import pandas as pd
-import vtk
 
-from .. import _helpers, interface
+from .. import _helpers, _vtk, interface
 from ..base import AlgorithmBase
 from .two_file_base import ModelAppenderBase, ubcMeshReaderBase
 
@@ -23,6 +22,17 @@ else:
     from io import StringIO
 
 
+def _read_model_2d(FileName):
+    """Internal helper to parse a UBC 2D model file"""
+    dim = np.genfromtxt(FileName, dtype=int, delimiter=None, comments='!', max_rows=1)
+    names = ['col%d' % i for i in range(dim[0])]
+    df = pd.read_csv(FileName, names=names, sep=r'\s+', skiprows=1, comment='!')
+    data = df.values
+    if np.shape(data)[0] != dim[1] and np.shape(data)[1] != dim[0]:
+        raise _helpers.PVGeoError('Mode file `%s` improperly formatted.' % FileName)
+    return data.flatten(order='F')
+
+
 class TensorMeshReader(ubcMeshReaderBase):
     """UBC Mesh 2D/3D models are defined using a 2-file format. The "mesh" file
     describes how the data is discretized. The "model" file lists the physical
@@ -40,17 +50,18 @@ class TensorMeshReader(ubcMeshReaderBase):
     __displayname__ = 'UBC Tensor Mesh Reader'
     __category__ = 'reader'
     description = 'PVGeo: UBC Mesh 2D/3D Two-File Format'
+    _memo_state = ('_TensorMeshReader__models',)
 
     def __init__(self, nOutputPorts=1, outputType='vtkRectilinearGrid', **kwargs):
         ubcMeshReaderBase.__init__(
             self, nOutputPorts=nOutputPorts, outputType=outputType, **kwargs
         )
 
-        self.__mesh = vtk.vtkRectilinearGrid()
+        self.__mesh = _vtk.vtkRectilinearGrid()
         self.__models = []
 
     @staticmethod
-    def place_model_on_mesh(mesh, model, data_name='Data'):
+    def place_model_on_mesh(mesh, model, data_name='Data', whole_extent=None):
         """Places model data onto a mesh. This is for the UBC Grid data readers
         to associate model data with the mesh grid.
 
@@ -61,6 +72,9 @@ class TensorMeshReader(ubcMeshReaderBase):
                 place inside of the mesh's cells.
             data_name (str) : The name of the model data array once placed on the
                 ``vtkRectilinearGrid``.
+            whole_extent (tuple(int)): The extent of the whole mesh that the
+                model fills when the given mesh is only a sub extent of it.
+                Only the model data inside the mesh's extent is placed.
 
         Return:
             vtkRectilinearGrid :
@@ -68,13 +82,16 @@ class TensorMeshReader(ubcMeshReaderBase):
         """
         if isinstance(model, dict):
             for key in model.keys():
-                TensorMeshReader.place_model_on_mesh(mesh, model[key], data_name=key)
+                TensorMeshReader.place_model_on_mesh(
+                    mesh, model[key], data_name=key, whole_extent=whole_extent
+                )
             return mesh
 
         # model.GetNumberOfValues() if model is vtkDataArray
         # Make sure this model file fits the dimensions of the mesh
-        ext = mesh.GetExtent()
-        n1, n2, n3 = ext[1], ext[3], ext[5]
+        sub = mesh.GetExtent()
+        ext = sub if whole_extent is None else whole_extent
+        n1, n2, n3 = ext[1] - ext[0], ext[3] - ext[2], ext[5] - ext[4]
         if n1 * n2 * n3 < len(model):
             raise _helpers.PVGeoError(
                 'Model `%s` has more data than the given mesh has cells to hold.'
@@ -105,6 +122,10 @@ class TensorMeshReader(ubcMeshReaderBase):
             model = model[::-1, :, :]  # Note it is in Fortran ordering
             model = model.flatten()
 
+        if tuple(sub) != tuple(ext):
+            # Only keep the cells inside the mesh's extent
+            model = model[_helpers.extent_indices(ext, sub, cells=True)]
+
         # Convert data to VTK data structure and append to output
         c = interface.convert_array(model, name=data_name, deep=True)
         # THIS IS CELL DATA! Add the model data to CELL data:
@@ -194,18 +215,7 @@ class TensorMeshReader(ubcMeshReaderBase):
             for f in FileName:
                 out[os.path.basename(f)] = TensorMeshReader.ubc_model_2d(f)
             return out
-
-        dim = np.genfromtxt(
-            FileName, dtype=int, delimiter=None, comments='!', max_rows=1
-        )
-        names = ['col%d' % i for i in range(dim[0])]
-        df = pd.read_csv(
-            FileName, names=names, sep=r'\s+', skiprows=1, comment='!'
-        )
-        data = df.values
-        if np.shape(data)[0] != dim[1] and np.shape(data)[1] != dim[0]:
-            raise _helpers.PVGeoError('Mode file `%s` improperly formatted.' % FileName)
-        return data.flatten(order='F')
+        return _helpers.cached_parse(_read_model_2d, FileName, sidecar=True)
 
     def __ubc_mesh_data_2d(self, filename_mesh, filename_models, output):
         """Helper method to read a 2D mesh"""
@@ -245,7 +255,7 @@ class TensorMeshReader(ubcMeshReaderBase):
         """
 
         # --- Read in the mesh ---#
-        fileLines = np.genfromtxt(FileName, dtype=str, delimiter='\n', comments='!')
+        fileLines = _helpers.read_lines(FileName, comments='!')
 
         # Get mesh dimensions
         dim = np.array(fileLines[0].split('!')[0].split(), dtype=int)
@@ -351,10 +361,15 @@ class TensorMeshReader(ubcMeshReaderBase):
         self.__ubc_tensor_mesh(
             self.get_mesh_filename(), self.get_model_filenames(), output
         )
+        # Only build the requested extent of the mesh
+        whole = output.GetExtent()
+        ext = _helpers.get_update_extent(outInfo)
+        if ext != whole:
+            output.Crop(ext)
         # Place the model data for given timestep onto the mesh
         if len(self.__models) > i:
             TensorMeshReader.place_model_on_mesh(
-                output, self.__models[i], self.get_data_name()
+                output, self.__models[i], self.get_data_name(), whole_extent=whole
             )
         return 1
 
@@ -367,14 +382,28 @@ class TensorMeshReader(ubcMeshReaderBase):
             ext = self._read_extent()
             info = outInfo.GetInformationObject(0)
             # Set WHOLE_EXTENT: This is absolutely necessary
-            info.Set(vtk.vtkStreamingDemandDrivenPipeline.WHOLE_EXTENT(), ext, 6)
+            info.Set(_vtk.vtkStreamingDemandDrivenPipeline.WHOLE_EXTENT(), ext, 6)
+        _helpers.set_can_produce_sub_extent(outInfo)
         return 1
 
     def clear_mesh(self):
         """Use to clean/rebuild the mesh"""
-        self.__mesh = vtk.vtkRectilinearGrid()
+        self.__mesh = _vtk.vtkRectilinearGrid()
         ubcMeshReaderBase.clear_models(self)
 
+    def _get_memory_items(self):
+        """The mesh and models are held"""
+        items = ubcMeshReaderBase._get_memory_items(self)
+        return items + [self.__mesh, self.__models]
+
+    def _release_memory(self):
+        """Drop the mesh and models and read them again on demand"""
+        ubcMeshReaderBase._release_memory(self)
+        self.__mesh = _vtk.vtkRectilinearGrid()
+        self.__models = []
+        self.need_to_readMesh(flag=True)
+        self.need_to_readModels(flag=True)
+
     def clear_models(self):
         """Use to clean the models and reread"""
         self.__models = []
@@ -432,6 +461,12 @@ class TopoMeshAppender(AlgorithmBase):
 
     __displayname__ = 'Append UBC Discrete Topography'
     __category__ = 'filter'
+    _memo_state = (
+        '_TopoMeshAppender__indices',
+        '_TopoMeshAppender__need_to_read',
+        '_TopoMeshAppender__ne',
+        '_TopoMeshAppender__nn',
+    )
 
     def __init__(
         self, inputType='vtkRectilinearGrid', outputType='vtkRectilinearGrid', **kwargs
@@ -476,9 +511,7 @@ class TopoMeshAppender(AlgorithmBase):
     def _read_up_front(self):
         """Internal helepr to read data at start"""
         # Read the file
-        content = np.genfromtxt(
-            self._topoFileName, dtype=str, delimiter='\n', comments='!'
-        )
+        content = _helpers.read_lines(self._topoFileName, comments='!')
         dim = content[0].split()
         self.__ne, self.__nn = int(dim[0]), int(dim[1])
         self.__indices = pd.read_csv(
@@ -9,13 +9,17 @@ __displayname__ = 'Base Classes'
 import os
 
 import numpy as np
-import vtk
 
-from .. import _helpers, base
+from .. import _helpers, _vtk, base
 
 ###############################################################################
 
 
+def _read_model_3d(FileName):
+    """Internal helper to parse a UBC 3D model file"""
+    return np.genfromtxt(FileName, dtype=float, comments='!')
+
+
 # UBC Mesh Reader Base
 class ubcMeshReaderBase(base.TwoFileReaderBase):
     """A base class for the UBC mesh readers"""
@@ -47,7 +51,7 @@ class ubcMeshReaderBase(base.TwoFileReaderBase):
         """Internal helper to read 2D mesh file"""
         # This is a helper method to read file contents of mesh
         try:
-            fileLines = np.genfromtxt(FileName, dtype=str, delimiter='\n', comments='!')
+            fileLines = _helpers.read_lines(FileName, comments='!')
         except (IOError, OSError) as fe:
             raise _helpers.PVGeoError(str(fe))
 
@@ -147,7 +151,7 @@ class ubcMeshReaderBase(base.TwoFileReaderBase):
             return out
         # Perform IO
         try:
-            data = np.genfromtxt(FileName, dtype=float, comments='!')
+            data = _helpers.cached_parse(_read_model_3d, FileName, sidecar=True)
         except (IOError, OSError) as fe:
             raise _helpers.PVGeoError(str(fe))
         return data
@@ -185,6 +189,12 @@ class ModelAppenderBase(base.AlgorithmBase):
 
     __displayname__ = 'Model Appender Base'
     __category__ = 'base'
+    _memo_state = (
+        '_models',
+        '_ModelAppenderBase__need_to_read',
+        '_ModelAppenderBase__timesteps',
+        '_ModelAppenderBase__last_successfull_index',
+    )
 
     def __init__(
         self, inputType='vtkRectilinearGrid', outputType='vtkRectilinearGrid', **kwargs
@@ -278,7 +288,7 @@ class ModelAppenderBase(base.AlgorithmBase):
         self._update_time_steps()
         pdi = self.GetInputData(inInfo, 0, 0)
         # Determine if 2D or 3D and read
-        if isinstance(pdi, vtk.vtkRectilinearGrid) and pdi.GetExtent()[3] == 1:
+        if isinstance(pdi, _vtk.vtkRectilinearGrid) and pdi.GetExtent()[3] == 1:
             self._is_3D = False
         else:
             self._is_3D = True
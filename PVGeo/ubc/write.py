@@ -20,6 +20,7 @@ class ubcTensorMeshWriterBase(WriterBase):
 
     __displayname__ = 'UBC Format Writer Base'
     __category__ = 'base'
+    _memo_state = ('xcells', 'ycells', 'zcells', 'origin')
 
     def __init__(self, inputType='vtkRectilinearGrid'):
         WriterBase.__init__(self, inputType=inputType, ext='msh')
@@ -0,0 +1,62 @@
+"""Benchmarks for the filters that show scaling problems on large inputs."""
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+import synthetic  # noqa: E402
+
+from PVGeo.filters import (  # noqa: E402
+    AddCellConnToPoints,
+    ManySlicesAlongAxis,
+    ManySlicesAlongPoints,
+    SliceThroughTime,
+    SlideSliceAlongPoints,
+    VoxelizePoints,
+)
+from PVGeo.grids import ExtractTopography  # noqa: E402
+
+
+def bench_voxelize_points(run, size):
+    points = synthetic.regular_points(size)
+    output = run(lambda: VoxelizePoints().apply(points))
+    assert output.GetNumberOfCells() == points.GetNumberOfPoints()
+
+
+def bench_add_cell_conn_to_points(run, size):
+    points = synthetic.point_set(size)
+    output = run(lambda: AddCellConnToPoints().apply(points))
+    assert output.GetNumberOfCells() > 0
+
+
+@pytest.mark.parametrize('op', ['underneath', 'intersection'])
+def bench_extract_topography(run, size, op):
+    grid = synthetic.rectilinear_grid(size)
+    topo = synthetic.topography(grid, max(size // 10, 1000))
+    output = run(lambda: ExtractTopography(op=op, tolerance=10.0).apply(grid, topo))
+    assert output.GetNumberOfCells() == grid.GetNumberOfCells()
+
+
+def bench_many_slices_along_axis(run, size):
+    grid = synthetic.rectilinear_grid(size)
+    output = run(lambda: ManySlicesAlongAxis(n_slices=10, axis=0).apply(grid))
+    assert output.GetNumberOfBlocks() == 10
+
+
+def bench_slice_through_time(run, size):
+    grid = synthetic.rectilinear_grid(size)
+    output = run(lambda: SliceThroughTime(n_slices=10, axis=1).apply(grid))
+    assert output.GetNumberOfCells() > 0
+
+
+def bench_many_slices_along_points(run, size):
+    grid = synthetic.rectilinear_grid(size)
+    path = synthetic.path(grid)
+    output = run(lambda: ManySlicesAlongPoints(n_slices=10).apply(path, grid))
+    assert output.GetNumberOfBlocks() == 10
+
+
+def bench_slide_slice_along_points(run, size):
+    grid = synthetic.rectilinear_grid(size)
+    path = synthetic.path(grid)
+    output = run(lambda: SlideSliceAlongPoints(n_slices=10).apply(path, grid))
+    assert output.GetNumberOfCells() > 0
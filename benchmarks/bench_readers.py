@@ -0,0 +1,88 @@
+"""Benchmarks for the file readers. A new reader is made for every round so
+that the time to parse the file is always measured."""
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+import synthetic  # noqa: E402
+
+from PVGeo.grids import SurferGridReader  # noqa: E402
+from PVGeo.gslib import GSLibReader, SGeMSGridReader  # noqa: E402
+from PVGeo.readers import DelimitedTextReader  # noqa: E402
+from PVGeo.ubc import TensorMeshReader  # noqa: E402
+
+
+def _read(reader, filenames):
+    for f in filenames:
+        reader.AddFileName(f)
+    reader.Update()
+    return reader.GetOutputDataObject(0)
+
+
+def bench_delimited_text_reader(run, data_dir, size):
+    filename = synthetic.delimited_text_file(data_dir, size)
+
+    def read():
+        reader = DelimitedTextReader(has_titles=True, delimiter=' ')
+        return _read(reader, [filename])
+
+    output = run(read)
+    assert output.GetNumberOfRows() == size
+
+
+def bench_gslib_reader(run, data_dir, size):
+    filename = synthetic.gslib_file(data_dir, size)
+    output = run(lambda: _read(GSLibReader(), [filename]))
+    assert output.GetNumberOfRows() == size
+
+
+def bench_sgems_grid_reader(run, data_dir, size):
+    filename = synthetic.sgems_file(data_dir, size)
+    output = run(lambda: _read(SGeMSGridReader(), [filename]))
+    assert output.GetNumberOfCells() > 0
+
+
+@pytest.mark.parametrize(
+    'generator',
+    [
+        synthetic.surfer7bin_file,
+        synthetic.surfer6bin_file,
+        synthetic.surfer6ascii_file,
+    ],
+    ids=['surfer7bin', 'surfer6bin', 'surfer6ascii'],
+)
+def bench_surfer_grid_reader(run, data_dir, size, generator):
+    filename = generator(data_dir, size)
+    output = run(lambda: _read(SurferGridReader(), [filename]))
+    assert output.GetNumberOfPoints() > 0
+
+
+def bench_tensor_mesh_reader(run, data_dir, size):
+    mesh, model = synthetic.tensor_mesh_files(data_dir, size)
+
+    def read():
+        reader = TensorMeshReader()
+        reader.set_mesh_filename(mesh)
+        reader.add_model_file_name(model)
+        reader.Update()
+        return reader.GetOutputDataObject(0)
+
+    output = run(read)
+    assert output.GetNumberOfCells() > 0
+
+
+def bench_octree_reader(run, data_dir, size):
+    pytest.importorskip('discretize')
+    from PVGeo.ubc import OcTreeReader
+
+    mesh, model = synthetic.octree_mesh_files(data_dir, size)
+
+    def read():
+        reader = OcTreeReader()
+        reader.set_mesh_filename(mesh)
+        reader.add_model_file_name(model)
+        reader.Update()
+        return reader.GetOutputDataObject(0)
+
+    output = run(read)
+    assert output.GetNumberOfCells() > 0
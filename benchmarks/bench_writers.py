@@ -0,0 +1,66 @@
+"""Benchmarks for every ``WriterBase`` subclass."""
+import os
+
+import pytest
+
+pytest.importorskip('pytest_benchmark')
+
+import synthetic  # noqa: E402
+
+from PVGeo.grids import WriteCellCenterData, WriteImageDataToSurfer  # noqa: E402
+from PVGeo.gslib import WriteImageDataToSGeMS, WriteTableToGSLib  # noqa: E402
+from PVGeo.ubc import WriteImageDataToUBC, WriteRectilinearGridToUBC  # noqa: E402
+
+
+def _write(writer, data, filename):
+    writer.SetFileName(filename)
+    writer.Write(data)
+    return filename
+
+
+def bench_write_table_to_gslib(run, size, out_dir):
+    table = synthetic.table(size)
+    filename = os.path.join(out_dir, 'table.gslib')
+    run(lambda: _write(WriteTableToGSLib(), table, filename))
+    assert os.path.exists(filename)
+
+
+def bench_write_image_data_to_sgems(run, size, out_dir):
+    img = synthetic.image_data(size)
+    filename = os.path.join(out_dir, 'grid.SGeMS')
+    run(lambda: _write(WriteImageDataToSGeMS(), img, filename))
+    assert os.path.exists(filename)
+
+
+def bench_write_image_data_to_surfer(run, size, out_dir):
+    img = synthetic.image_data(size, two_d=True)
+    filename = os.path.join(out_dir, 'grid.grd')
+
+    def write():
+        writer = WriteImageDataToSurfer()
+        writer.SetInputArrayToProcess(0, 0, 0, 0, 'Data')
+        return _write(writer, img, filename)
+
+    run(write)
+    assert os.path.exists(filename)
+
+
+def bench_write_cell_center_data(run, size, out_dir):
+    img = synthetic.image_data(size)
+    filename = os.path.join(out_dir, 'centers.txt')
+    run(lambda: _write(WriteCellCenterData(), img, filename))
+    assert os.path.exists(filename)
+
+
+def bench_write_image_data_to_ubc(run, size, out_dir):
+    img = synthetic.image_data(size)
+    filename = os.path.join(out_dir, 'image.msh')
+    run(lambda: _write(WriteImageDataToUBC(), img, filename))
+    assert os.path.exists(filename)
+
+
+def bench_write_rectilinear_grid_to_ubc(run, size, out_dir):
+    grid = synthetic.rectilinear_grid(size)
+    filename = os.path.join(out_dir, 'tensor.msh')
+    run(lambda: _write(WriteRectilinearGridToUBC(), grid, filename))
+    assert os.path.exists(filename)
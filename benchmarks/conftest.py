@@ -0,0 +1,63 @@
+"""Shared fixtures for the benchmark suite.
+
+The sizes that are benchmarked are controlled with the ``PVGEO_BENCH_SIZES``
+environment variable: a comma separated list of element counts (defaults to
+``1e4``). For example, ``PVGEO_BENCH_SIZES=1e4,1e6,1e7`` runs the full
+production scale suite. Generated input files are written to
+``PVGEO_BENCH_DATA`` (if set) so they can be reused between runs; otherwise a
+temporary directory is used.
+"""
+import os
+import sys
+
+import pytest
+
+# Make ``synthetic`` and the in-tree ``PVGeo`` importable however pytest is invoked
+HERE = os.path.dirname(os.path.abspath(__file__))
+for path in (HERE, os.path.dirname(HERE)):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+DEFAULT_SIZES = '1e4'
+
+
+def get_sizes():
+    """Get the list of element counts to benchmark"""
+    sizes = os.environ.get('PVGEO_BENCH_SIZES', DEFAULT_SIZES)
+    return [int(float(s)) for s in sizes.split(',') if s.strip()]
+
+
+def pytest_generate_tests(metafunc):
+    if 'size' in metafunc.fixturenames:
+        sizes = get_sizes()
+        metafunc.parametrize('size', sizes, ids=['%.0e' % s for s in sizes])
+
+
+@pytest.fixture(scope='session')
+def data_dir(tmp_path_factory):
+    """Directory holding the generated input files"""
+    path = os.environ.get('PVGEO_BENCH_DATA', None)
+    if path:
+        os.makedirs(path, exist_ok=True)
+        return path
+    return str(tmp_path_factory.mktemp('pvgeo-bench-data'))
+
+
+@pytest.fixture
+def out_dir(tmp_path):
+    """Directory for the writers to write to"""
+    return str(tmp_path)
+
+
+@pytest.fixture
+def run(benchmark, size):
+    """Benchmark a callable, using fewer rounds for the larger sizes so the
+    full suite finishes in a reasonable amount of time."""
+
+    def _run(func, *args, **kwargs):
+        rounds = 5 if size <= 100000 else 1
+        return benchmark.pedantic(
+            func, args=args, kwargs=kwargs, rounds=rounds, iterations=1
+        )
+
+    return _run
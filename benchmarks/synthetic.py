@@ -0,0 +1,260 @@
+"""Generators for the synthetic inputs used by the benchmark suite. Every
+generator takes the number of elements (rows, cells, or grid nodes) and
+produces data of roughly that size so the readers, filters, and writers can be
+timed at production scale.
+"""
+import os
+from struct import pack
+
+import numpy as np
+import vtk
+from vtk.util import numpy_support as nps
+
+import PVGeo
+from PVGeo import interface
+
+SEED = 1234
+
+
+def _rng():
+    return np.random.RandomState(SEED)
+
+
+def grid_shape_2d(n):
+    """Get a nearly square 2D shape with about ``n`` nodes"""
+    nx = max(int(np.sqrt(n)), 2)
+    ny = max(int(n // nx), 2)
+    return nx, ny
+
+
+def grid_shape_3d(n):
+    """Get a nearly cubic 3D shape with about ``n`` cells"""
+    nx = max(int(round(n ** (1.0 / 3.0))), 2)
+    ny = nx
+    nz = max(int(n // (nx * ny)), 2)
+    return nx, ny, nz
+
+
+def _write_table(filename, header, data):
+    # ``np.savetxt`` is painfully slow at 1e7 rows so write in blocks
+    with open(filename, 'w') as f:
+        f.write(header)
+        for start in range(0, len(data), 1000000):
+            block = data[start : start + 1000000]
+            np.savetxt(f, block, fmt='%.6f', delimiter=' ')
+    return filename
+
+
+def points(n, ncols=3):
+    """Random XYZ (plus extra attribute columns) as a NumPy array"""
+    rng = _rng()
+    arr = rng.uniform(0.0, 1000.0, size=(n, ncols))
+    return arr
+
+
+def delimited_text_file(directory, n):
+    """A space delimited text file of ``n`` rows with titles"""
+    filename = os.path.join(directory, 'delimited-%d.txt' % n)
+    if not os.path.exists(filename):
+        _write_table(filename, 'x y z a b\n', points(n, 5))
+    return filename
+
+
+def gslib_file(directory, n):
+    """A GSLib file of ``n`` rows"""
+    filename = os.path.join(directory, 'table-%d.gslib' % n)
+    if not os.path.exists(filename):
+        names = ['x', 'y', 'z', 'a', 'b']
+        header = 'Synthetic benchmark data\n%d\n%s\n' % (len(names), '\n'.join(names))
+        _write_table(filename, header, points(n, len(names)))
+    return filename
+
+
+def sgems_file(directory, n):
+    """An SGeMS grid file of about ``n`` cells"""
+    filename = os.path.join(directory, 'grid-%d.sgems' % n)
+    nx, ny, nz = grid_shape_3d(n)
+    if not os.path.exists(filename):
+        names = ['a', 'b']
+        header = '%d %d %d\n%d\n%s\n' % (nx, ny, nz, len(names), '\n'.join(names))
+        _write_table(filename, header, points(nx * ny * nz, len(names)))
+    return filename
+
+
+def _surfer_data(n):
+    nx, ny = grid_shape_2d(n)
+    data = _rng().uniform(0.0, 100.0, size=nx * ny)
+    return nx, ny, data
+
+
+def surfer7bin_file(directory, n):
+    """A Surfer 7 binary grid of about ``n`` nodes"""
+    filename = os.path.join(directory, 'surfer7-%d.grd' % n)
+    if os.path.exists(filename):
+        return filename
+    nx, ny, data = _surfer_data(n)
+    with open(filename, 'wb') as f:
+        f.write(pack('4s', b'DSRB'))
+        f.write(pack('<ii', 4, 1))
+        f.write(pack('4s', b'GRID'))
+        f.write(pack('<i', 72))
+        f.write(pack('<ii', ny, nx))
+        f.write(
+            pack('<8d', 0.0, 0.0, 1.0, 1.0, data.min(), data.max(), 0.0, 1.70141e38)
+        )
+        f.write(pack('4s', b'DATA'))
+        f.write(pack('<i', nx * ny * 8))
+        f.write(data.astype('<f8').tobytes())
+    return filename
+
+
+def surfer6bin_file(directory, n):
+    """A Surfer 6 binary grid of about ``n`` nodes"""
+    filename = os.path.join(directory, 'surfer6-%d.grd' % n)
+    if os.path.exists(filename):
+        return filename
+    nx, ny, data = _surfer_data(n)
+    with open(filename, 'wb') as f:
+        f.write(pack('4s', b'DSBB'))
+        f.write(pack('<hh', nx, ny))
+        f.write(
+            pack('<6d', 0.0, nx - 1.0, 0.0, ny - 1.0, data.min(), data.max())
+        )
+        f.write(data.astype('<f4').tobytes())
+    return filename
+
+
+def surfer6ascii_file(directory, n):
+    """A Surfer 6 ASCII grid of about ``n`` nodes"""
+    filename = os.path.join(directory, 'surfer6ascii-%d.grd' % n)
+    if os.path.exists(filename):
+        return filename
+    nx, ny, data = _surfer_data(n)
+    header = 'DSAA\n%d %d\n%f %f\n%f %f\n%f %f\n' % (
+        nx,
+        ny,
+        0.0,
+        nx - 1.0,
+        0.0,
+        ny - 1.0,
+        data.min(),
+        data.max(),
+    )
+    _write_table(filename, header, data.reshape((ny, nx)))
+    return filename
+
+
+def tensor_mesh_files(directory, n):
+    """A UBC tensor mesh and model file pair of about ``n`` cells"""
+    mesh = os.path.join(directory, 'tensor-%d.msh' % n)
+    model = os.path.join(directory, 'tensor-%d.mod' % n)
+    if os.path.exists(mesh) and os.path.exists(model):
+        return mesh, model
+    nx, ny, nz = grid_shape_3d(n)
+    with open(mesh, 'w') as f:
+        f.write('%d %d %d\n' % (nx, ny, nz))
+        f.write('0.0 0.0 0.0\n')
+        f.write('%d*10.0\n' % nx)
+        f.write('%d*10.0\n' % ny)
+        f.write('%d*5.0\n' % nz)
+    _write_table(model, '', _rng().uniform(size=(nx * ny * nz, 1)))
+    return mesh, model
+
+
+def octree_mesh_files(directory, n):
+    """A UBC OcTree mesh and model file pair. The tree is refined uniformly so
+    the number of cells is the power of eight closest to ``n``.
+    """
+    import discretize
+
+    level = max(int(round(np.log(n) / np.log(8))), 1)
+    mesh = os.path.join(directory, 'octree-%d.msh' % n)
+    model = os.path.join(directory, 'octree-%d.mod' % n)
+    if os.path.exists(mesh) and os.path.exists(model):
+        return mesh, model
+    h = np.ones(2 ** level)
+    tree = discretize.TreeMesh([h, h, h])
+    tree.refine(level)
+    tree.write_UBC(mesh)
+    _write_table(model, '', _rng().uniform(size=(tree.n_cells, 1)))
+    return mesh, model
+
+
+def point_set(n):
+    """A ``vtkPolyData`` of ``n`` random points with one attribute"""
+    pts = points(n, 4)
+    return interface.points_to_poly_data(pts)
+
+
+def regular_points(n):
+    """A ``vtkPolyData`` of about ``n`` points on a regular 3D lattice"""
+    nx, ny, nz = grid_shape_3d(n)
+    x, y, z = np.meshgrid(
+        np.arange(nx) * 10.0, np.arange(ny) * 10.0, np.arange(nz) * 5.0, indexing='ij'
+    )
+    return interface.points_to_poly_data(np.c_[x.ravel(), y.ravel(), z.ravel()])
+
+
+def image_data(n, two_d=False):
+    """A ``vtkImageData`` of about ``n`` cells with cell and point data"""
+    if two_d:
+        nx, ny = grid_shape_2d(n)
+        dims = (nx, ny, 1)
+    else:
+        nx, ny, nz = grid_shape_3d(n)
+        dims = (nx + 1, ny + 1, nz + 1)
+    img = vtk.vtkImageData()
+    img.SetDimensions(dims)
+    img.SetSpacing(10.0, 10.0, 5.0)
+    img.SetOrigin(0.0, 0.0, 0.0)
+    rng = _rng()
+    cells = nps.numpy_to_vtk(rng.uniform(size=img.GetNumberOfCells()), deep=1)
+    cells.SetName('Data')
+    img.GetCellData().AddArray(cells)
+    pts = nps.numpy_to_vtk(rng.uniform(size=img.GetNumberOfPoints()), deep=1)
+    pts.SetName('Data')
+    img.GetPointData().AddArray(pts)
+    return img
+
+
+def rectilinear_grid(n):
+    """A ``vtkRectilinearGrid`` of about ``n`` cells with cell data"""
+    nx, ny, nz = grid_shape_3d(n)
+    grid = PVGeo.model_build.CreateTensorMesh(
+        xcellstr='%d*10.0' % nx,
+        ycellstr='%d*10.0' % ny,
+        zcellstr='%d*5.0' % nz,
+    ).apply()
+    return grid
+
+
+def table(n):
+    """A ``vtkTable`` of ``n`` rows"""
+    names = ['x', 'y', 'z', 'a', 'b']
+    data = points(n, len(names))
+    tbl = vtk.vtkTable()
+    for i, name in enumerate(names):
+        arr = nps.numpy_to_vtk(data[:, i], deep=1)
+        arr.SetName(name)
+        tbl.AddColumn(arr)
+    return tbl
+
+
+def topography(grid, n):
+    """Random topography points within the XY bounds of a grid"""
+    bnds = grid.GetBounds()
+    rng = _rng()
+    x = rng.uniform(bnds[0], bnds[1], n)
+    y = rng.uniform(bnds[2], bnds[3], n)
+    zmid = 0.5 * (bnds[4] + bnds[5])
+    z = rng.uniform(zmid - 0.1 * (bnds[5] - bnds[4]), zmid, n)
+    return interface.points_to_poly_data(np.c_[x, y, z])
+
+
+def path(grid, n=100):
+    """A curved path of points across the XY plane of a grid"""
+    bnds = grid.GetBounds()
+    y = np.linspace(bnds[2], bnds[3], n)
+    x = bnds[0] + (bnds[1] - bnds[0]) * (0.25 + 0.5 * np.sin(np.linspace(0, np.pi, n)))
+    z = np.full(n, 0.5 * (bnds[4] + bnds[5]))
+    return interface.points_to_poly_data(np.c_[x, y, z])
@@ -426,6 +426,46 @@ class TestVoxelizePoints(TestBase):
         self.assertTrue(np.allclose(celldata, rand))
         return
 
+    def test_composite(self):
+        """`VoxelizePoints`: the recovered spacings are from the last block"""
+        mb = vtk.vtkMultiBlockDataSet()
+        for i, d in enumerate([1.0, 2.0, 3.0, 4.0]):
+            x, y = np.meshgrid(np.arange(5) * d, np.arange(5) * d)
+            pts = np.c_[x.ravel(), y.ravel(), np.zeros(25)]
+            mb.SetBlock(i, interface.points_to_poly_data(pts))
+        for _ in range(3):
+            v = VoxelizePoints(workers=4)
+            output = v.apply(mb)
+            self.assertEqual(output.GetNumberOfBlocks(), 4)
+            self.assertTrue(np.allclose(v.get_spacing()[0:2], [4.0, 4.0]))
+            # Every block holds its own recovered spacings
+            for i, d in enumerate([1.0, 2.0, 3.0, 4.0]):
+                fd = output.GetBlock(i).GetFieldData()
+                spacing = fd.GetArray('Recovered Cell Sizes').GetTuple3(0)
+                self.assertTrue(np.allclose(spacing[0:2], [d, d]))
+
+    def test_memoize(self):
+        """`VoxelizePoints`: recovering the spacings does not miss the memo"""
+        runs = []
+
+        class CountingVoxelize(VoxelizePoints):
+            def RequestData(self, request, inInfo, outInfo):
+                runs.append(1)
+                return VoxelizePoints.RequestData(self, request, inInfo, outInfo)
+
+        v = CountingVoxelize(memoize=True)
+        v.SetInputDataObject(interface.points_to_poly_data(ROTATED_POINTS))
+        for _ in range(3):
+            v.Modified()
+            v.Update()
+        self.assertEqual(len(runs), 1)
+        self.assertEqual(v.GetOutput().GetNumberOfCells(), len(ROTATED_POINTS))
+        # Parameters still decide the key
+        v.set_estimate_grid(False)
+        v.set_deltas(1.0, 1.0, 1.0)
+        v.Update()
+        self.assertEqual(len(runs), 2)
+
 
 ###############################################################################
 
@@ -539,6 +579,86 @@ class TestArrayMath(TestBase):
         check = np.correlate(self.arrs[1], self.arrs[0], mode='same')
         self._gen_and_check(op, check, flip=True)
 
+    def test_memoize(self):
+        """`ArrayMath`: memoized outputs are reused"""
+        runs = []
+
+        class CountingMath(ArrayMath):
+            def RequestData(self, request, inInfo, outInfo):
+                runs.append(self.get_multiplier())
+                return ArrayMath.RequestData(self, request, inInfo, outInfo)
+
+        f = CountingMath(memoize=True)
+        f.set_operation('add')
+        f.set_new_array_name('test')
+        check = self.arrs[0] + self.arrs[1]
+        for mult in [1.0, 2.0, 1.0, 2.0]:
+            f.set_multiplier(mult)
+            output = f.apply(self.t0, self.titles[0], self.titles[1])
+            wout = dsa.WrapDataObject(output)
+            self.assertTrue(np.allclose(wout.RowData['test'], check * mult, rtol=RTOL))
+        self.assertEqual(runs, [1.0, 2.0])
+        # A modified input is not a hit
+        self.t0.Modified()
+        f.apply(self.t0, self.titles[0], self.titles[1])
+        self.assertEqual(len(runs), 3)
+        # Outputs are not memoized with parameters that cannot be fingerprinted
+        f.opaque = object()
+        for _ in range(2):
+            f.Modified()
+            f.apply(self.t0, self.titles[0], self.titles[1])
+        self.assertEqual(len(runs), 5)
+
+    def test_composite(self):
+        """`ArrayMath`: run on each block of a multi block dataset"""
+        mb = vtk.vtkMultiBlockDataSet()
+        tables = []
+        for i in range(4):
+            t = vtk.vtkTable()
+            t.AddColumn(interface.convert_array(self.arrs[0] * i, self.titles[0]))
+            t.AddColumn(interface.convert_array(self.arrs[1], self.titles[1]))
+            mb.SetBlock(i, t)
+            mb.GetMetaData(i).Set(vtk.vtkCompositeDataSet.NAME(), 'Table %d' % i)
+            tables.append(t)
+        f = ArrayMath(operation='add', new_name='test', workers=2)
+        output = f.apply(mb, self.titles[0], self.titles[1])
+        self.assertIsInstance(output, vtk.vtkMultiBlockDataSet)
+        self.assertEqual(output.GetNumberOfBlocks(), 4)
+        for i in range(4):
+            name = output.GetMetaData(i).Get(vtk.vtkCompositeDataSet.NAME())
+            self.assertEqual(name, 'Table %d' % i)
+            wout = dsa.WrapDataObject(output.GetBlock(i))
+            check = self.arrs[0] * i + self.arrs[1]
+            self.assertTrue(np.allclose(wout.RowData['test'], check, rtol=RTOL))
+        # A single table still gives a table
+        output = f.apply(tables[1], self.titles[0], self.titles[1])
+        self.assertIsInstance(output, vtk.vtkTable)
+
+    def test_apply_many(self):
+        """`ArrayMath`: run on many tables in a pool of processes"""
+        inputs = [(self.t0, self.titles[0], self.titles[1])] * 3
+        outputs = ArrayMath.apply_many(inputs, workers=2, operation='add', new_name='test')
+        self.assertEqual(len(outputs), 3)
+        check = self.arrs[0] + self.arrs[1]
+        for output in outputs:
+            wout = dsa.WrapDataObject(output)
+            self.assertTrue(np.allclose(wout.RowData['test'], check, rtol=RTOL))
+
+    def test_shallow_copy(self):
+        """`ArrayMath`: shallow copy output shares the input arrays"""
+        f = ArrayMath(shallow_copy=True)
+        f.set_operation('add')
+        f.set_new_array_name('test')
+        output = f.apply(self.t0, self.titles[0], self.titles[1])
+        self.assertTrue(f.get_shallow_copy())
+        shared = f.GetOutputDataObject(0).GetColumnByName(self.titles[0])
+        self.assertIs(shared, self.t0.GetColumnByName(self.titles[0]))
+        self.assertEqual(output.GetNumberOfColumns(), 3)
+        # The input is left untouched
+        self.assertEqual(self.t0.GetNumberOfColumns(), 2)
+        wout = dsa.WrapDataObject(output)
+        self.assertTrue(np.allclose(wout.RowData['test'], self.arrs[0] + self.arrs[1]))
+
 
 ###############################################################################
 
@@ -910,6 +1030,17 @@ class TestPercentThreshold(TestBase):
         thresh = PercentThreshold(percent=75).apply(data, 'Random Data')
         self.assertTrue(isinstance(thresh, vtk.vtkUnstructuredGrid))
 
+    def test_composite(self):
+        """`PercentThreshold`: threshold each block of a multi block dataset"""
+        data = PVGeo.model_build.CreateTensorMesh().apply()
+        mb = pyvista.MultiBlock({'a': data, 'b': data.copy()})
+        thresh = PercentThreshold(percent=75).apply(mb, 'Random Data')
+        single = PercentThreshold(percent=75).apply(data, 'Random Data')
+        self.assertEqual(thresh.keys(), ['a', 'b'])
+        for block in thresh:
+            self.assertTrue(isinstance(block, vtk.vtkUnstructuredGrid))
+            self.assertEqual(block.n_cells, single.n_cells)
+
 
 ###############################################################################
 
@@ -332,6 +332,50 @@ class TestSurferGridReader(TestBase):
         self.assertTrue(np.allclose(imgArr, readArr))
         return
 
+    def test_sub_extent(self):
+        """`SurferGridReader`: only build the requested extent"""
+        reader = SurferGridReader()
+        reader.AddFileName(self.filename)
+        reader.Update()
+        full = vtk.vtkImageData()
+        full.DeepCopy(reader.GetOutputDataObject(0))
+        ext = (10, 49, 20, 79, 0, 0)
+        reader = SurferGridReader()
+        reader.AddFileName(self.filename)
+        reader.UpdateExtent(ext)
+        img = reader.GetOutputDataObject(0)
+        self.assertEqual(img.GetExtent(), ext)
+        full.Crop(ext)
+        arr = dsa.WrapDataObject(img).PointData['Data']
+        self.assertEqual(len(arr), 40 * 60)
+        self.assertTrue(np.allclose(arr, dsa.WrapDataObject(full).PointData['Data']))
+        # Pieces are split by extent
+        reader.UpdatePiece(1, 4, 0)
+        self.assertLess(reader.GetOutputDataObject(0).GetNumberOfPoints(), 222 * 182)
+
+    def test_lazy(self):
+        """`SurferGridReader`: read a series on demand"""
+        filenames = []
+        for i in range(3):
+            filename = os.path.join(self.test_dir, 'series%d.grd' % i)
+            shutil.copy(self.filename, filename)
+            filenames.append(filename)
+        reader = SurferGridReader(lazy=True, prefetch=True)
+        reader.AddFileName(filenames)
+        reader.Update()
+        self.assertEqual(reader.GetOutput().GetDimensions(), (222, 182, 1))
+        tsteps = reader.get_time_step_values()
+        reader.UpdateTimeStep(tsteps[2])
+        self.assertEqual(reader.GetOutput().GetDimensions(), (222, 182, 1))
+
+    def test_memoize_extents(self):
+        """`SurferGridReader`: memoized outputs of different extents"""
+        reader = SurferGridReader(memoize=True)
+        reader.AddFileName(self.filename)
+        for extent in [(10, 49, 20, 79, 0, 0), (0, 5, 0, 5, 0, 0), (10, 49, 20, 79, 0, 0)]:
+            reader.UpdateExtent(extent)
+            self.assertEqual(reader.GetOutput().GetExtent(), extent)
+
 
 ###############################################################################
 
@@ -1,3 +1,4 @@
+import gc
 import os
 import shutil
 import tempfile
@@ -11,7 +12,14 @@ from vtk.numpy_interface import dataset_adapter as dsa
 from vtk.util import numpy_support as nps
 
 # Functionality to test:
-from PVGeo.gslib import GSLibReader, SGeMSGridReader, WriteImageDataToSGeMS, WriteTableToGSLib
+from PVGeo import _helpers
+from PVGeo.gslib import (
+    GSLibPointSetReader,
+    GSLibReader,
+    SGeMSGridReader,
+    WriteImageDataToSGeMS,
+    WriteTableToGSLib,
+)
 
 RTOL = 0.000001
 
@@ -38,6 +46,7 @@ class TestGSLibReader(TestBase):
             header.append(ln + '\n')
         header = '\n'.join(header)
         np.savetxt(filename, self.data, delimiter=' ', header=header, comments='')
+        self.filename = filename
         # Set up the reader
         reader = GSLibReader()
         reader.AddFileName(filename)
@@ -86,6 +95,35 @@ class TestGSLibReader(TestBase):
         reader.Update()
         self.assertTrue(reader.error_occurred())
 
+    def test_header_only_read(self):
+        """`GSLibReader`: parsing the header does not read the whole file"""
+        filename = os.path.join(self.test_dir, 'test_large.dat')
+        header = '\n'.join(['A header line', '%d' % len(self.titles)] + self.titles)
+        data = np.tile(self.data, (50, 1))
+        np.savetxt(filename, data, delimiter=' ', header=header, comments='')
+        lines = _helpers.FileLines(filename)
+        titles, content = GSLibReader()._extract_header(lines)
+        self.assertEqual(list(titles), self.titles)
+        self.assertFalse(lines._FileLines__state['eof'])
+        self.assertLess(len(lines._FileLines__state['lines']), 100)
+        # The data is then parsed from where the header ends
+        table = GSLibReader().apply(filename)
+        self.assertEqual(table.GetNumberOfRows(), len(data))
+
+    def test_point_set_read(self):
+        """`GSLibPointSetReader`: the vertices outlive the read"""
+        poly = GSLibPointSetReader().apply(self.filename)
+        gc.collect()
+        # Reuse any memory that was freed
+        _ = [np.full(self.n + 1, 7, dtype=np.int64) for _ in range(200)]
+        verts = poly.GetVerts()
+        self.assertEqual(verts.GetNumberOfCells(), self.n)
+        conn = nps.vtk_to_numpy(verts.GetConnectivityArray())
+        self.assertTrue(np.array_equal(conn, np.arange(self.n)))
+        offsets = nps.vtk_to_numpy(verts.GetOffsetsArray())
+        self.assertTrue(np.array_equal(offsets, np.arange(self.n + 1)))
+        self.assertTrue(np.allclose(poly.points, self.data))
+
     def test_writer(self):
         """`WriteTableToGSLib`: check data integrity across I/O"""
         writer = WriteTableToGSLib()
@@ -1,3 +1,8 @@
+import gc
+import os
+import shutil
+import tempfile
+
 from base import TestBase
 import numpy as np
 import pandas as pd
@@ -6,7 +11,7 @@ import pandas as pd
 import vtk
 from vtk.numpy_interface import dataset_adapter as dsa
 
-from PVGeo import interface
+from PVGeo import _helpers, interface
 
 # Functionality to test:
 from PVGeo._helpers import xml
@@ -71,6 +76,360 @@ class TestDataFrameConversions(TestBase):
             self.assertTrue(np.allclose(df[name], dfo[name], rtol=RTOL))
         return
 
+    def test_shared_memory(self):
+        """`data_frame_to_table`: numeric columns are shared, not copied"""
+        df = pd.DataFrame(
+            {
+                'a': np.random.rand(50),
+                'b': np.arange(50),
+                'c': ['foo%d' % i for i in range(50)],
+            }
+        )
+        table = interface.data_frame_to_table(df)
+        arr = interface.convert_array(table.GetColumnByName('a'))
+        self.assertTrue(np.shares_memory(arr, df['a'].values))
+        self.assertEqual(table.GetColumnByName('c').GetValue(3), 'foo3')
+        dfo = interface.table_to_data_frame(table)
+        self.assertTrue(np.shares_memory(dfo['a'].values, arr))
+        self.assertTrue(np.allclose(dfo['b'], df['b']))
+        self.assertEqual(list(dfo['c']), list(df['c']))
+        # Deep copies do not share memory
+        table = interface.data_frame_to_table(df, deep=True)
+        arr = interface.convert_array(table.GetColumnByName('a'))
+        self.assertFalse(np.shares_memory(arr, df['a'].values))
+        dfo = interface.table_to_data_frame(table, deep=True)
+        self.assertFalse(np.shares_memory(dfo['a'].values, arr))
+        return
+
+
+class TestBuildCellArray(TestBase):
+    """
+    Test building ``vtkCellArray`` objects from offsets and connectivity
+    """
+
+    def test_uniform(self):
+        """`build_cell_array`: cells of the same size share the given array"""
+        conn = np.arange(24, dtype=np.int64).reshape((3, 8))
+        cells = interface.build_cell_array(conn)
+        self.assertEqual(cells.GetNumberOfCells(), 3)
+        arr = interface.convert_array(cells.GetConnectivityArray())
+        self.assertTrue(np.shares_memory(arr, conn))
+        offsets = interface.convert_array(cells.GetOffsetsArray())
+        self.assertTrue(np.allclose(offsets, [0, 8, 16, 24]))
+
+    def test_mixed(self):
+        """`build_cell_array`: cells of mixed sizes"""
+        cells = interface.build_cell_array([0, 1, 2, 1, 3, 4, 2], offsets=[0, 3, 7])
+        self.assertEqual(cells.GetNumberOfCells(), 2)
+        self.assertEqual(cells.GetCellSize(0), 3)
+        self.assertEqual(cells.GetCellSize(1), 4)
+        with self.assertRaises(_helpers.PVGeoError):
+            interface.build_cell_array([0, 1, 2], offsets=[0, 2])
+        with self.assertRaises(_helpers.PVGeoError):
+            interface.build_cell_array([0, 1, 2])
+
+    def test_lifetime(self):
+        """`build_cell_array`: the cells outlive the arrays they were built from"""
+        cells = interface.build_cell_array(np.arange(8000).reshape((1000, 8)))
+        gc.collect()
+        # Reuse any memory that was freed
+        _ = [np.full(8001, 7, dtype=np.int64) for _ in range(200)]
+        conn = interface.convert_array(cells.GetConnectivityArray())
+        self.assertTrue(np.array_equal(conn, np.arange(8000)))
+        offsets = interface.convert_array(cells.GetOffsetsArray())
+        self.assertTrue(np.array_equal(offsets, np.arange(0, 8001, 8)))
+
+
+class TestPointsToPolyData(TestBase):
+    """
+    Test making ``vtkPolyData`` from arrays of points
+    """
+
+    def test_shared_memory(self):
+        """`points_to_poly_data`: points and attributes are not copied"""
+        points = np.random.rand(100, 3).astype(np.float32)
+        poly = interface.points_to_poly_data(points)
+        self.assertEqual(poly.n_cells, 100)
+        self.assertEqual(poly.points.dtype, np.float32)
+        self.assertTrue(np.shares_memory(poly.points, points))
+        df = pd.DataFrame(
+            {
+                'x': np.random.rand(100),
+                'y': np.random.rand(100),
+                'z': np.random.rand(100),
+                'a': np.random.rand(100),
+            }
+        )
+        poly = interface.points_to_poly_data(df, copy_z=True)
+        self.assertTrue(np.shares_memory(poly['a'], df['a'].values))
+        self.assertTrue(np.allclose(poly.points, df[['x', 'y', 'z']].values))
+        self.assertTrue(np.allclose(poly['Elevation'], df['z']))
+
+    def test_cell_types(self):
+        """`points_to_poly_data`: a poly-vertex or no cells"""
+        points = np.random.rand(100, 4)
+        poly = interface.points_to_poly_data(points, cell_type=vtk.VTK_POLY_VERTEX)
+        self.assertEqual(poly.n_cells, 1)
+        self.assertEqual(poly.GetCell(0).GetNumberOfPoints(), 100)
+        self.assertTrue(np.allclose(poly['Field 0'], points[:, 3]))
+        poly = interface.points_to_poly_data(points, cell_type=None)
+        self.assertEqual(poly.n_cells, 0)
+        self.assertEqual(poly.n_points, 100)
+
+
+class TestDataDict(TestBase):
+    """
+    Test the lazy mapping of a dataset's arrays
+    """
+
+    def test_views(self):
+        """`get_data_dict`: arrays are read only views of the dataset's arrays"""
+        df = pd.DataFrame({'a': np.random.rand(10), 'b': np.arange(10)})
+        table = interface.data_frame_to_table(df)
+        data = interface.get_data_dict(table, field='row')
+        self.assertEqual(len(data), 2)
+        self.assertEqual(sorted(data.keys()), ['a', 'b'])
+        self.assertTrue(np.shares_memory(data['a'], df['a'].values))
+        self.assertIs(data['a'], data['a'])
+        self.assertFalse(data['a'].flags.writeable)
+        self.assertTrue(np.allclose(data['b'], df['b']))
+        self.assertNotIn('c', data)
+        with self.assertRaises(KeyError):
+            _ = data['c']
+
+
+class TestProfiling(TestBase):
+    """
+    Test the profiling hooks on the algorithm base class
+    """
+
+    def _make_filter(self):
+        from PVGeo.filters import ArrayMath
+
+        names = ['x', 'y', 'z']
+        df = pd.DataFrame(data=np.random.rand(100, 3), columns=names)
+        table = interface.data_frame_to_table(df)
+        f = ArrayMath()
+        f.SetInputDataObject(table)
+        f.SetInputArrayToProcess(0, 0, 0, 6, 'x')
+        f.SetInputArrayToProcess(1, 0, 0, 6, 'y')
+        return f
+
+    def test_disabled(self):
+        """`AlgorithmBase`: no statistics are recorded by default"""
+        f = self._make_filter()
+        f.Update()
+        self.assertFalse(f.get_profiling())
+        self.assertEqual(f.get_profile_stats().get_pass_names(), [])
+
+    def test_pass_stats(self):
+        """`AlgorithmBase`: each pipeline pass is timed when profiling"""
+        f = self._make_filter()
+        f.set_profiling(True)
+        f.Update()
+        stats = f.get_profile_stats()
+        for name in ['RequestDataObject', 'RequestInformation', 'RequestData']:
+            self.assertEqual(stats.get_count(name), 1)
+            self.assertTrue(stats.get_wall_time(name) >= 0.0)
+            self.assertTrue(stats.get_cpu_time(name) >= 0.0)
+        self.assertTrue(stats.get_peak_memory('RequestData') > 0)
+        f.Modified()
+        f.Update()
+        self.assertEqual(stats.get_count('RequestData'), 2)
+        stats.reset()
+        self.assertEqual(stats.get_pass_names(), [])
+
+    def test_registry(self):
+        """`ProfileRegistry`: process wide profiling dumps to JSON"""
+        import json
+
+        registry = _helpers.get_profile_registry()
+        registry.clear()
+        _helpers.enable_profiling()
+        try:
+            f = self._make_filter()
+            f.Update()
+        finally:
+            _helpers.disable_profiling()
+        self.assertFalse(_helpers.profiling_enabled())
+        out = json.loads(registry.to_json())
+        self.assertEqual(len(out), 1)
+        self.assertIn('RequestData', out[0]['passes'])
+        self.assertEqual(out[0]['passes']['RequestData']['count'], 1)
+        registry.clear()
+
+
+class TestParseCache(TestBase):
+    """
+    Test the process wide parse cache
+    """
+
+    def setUp(self):
+        TestBase.setUp(self)
+        self.test_dir = tempfile.mkdtemp()
+        self.filename = os.path.join(self.test_dir, 'data.txt')
+        np.savetxt(self.filename, np.arange(10.0))
+        self.calls = 0
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+        TestBase.tearDown(self)
+
+    def _parse(self, filename):
+        self.calls += 1
+        return np.loadtxt(filename)
+
+    def test_hits(self):
+        """`ParseCache`: files are only parsed once and results are copies"""
+        cache = _helpers.ParseCache()
+        a = cache.parse(self._parse, self.filename)
+        a[0] = 100.0
+        b = cache.parse(self._parse, self.filename)
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(b[0], 0.0)
+        self.assertEqual(cache.get_nbytes(), b.nbytes)
+        # Parameters are part of the key
+        cache.parse(self._parse, self.filename, 'other')
+        self.assertEqual(self.calls, 2)
+        self.assertEqual(cache.get_hits(), 1)
+
+    def test_invalidation(self):
+        """`ParseCache`: a modified file is parsed again"""
+        cache = _helpers.ParseCache()
+        cache.parse(self._parse, self.filename)
+        np.savetxt(self.filename, np.arange(20.0))
+        self.assertEqual(len(cache.parse(self._parse, self.filename)), 20)
+        self.assertEqual(self.calls, 2)
+
+    def test_budget(self):
+        """`ParseCache`: the byte budget evicts the least recently used"""
+        cache = _helpers.ParseCache(max_bytes=100)
+        other = os.path.join(self.test_dir, 'other.txt')
+        np.savetxt(other, np.arange(10.0))
+        cache.parse(self._parse, self.filename)
+        cache.parse(self._parse, other)
+        self.assertEqual(len(cache), 1)
+        self.assertLessEqual(cache.get_nbytes(), 100)
+        cache.parse(self._parse, other)
+        self.assertEqual(self.calls, 2)
+        cache.set_max_bytes(0)
+        self.assertEqual(len(cache), 0)
+        cache.parse(self._parse, other)
+        self.assertEqual(self.calls, 3)
+
+    def test_parameter_fingerprint(self):
+        """`parameter_fingerprint`: large arrays are identified, not hashed"""
+
+        class Params(object):
+            pass
+
+        obj = Params()
+        obj.small, obj.large, obj.state = np.zeros(10), np.zeros(10**6), 1
+        key = _helpers.parameter_fingerprint(obj, ignore={'state'})
+        obj.state = 2
+        obj.small = np.zeros(10)
+        self.assertEqual(key, _helpers.parameter_fingerprint(obj, ignore={'state'}))
+        obj.large = np.zeros(10**6)
+        self.assertNotEqual(key, _helpers.parameter_fingerprint(obj, ignore={'state'}))
+        # VTK objects are identified by their modification time
+        obj.selection = vtk.vtkDataArraySelection()
+        key = _helpers.parameter_fingerprint(obj, ignore={'state'})
+        self.assertEqual(key, _helpers.parameter_fingerprint(obj, ignore={'state'}))
+        obj.selection.DisableArray('a')
+        self.assertNotEqual(key, _helpers.parameter_fingerprint(obj, ignore={'state'}))
+        # Anything else cannot be fingerprinted
+        obj.other = object()
+        with self.assertRaises(TypeError):
+            _helpers.parameter_fingerprint(obj, ignore={'state'})
+
+
+class TestExecutors(TestBase):
+    """
+    Test the thread pool helpers
+    """
+
+    def test_map_ordered(self):
+        """`map_ordered`: results keep the order of the items"""
+        import time
+
+        def func(i):
+            time.sleep(0.01 * (5 - i))
+            return i * 2
+
+        self.assertEqual(_helpers.map_ordered(func, range(5), workers=4), [0, 2, 4, 6, 8])
+        self.assertEqual(_helpers.map_ordered(func, range(5), workers=1), [0, 2, 4, 6, 8])
+        self.assertEqual(_helpers.map_ordered(func, []), [])
+
+    def test_map_ordered_error(self):
+        """`map_ordered`: the first error is raised"""
+
+        def func(i):
+            if i >= 2:
+                raise _helpers.PVGeoError('bad item %d' % i)
+            return i
+
+        with self.assertRaisesRegex(_helpers.PVGeoError, 'bad item 2'):
+            _helpers.map_ordered(func, range(8), workers=4)
+
+
+class TestLazyImports(TestBase):
+    """
+    Test the lazy loading of the ``PVGeo`` suites
+    """
+
+    def test_import_is_light(self):
+        """`PVGeo`: importing the package does not load heavy dependencies"""
+        import subprocess
+        import sys
+
+        code = (
+            'import sys, PVGeo; '
+            'print(",".join(m for m in ("vtk", "pandas", "pyvista", "discretize") '
+            'if m in sys.modules))'
+        )
+        out = subprocess.check_output([sys.executable, '-c', code])
+        self.assertEqual(out.decode().strip(), '')
+
+    def test_granular_vtk(self):
+        """`PVGeo`: the suites do not import the monolithic ``vtk`` package"""
+        import subprocess
+        import sys
+
+        code = (
+            'import sys, PVGeo.filters, PVGeo.grids, PVGeo.readers; '
+            'print("vtk" in sys.modules)'
+        )
+        out = subprocess.check_output([sys.executable, '-c', code])
+        self.assertEqual(out.decode().strip(), 'False')
+
+    def test_lazy_names_in_sync(self):
+        """`PVGeo`: lazily loaded names match the ``__all__`` of the modules"""
+        import PVGeo
+        from PVGeo import base, grids
+        from PVGeo.grids import fileio
+
+        names = dir(PVGeo)
+        for mod in (base, interface):
+            for name in mod.__all__:
+                self.assertIn(name, names)
+                self.assertIs(getattr(PVGeo, name), getattr(mod, name))
+        for name in fileio.__all__:
+            self.assertIn(name, dir(grids))
+            self.assertIs(getattr(grids, name), getattr(fileio, name))
+        with self.assertRaises(AttributeError):
+            PVGeo.not_a_suite
+
+    def test_star_imports(self):
+        """`PVGeo`: star imports of the suites export the lazy names"""
+        from PVGeo.grids import fileio
+        from PVGeo.ubc import octree
+
+        for suite, mod in (('grids', fileio), ('ubc', octree)):
+            namespace = {}
+            exec('from PVGeo.%s import *' % suite, namespace)
+            for name in mod.__all__:
+                self.assertIs(namespace[name], getattr(mod, name))
+
 
 ###############################################################################
 ###############################################################################
@@ -1,6 +1,9 @@
+import asyncio
 import os
 import shutil
 import tempfile
+import threading
+import time
 
 from base import TestBase
 import numpy as np
@@ -10,7 +13,15 @@ from vtk.numpy_interface import dataset_adapter as dsa
 from vtk.util import numpy_support as nps
 
 # Functionality to test:
-from PVGeo.readers import DelimitedTextReader, MadagascarReader, PackedBinariesReader, XYZTextReader
+from PVGeo import _helpers, memory
+from PVGeo._helpers import PVGeoError
+from PVGeo.readers import (
+    DelimitedPointsReaderBase,
+    DelimitedTextReader,
+    MadagascarReader,
+    PackedBinariesReader,
+    XYZTextReader,
+)
 
 RTOL = 0.000001
 
@@ -141,6 +152,452 @@ class TestDelimitedTextReader(TestBase):
         self._check_array_values(table)
         return
 
+    def test_header_only_read(self):
+        """`DelimitedTextReader`: only the header lines are read as text"""
+        filename = os.path.join(self.test_dir, 'comments.txt')
+        with open(filename, 'w') as f:
+            f.write('! a comment\n\nskipped\na,b ! titles\n')
+            for i in range(1000):
+                f.write('%d,%d\n' % (i, 2 * i))
+                if i == 500:
+                    f.write('! a comment in the data\n')
+        lines = _helpers.FileLines(filename)
+        self.assertEqual(lines[0], 'skipped')
+        self.assertEqual(lines[1::][0], 'a,b')
+        self.assertEqual(lines[2::].get_offset(), 34)
+        self.assertEqual(len(lines), 1002)
+        reader = DelimitedTextReader(delimiter=',', skiprows=1)
+        table = reader.apply(filename)
+        self.assertEqual(table.n_rows, 1000)
+        self.assertTrue(np.allclose(table['a'], np.arange(1000)))
+        self.assertTrue(np.allclose(table['b'], 2 * np.arange(1000)))
+
+    def test_indented_rows(self):
+        """`DelimitedTextReader`: rows with leading or trailing blanks"""
+        filename = os.path.join(self.test_dir, 'indented.txt')
+        n = 20000  # more than one block of the file is stripped
+        with open(filename, 'w') as f:
+            f.write('a b c\n')
+            for i in range(n):
+                f.write(('  %d %d %d\n', '%d %d %d  \n', '\t%d %d %d\r\n')[i % 3] % (i, 2 * i, 3 * i))
+        for chunksize in (None, 999):
+            reader = DelimitedTextReader(chunksize=chunksize)
+            table = reader.apply(filename)
+            self.assertEqual(table.n_rows, n)
+            for j, name in enumerate('abc'):
+                self.assertEqual(table[name].dtype, np.int64)
+                self.assertTrue(np.array_equal(table[name], (j + 1) * np.arange(n)))
+
+    def test_streaming(self):
+        """`DelimitedTextReader`: stream a file into the output in chunks"""
+        filename = os.path.join(self.test_dir, 'stream.txt')
+        with open(filename, 'w') as f:
+            f.write('x,y,z,a\n')
+            for i in range(250):
+                f.write('%d,%d,%d,%s\n' % (i, 2 * i, 3 * i, 'nan' if i == 120 else i))
+                if i == 60:
+                    f.write('! a comment in the data\n\n')
+        expected = DelimitedTextReader(delimiter=',').apply(filename)
+        reader = DelimitedTextReader(delimiter=',', chunksize=50)
+        table = reader.apply(filename)
+        self.assertEqual(reader.get_chunk_size(), 50)
+        self.assertEqual(table.n_rows, 250)
+        for name in ['x', 'y', 'z', 'a']:
+            self.assertTrue(np.allclose(table[name], expected[name], equal_nan=True))
+        # Nothing is held by the reader
+        self.assertEqual(reader._data, [])
+        # Points are written straight into the points of the output
+        reader = DelimitedPointsReaderBase(delimiter=',', chunksize=50)
+        poly = reader.apply(filename)
+        self.assertEqual(poly.n_points, 250)
+        self.assertTrue(np.allclose(poly.points[:, 1], 2 * np.arange(250)))
+        self.assertTrue(np.allclose(poly['a'], expected['a'], equal_nan=True))
+
+    def test_parallel_segments(self):
+        """`DelimitedTextReader`: parse ranges of a large file in parallel"""
+        filename = os.path.join(self.test_dir, 'segments.txt')
+        with open(filename, 'w') as f:
+            f.write('a,b\n')
+            for i in range(500):
+                f.write('%d,%d\n' % (i, -i))
+                if i % 100 == 0:
+                    f.write('! a comment in the data\n')
+        ranges = _helpers.split_file(filename, start=4, segments=4, min_size=100)
+        self.assertEqual(len(ranges), 4)
+        with open(filename, 'rb') as f:
+            data = f.read()
+        for start, stop in ranges:
+            self.assertEqual(data[start - 1 : start], b'\n')
+        self.assertEqual(ranges[-1][1], len(data))
+        reader = DelimitedTextReader(delimiter=',', workers=4, segment_size=100)
+        table = reader.apply(filename)
+        self.assertEqual(table.n_rows, 500)
+        self.assertTrue(np.allclose(table['a'], np.arange(500)))
+        self.assertTrue(np.allclose(table['b'], -np.arange(500)))
+        # Ranges without rows do not change the types of the columns
+        with open(filename, 'a') as f:
+            f.write('\n' * 5000)
+            f.write('! a comment after the data\n' * 100)
+        table = reader.apply(filename)
+        self.assertEqual(table.n_rows, 500)
+        self.assertEqual(table['a'].dtype, np.int64)
+        self.assertTrue(np.allclose(table['a'], np.arange(500)))
+
+    def test_sidecar_cache(self):
+        """`DelimitedTextReader`: parsed columns are saved to a sidecar"""
+        filename = self._write_series(1)[0]
+        sidecars = _helpers.get_sidecar_cache()
+        sidecars.set_enabled(True)
+        sidecars.set_directory(os.path.join(self.test_dir, 'sidecars'))
+        try:
+            misses, hits = sidecars.get_misses(), sidecars.get_hits()
+            DelimitedTextReader(delimiter=',').apply(filename)
+            self.assertEqual(sidecars.get_misses(), misses + 1)
+            self.assertEqual(len(os.listdir(sidecars.get_directory())), 1)
+            # A new reader loads the sidecar instead of parsing the file
+            table = DelimitedTextReader(delimiter=',').apply(filename)
+            self.assertEqual(sidecars.get_hits(), hits + 1)
+            self.assertEqual(table.n_rows, 2)
+            self.assertEqual(table.GetColumnName(1), 'b')
+            # Other parameters get their own sidecar next to the first
+            reader = DelimitedTextReader(delimiter=',')
+            reader.AddFileName(filename)
+            reader.set_selected_columns(['a'])
+            reader.Update()
+            reader.set_selected_columns(None)
+            reader.Update()
+            self.assertEqual(sidecars.get_misses(), misses + 2)
+            self.assertEqual(sidecars.get_hits(), hits + 2)
+            self.assertEqual(len(os.listdir(sidecars.get_directory())), 2)
+            # A changed file is parsed again and replaces the old sidecars
+            with open(filename, 'w') as f:
+                f.write('a,b\n7,7\n')
+            os.utime(filename, ns=(0, 10**9))
+            table = DelimitedTextReader(delimiter=',').apply(filename)
+            self.assertEqual(sidecars.get_misses(), misses + 3)
+            self.assertEqual(table['a'][0], 7)
+            self.assertEqual(len(os.listdir(sidecars.get_directory())), 1)
+        finally:
+            sidecars.set_enabled(False)
+            sidecars.set_directory(None)
+
+    def test_column_selection(self):
+        """`DelimitedTextReader`: only the selected columns are read"""
+        filename = os.path.join(self.test_dir, 'columns.txt')
+        with open(filename, 'w') as f:
+            f.write('x,y,z,a,b,c\n')
+            for i in range(10):
+                f.write(','.join(['%d' % (i + j) for j in range(6)]) + '\n')
+        reader = DelimitedTextReader(delimiter=',')
+        reader.AddFileName(filename)
+        selection = reader.GetDataSelection()
+        self.assertEqual(selection.GetNumberOfArrays(), 6)
+        selection.DisableArray('a')
+        selection.DisableArray('c')
+        reader.Update()
+        table = reader.GetOutput()
+        names = [table.GetColumnName(i) for i in range(table.GetNumberOfColumns())]
+        self.assertEqual(names, ['x', 'y', 'z', 'b'])
+        self.assertTrue(np.allclose(dsa.WrapDataObject(table).RowData['b'], np.arange(10) + 4))
+        # Selecting a column again reads it
+        reader.set_selected_columns(None)
+        reader.Update()
+        self.assertEqual(reader.GetOutput().GetNumberOfColumns(), 6)
+        # The coordinates of points are always read
+        reader = DelimitedPointsReaderBase(delimiter=',', chunksize=4)
+        reader.AddFileName(filename)
+        reader.set_selected_columns(['c'])
+        reader.Update()
+        poly = reader.GetOutput()
+        self.assertEqual(poly.GetNumberOfPoints(), 10)
+        self.assertEqual(poly.GetPointData().GetNumberOfArrays(), 1)
+        self.assertEqual(poly.GetPointData().GetArrayName(0), 'c')
+
+    def test_decimation(self):
+        """`DelimitedPointsReaderBase`: decimate the points while parsing"""
+        filename = os.path.join(self.test_dir, 'decimate.txt')
+        with open(filename, 'w') as f:
+            f.write('x,y,z,v\n')
+            for i in range(100):
+                f.write('%d,%d,0,%d\n' % (i % 10, i // 10, i))
+
+        def read(chunksize=7, **kwargs):
+            reader = DelimitedPointsReaderBase(delimiter=',', chunksize=chunksize, **kwargs)
+            reader.AddFileName(filename)
+            reader.Update()
+            # The whole file is never held
+            self.assertEqual(reader._data, [])
+            return dsa.WrapDataObject(reader.GetOutput())
+
+        # Every Nth row across chunk boundaries
+        poly = read(every_nth=3)
+        self.assertTrue(np.allclose(read(None, every_nth=3).PointData['v'], poly.PointData['v']))
+        self.assertTrue(np.allclose(poly.PointData['v'], np.arange(0, 100, 3)))
+        self.assertTrue(np.allclose(poly.Points[:, 0], np.arange(0, 100, 3) % 10))
+        # A seeded random sample is the same on every read
+        a = read(sample_fraction=0.3, seed=42).PointData['v']
+        b = read(chunksize=None, sample_fraction=0.3, seed=42).PointData['v']
+        self.assertTrue(0 < len(a) < 100)
+        self.assertTrue(np.allclose(a, b))
+        # One point for each cell of a 5 by 5 grid
+        poly = read(spatial_stride=5)
+        self.assertEqual(len(poly.Points), 4)
+        self.assertTrue(np.allclose(poly.PointData['v'], [0, 5, 50, 55]))
+        with self.assertRaises(_helpers.PVGeoError):
+            DelimitedPointsReaderBase(delimiter=',').set_every_nth(0)
+
+    def _write_series(self, n):
+        filenames = []
+        for i in range(n):
+            filename = os.path.join(self.test_dir, 'series%d.txt' % i)
+            with open(filename, 'w') as f:
+                f.write('a,b\n%d,%d\n%d,%d\n' % (i, i, i, i))
+            filenames.append(filename)
+        return filenames
+
+    def test_lazy_time_series(self):
+        """`DelimitedTextReader`: read time steps on demand"""
+        filenames = self._write_series(6)
+        reads = []
+        threads = set()
+
+        class CountingReader(DelimitedTextReader):
+            def _read_time_step(self, idx):
+                reads.append(idx)
+                return DelimitedTextReader._read_time_step(self, idx)
+
+            def _set_titles(self, titles):
+                threads.add(threading.get_ident())
+                return DelimitedTextReader._set_titles(self, titles)
+
+        reader = CountingReader(delimiter=',', lazy=True, cache_size=2)
+        reader.AddFileName(filenames)
+        reader.Update()
+        self.assertEqual(reads, [0])
+        tsteps = reader.get_time_step_values()
+        self.assertEqual(len(tsteps), 6)
+        for i in [3, 4, 3]:
+            reader.UpdateTimeStep(tsteps[i])
+            table = reader.GetOutput()
+            self.assertEqual(table.GetColumnName(0), 'a')
+            self.assertEqual(dsa.WrapDataObject(table).RowData['a'][0], i)
+        # time step 3 is still held in memory
+        self.assertEqual(reads, [0, 3, 4])
+        # Fall out of the cache
+        reader.UpdateTimeStep(tsteps[5])
+        reader.UpdateTimeStep(tsteps[0])
+        self.assertEqual(reads, [0, 3, 4, 5, 0])
+        # Prefetch neighbors
+        reader.set_prefetch(True)
+        reader.UpdateTimeStep(tsteps[1])
+        reader.UpdateTimeStep(tsteps[2])
+        table = reader.GetOutput()
+        self.assertEqual(dsa.WrapDataObject(table).RowData['b'][1], 2)
+        self.assertEqual(sorted(set(reads)), list(range(6)))
+        # The titles are only ever set on this thread
+        self.assertEqual(threads, {threading.get_ident()})
+
+    def test_prefetch_cleanup(self):
+        """`DelimitedTextReader`: prefetching does not hold failures or threads"""
+        filenames = self._write_series(4)
+
+        class FailingReader(DelimitedTextReader):
+            def _read_time_step(self, idx):
+                if idx == 2:
+                    raise _helpers.PVGeoError('A bad file')
+                return DelimitedTextReader._read_time_step(self, idx)
+
+        reader = FailingReader(delimiter=',', lazy=True, prefetch=True)
+        reader.AddFileName(filenames)
+        reader.Update()
+        tsteps = reader.get_time_step_values()
+        reader.UpdateTimeStep(tsteps[1])
+        executor = reader._ReaderBase__executor
+        self.assertIsNotNone(executor)
+        # Wait for the neighbors to be prefetched
+        for _ in range(100):
+            if not reader._ReaderBase__pending:
+                break
+            time.sleep(0.05)
+        # The failed time step is not held
+        self.assertEqual(reader._ReaderBase__pending, {})
+        # The background thread is shut down when prefetching is turned off
+        reader.set_prefetch(False)
+        self.assertIsNone(reader._ReaderBase__executor)
+        self.assertTrue(executor._shutdown)
+
+    def test_parallel_time_series(self):
+        """`DelimitedTextReader`: parse a series on many threads"""
+        filenames = self._write_series(8)
+        reader = DelimitedTextReader(delimiter=',', workers=4)
+        reader.AddFileName(filenames)
+        reader.Update()
+        self.assertEqual(reader.get_workers(), 4)
+        for i, t in enumerate(reader.get_time_step_values()):
+            reader.UpdateTimeStep(t)
+            self.assertEqual(dsa.WrapDataObject(reader.GetOutput()).RowData['a'][0], i)
+        # A missing file still raises a ``PVGeoError``
+        reader = DelimitedTextReader(delimiter=',', workers=4)
+        reader.AddFileName(filenames + [os.path.join(self.test_dir, 'missing.txt')])
+        with self.assertRaises(PVGeoError):
+            reader._get_file_contents()
+
+    def test_apply_many(self):
+        """`DelimitedTextReader`: read many files in a pool of processes"""
+        filenames = self._write_series(3)
+        outputs = DelimitedTextReader.apply_many(filenames, workers=2, delimiter=',')
+        self.assertEqual(len(outputs), 3)
+        for i, table in enumerate(outputs):
+            self.assertEqual(table.GetColumnName(0), 'a')
+            self.assertEqual(dsa.WrapDataObject(table).RowData['a'][0], i)
+        # Errors in a worker are raised in the caller
+        with self.assertRaises(PVGeoError):
+            DelimitedTextReader.apply_many(
+                [filenames[0], os.path.join(self.test_dir, 'missing.txt')], workers=2
+            )
+
+    def test_apply_async(self):
+        """`DelimitedTextReader`: read without blocking an event loop"""
+        filenames = self._write_series(4)
+
+        async def read_all():
+            readers = [DelimitedTextReader(delimiter=',') for _ in range(2)]
+            return await asyncio.gather(
+                readers[0].apply_async(filenames[:2]), readers[1].apply_async(filenames[2:])
+            )
+
+        outputs = asyncio.run(read_all())
+        self.assertEqual(outputs[0].n_rows, 2)
+        self.assertEqual(dsa.WrapDataObject(outputs[1]).RowData['a'][0], 2)
+
+    def test_cancel_apply_async(self):
+        """`DelimitedTextReader`: cancelling a read stops at the next file"""
+        filenames = self._write_series(4)
+        hold = [True]
+
+        class BlockingReader(DelimitedTextReader):
+            def _extract_header(self, content):
+                # Hold the read until it has been aborted
+                start = time.time()
+                while hold[0] and not self.GetAbortExecute() and time.time() - start < 5:
+                    time.sleep(0.01)
+                return DelimitedTextReader._extract_header(self, content)
+
+        reader = BlockingReader(delimiter=',')
+
+        async def cancel_read():
+            task = asyncio.ensure_future(reader.apply_async(filenames))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(cancel_read())
+        # Nothing was read
+        self.assertTrue(reader.need_to_read())
+        self.assertEqual(reader.GetOutputDataObject(0).GetNumberOfRows(), 0)
+        self.assertFalse(reader.GetAbortExecute())
+        # The reader can still be used
+        hold[0] = False
+        reader.error_occurred()
+        output = reader.apply(filenames)
+        self.assertFalse(reader.error_occurred())
+        self.assertEqual(len(reader.get_time_step_values()), 4)
+        self.assertEqual(output.n_rows, 2)
+
+    def test_memory_budget(self):
+        """`DelimitedTextReader`: caches are released to meet a memory budget"""
+        filenames = self._write_series(4)
+        first = DelimitedTextReader(delimiter=',')
+        first.apply(filenames[:2])
+        second = DelimitedTextReader(delimiter=',')
+        second.apply(filenames[2:])
+        self.assertGreater(first.get_memory_usage(), 0)
+        self.assertIn('DelimitedTextReader (%d)' % id(first), memory.report())
+        try:
+            # Only the most recently used reader fits
+            memory.set_budget(second.get_memory_usage())
+            self.assertEqual(first.get_memory_usage(), 0)
+            self.assertGreater(second.get_memory_usage(), 0)
+            self.assertTrue(first.need_to_read())
+            # The released reader reads its files again on demand
+            first.UpdateTimeStep(first.get_time_step_values()[1])
+            self.assertEqual(dsa.WrapDataObject(first.GetOutput()).RowData['a'][0], 1)
+            self.assertEqual(second.get_memory_usage(), 0)
+        finally:
+            memory.set_budget(None)
+
+    def test_memoize(self):
+        """`DelimitedTextReader`: the state set while reading does not miss the memo"""
+        filenames = self._write_series(1)
+        runs = []
+
+        class CountingReader(DelimitedTextReader):
+            def RequestData(self, request, inInfo, outInfo):
+                runs.append(1)
+                return DelimitedTextReader.RequestData(self, request, inInfo, outInfo)
+
+        reader = CountingReader(delimiter=',', memoize=True)
+        reader.AddFileName(filenames[0])
+        for _ in range(3):
+            reader.Modified()
+            reader.Update()
+        self.assertEqual(len(runs), 1)
+        reader.set_selected_columns(['a'])
+        reader.Update()
+        self.assertEqual(len(runs), 2)
+        self.assertEqual(reader.GetOutput().GetNumberOfColumns(), 1)
+
+    def test_incremental_read(self):
+        """`DelimitedTextReader`: only new or changed files are parsed again"""
+        filenames = self._write_series(4)
+        reads = []
+
+        class CountingReader(DelimitedTextReader):
+            def _extract_header(self, content):
+                reads.append(len(content))
+                return DelimitedTextReader._extract_header(self, content)
+
+        reader = CountingReader(delimiter=',', checksum=True)
+        reader.AddFileName(filenames[:3])
+        reader.Update()
+        self.assertEqual(len(reads), 3)
+        # Appending a file only parses that file
+        reader.AddFileName(filenames[3])
+        reader.Update()
+        self.assertEqual(len(reads), 4)
+        self.assertEqual(len(reader.get_time_step_values()), 4)
+        # A file modified on disk is parsed again on refresh
+        with open(filenames[1], 'w') as f:
+            f.write('a,b\n%d,%d\n' % (10, 10))
+        reader.refresh()
+        reader.Update()
+        self.assertEqual(len(reads), 5)
+        reader.UpdateTimeStep(reader.get_time_step_values()[1])
+        self.assertEqual(dsa.WrapDataObject(reader.GetOutput()).RowData['a'][0], 10)
+        # Changing a read parameter parses everything again
+        reader.set_skip_rows(0)
+        reader.set_comments('#')
+        reader.Update()
+        self.assertEqual(len(reads), 9)
+        # Titles that vary from the files already read are caught
+        with open(filenames[2], 'w') as f:
+            f.write('c,d\n1,1\n')
+        reader.refresh()
+        reader.Update()
+        self.assertTrue(reader.error_occurred())
+
+    def test_lazy_varied_titles(self):
+        """`DelimitedTextReader`: lazy read catches varied titles"""
+        filenames = self._write_series(2)
+        with open(filenames[1], 'w') as f:
+            f.write('c,d\n1,1\n')
+        reader = DelimitedTextReader(delimiter=',', lazy=True)
+        reader.AddFileName(filenames)
+        reader.Update()
+        reader.UpdateTimeStep(reader.get_time_step_values()[1])
+        self.assertTrue(reader.error_occurred())
+
 
 ###############################################################################
 
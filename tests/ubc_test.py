@@ -5,6 +5,7 @@ import warnings
 
 from base import TestBase
 import numpy as np
+import vtk
 from vtk.numpy_interface import dataset_adapter as dsa
 
 # VTK imports:
@@ -178,6 +179,42 @@ class Test3DTensorMesh(ubcMeshTesterBase):
         self.assertEqual(output.GetCellData().GetNumberOfArrays(), 2)
         self.assertEqual(output.GetCellData().GetArrayName(1), 'appended')
 
+    def test_sub_extent(self):
+        """`TensorMeshReader` 3D: only build the requested extent"""
+        reader = TensorMeshReader()
+        reader.set_mesh_filename(self.meshname)
+        reader.add_model_file_name(self.modname)
+        ext = (2, 10, 3, 12, 5, 20)
+        reader.UpdateExtent(ext)
+        grid = reader.GetOutputDataObject(0)
+        self.assertEqual(grid.GetExtent(), ext)
+        full = vtk.vtkRectilinearGrid()
+        full.DeepCopy(self.GRID)
+        full.Crop(ext)
+        self.assertEqual(grid.GetBounds(), full.GetBounds())
+        arr = nps.vtk_to_numpy(grid.GetCellData().GetArray(0))
+        self.assertEqual(len(arr), 8 * 9 * 15)
+        self.assertTrue(
+            np.allclose(arr, nps.vtk_to_numpy(full.GetCellData().GetArray(0)), rtol=RTOL)
+        )
+
+    def test_shared_parse_cache(self):
+        """`TensorMeshAppender` 3D: Model files parsed by a reader are reused"""
+        cache = PVGeo._helpers.get_parse_cache()
+        # The process wide cache is on by default with a modest budget
+        self.assertEqual(cache.get_max_bytes(), 64 * 1024**2)
+        reader = TensorMeshReader()
+        reader.set_mesh_filename(self.meshname)
+        reader.add_model_file_name(self.modname)
+        reader.Update()
+        hits = cache.get_hits()
+        f = TensorMeshAppender()
+        f.SetInputDataObject(self.GRID)
+        f.add_model_file_name(self.modname)
+        f.Update()
+        self.assertEqual(cache.get_hits(), hits + 1)
+        self._check_data(f.GetOutput(), self.data)
+
     def test_topo_appender(self):
         """`TopoMeshAppender` 3D:Test topography appender"""
         indices = np.array(